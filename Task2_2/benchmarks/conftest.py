@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from stand_in import StandInServer
+from utils.dashboard_scaling import DashboardScaling
+from utils.flow_benchmark import FlowBenchmark
+
+BENCHMARKS_DIR = os.path.dirname(__file__)
+BASELINES_DIR = os.path.join(BENCHMARKS_DIR, 'baselines')
+PAGES_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), 'pages')
+
+
+@pytest.fixture(scope="session")
+def stand_in():
+    """Бенчмарк всегда идет на локальной заглушке, независимо от --stand-in"""
+    server = StandInServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def flow_benchmark(request):
+    config = request.config
+    baseline_path = config.getoption("--benchmark-baseline") or FlowBenchmark.latest_baseline(BASELINES_DIR)
+    benchmark = FlowBenchmark(
+        PAGES_DIR,
+        rounds=config.getoption("--benchmark-rounds"),
+        tolerance=config.getoption("--benchmark-tolerance"),
+        baseline_path=baseline_path,
+        recording=config.getoption("--benchmark-save"),
+    )
+    # В репозитории нет baseline: он зависит от машины и браузера, первый прогон его сохраняет
+    if benchmark.baseline is None and not benchmark.recording:
+        pytest.skip(f"Нет baseline в {BASELINES_DIR}: сохраните его один раз с --benchmark-save")
+    yield benchmark
+    if config.getoption("--benchmark-save") and benchmark.results:
+        benchmark.save(BASELINES_DIR)
+
+
+def pytest_generate_tests(metafunc):
+    if "task_count" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("--scaling-sizes").split(",") if size.strip()]
+        metafunc.parametrize("task_count", sizes)
+
+
+@pytest.fixture(scope="session")
+def dashboard_scaling(request):
+    config = request.config
+    scaling = DashboardScaling(rounds=config.getoption("--scaling-rounds"))
+    yield scaling
+    if config.getoption("--scaling-report") and scaling.results:
+        scaling.write(config.getoption("--scaling-report"))
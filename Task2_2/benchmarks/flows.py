@@ -0,0 +1,75 @@
+"""
+Сценарии для бенчмарка производительности, повторяющие тесты из tests/.
+Шаги должны совпадать с тестами: бенчмарк замеряет тот путь, который оптимизируется.
+"""
+from pages.dashboard_page import DashboardPage
+
+EDIT_TASK = {
+    'title': "Бенчмарк_редактирование",
+    'description': "Описание",
+    'boardId': 1,
+    'assigneeId': 1,
+    'priority': 'Low',
+}
+
+
+class CreateAllFieldsFlow:
+    """test_create_task_with_all_fields_success"""
+
+    def setup(self, stand_in):
+        pass
+
+    def run(self, driver, base_url):
+        driver.get(base_url)
+        dashboard = DashboardPage(driver)
+        create_task_page = dashboard.click_create_task_button()
+        create_task_page.fill_title("Бенчмарк_создание") \
+                        .fill_description("Описание") \
+                        .select_project('1') \
+                        .select_priority('Medium') \
+                        .select_assignee('1')
+        form_data = create_task_page.get_form_data()
+        dashboard = create_task_page.submit_form()
+        dashboard.verify_task_created(form_data)
+        dashboard.wait_for_network_idle()
+
+
+class CreateMissingFieldFlow:
+    """test_create_button_disabled_when_required_field_missing[assignee]"""
+
+    def setup(self, stand_in):
+        pass
+
+    def run(self, driver, base_url):
+        driver.get(base_url)
+        dashboard = DashboardPage(driver)
+        create_task_page = dashboard.click_create_task_button()
+        create_task_page.fill_title("Тестовая задача") \
+                        .fill_description("Описание") \
+                        .select_project('3') \
+                        .select_priority('Low')
+        create_task_page.is_create_button_disabled()
+        create_task_page.wait_for_network_idle()
+
+
+class EditStatusPriorityFlow:
+    """test_edit_task_priority_and_status"""
+
+    def setup(self, stand_in):
+        stand_in.store.create(dict(EDIT_TASK))
+
+    def run(self, driver, base_url):
+        driver.get(base_url)
+        dashboard = DashboardPage(driver)
+        edit_task_page = dashboard.open_edit_task_form()
+        edit_task_page.select_priority('High') \
+                      .select_status('InProgress')
+        dashboard = edit_task_page.update_form()
+        dashboard.wait_for_network_idle()
+
+
+FLOWS = {
+    'create_all_fields': CreateAllFieldsFlow(),
+    'create_missing_field': CreateMissingFieldFlow(),
+    'edit_status_priority': EditStatusPriorityFlow(),
+}
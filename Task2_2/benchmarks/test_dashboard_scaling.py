@@ -0,0 +1,14 @@
+"""
+Замеры хелперов DashboardPage на больших досках локальной заглушки
+"""
+import pytest
+from utils.dashboard_scaling import RENDER_MODES
+
+
+@pytest.mark.parametrize("render_mode", RENDER_MODES)
+def test_dashboard_scaling(render_mode, task_count, dashboard_scaling, driver, driver_pool, stand_in, base_url):
+    """
+    Поиск, чтение и проверка карточки на доске из task_count задач; поиск не запрашивает все карточки
+    """
+    result = dashboard_scaling.run(render_mode, task_count, driver, stand_in, base_url, driver_pool.reset_state)
+    dashboard_scaling.check(result)
@@ -0,0 +1,14 @@
+"""
+Бенчмарк производительности основных сценариев на локальной заглушке
+"""
+import pytest
+from flows import FLOWS
+
+
+@pytest.mark.parametrize("flow_name", list(FLOWS))
+def test_flow_performance(flow_name, flow_benchmark, driver, driver_pool, stand_in, base_url):
+    """
+    Время, команды WebDriver и сетевые запросы сценария не хуже baseline
+    """
+    result = flow_benchmark.run(flow_name, FLOWS[flow_name], driver, stand_in, base_url, driver_pool.reset_state)
+    flow_benchmark.check(result)
@@ -2,11 +2,31 @@ import pytest
 import os
 import random
 import subprocess
+import tempfile
 import logging
-from seleniumwire import webdriver
+import requests
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.api_client import TaskApiClient
+from utils.asset_cache import AssetCache, DEFAULT_ASSET_CACHE_DIR
+from utils.browser_profiles import BROWSER_PROFILES, ProfileTemplate, get_browser_profile
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import ChromeDriverResolver, DEFAULT_CACHE_DIR
+from utils.command_profiler import CommandProfilerPlugin
+from utils.failure_artifacts import FailureArtifactsPlugin
+from utils.failure_log import LOG_MODES, FailureLogPlugin
+from utils.locator_benchmark import LocatorBenchmark
+from utils.network_backends import NETWORK_BACKENDS, get_network_backend
+from utils.network_capture import CaptureConfig, CaptureIndex
+from utils.network_cassette import NETWORK_MODES, Cassette, cassette_path
+from utils.resource_blocking import DEFAULT_RESOURCE_POLICY
+from utils.scenario_batch import ScenarioBatcher
+from utils.task_registry import CreatedTaskRegistry
+from pages import BasePage, CreateTaskPage, DashboardPage
+from pages.locators import collect_locators
+from stand_in import StandInServer
 
 logging.getLogger('seleniumwire').setLevel(logging.WARNING)
 logging.getLogger('seleniumwire.handler').setLevel(logging.WARNING)
@@ -14,25 +34,74 @@ logging.getLogger('WDM').setLevel(logging.WARNING)
 os.environ['WDM_LOG_LEVEL'] = '0'
 
 
+@pytest.fixture(scope="session")
+def api_client(api_url):
+    client = TaskApiClient(api_url)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def created_tasks(request, api_client):
+    """
+    Реестр задач, созданных за сессию через UI и API.
+    В конце сессии задачи удаляются массово, если не передан --keep-tasks.
+    """
+    registry = CreatedTaskRegistry()
+    CreateTaskPage.task_registry = registry
+    yield registry
+    CreateTaskPage.task_registry = None
+
+    config = request.config
+    if config.getoption("--keep-tasks") or config.getoption("--network-mode") == "replay":
+        return
+    try:
+        registry.cleanup(api_client)
+    except (requests.RequestException, AssertionError) as e:
+        logging.getLogger(__name__).warning(f"Не удалось удалить задачи сессии {registry.ids()}: {e}")
+
+
 @pytest.fixture(scope="function")
-def created_task(browser):
-    from pages.dashboard_page import DashboardPage
-    
-    random_number = random.randint(1, 9999)
-    task_title = f"Тест_{random_number}"
-    
-    dashboard = DashboardPage(browser)
-    create_task_page = dashboard.click_create_task_button()
-    
-    create_task_page.fill_title(task_title) \
-                    .fill_description("Описание") \
-                    .select_project('1') \
-                    .select_assignee('1') \
-                    .select_priority('Low')
-    
-    create_task_page.click_create_button()
-    create_task_page.check_modal_create_close()
-    return task_title
+def seed_tasks(api_client, cassette, created_tasks):
+    """
+    Массовое создание задач через API.
+    Возвращает функцию, принимающую количество задач и префикс названия.
+    При воспроизведении кассеты задачи не создаются, возвращаются записанные названия.
+    """
+    def seed(count, title_prefix="Тест"):
+        if cassette is not None and cassette.mode == 'replay':
+            return cassette.next_seed()
+        tasks = [
+            {
+                'title': f"{title_prefix}_{random.randint(1, 9999)}",
+                'description': "Описание",
+                'board_id': 1,
+                'assignee_id': 1,
+                'priority': 'Low',
+            }
+            for _ in range(count)
+        ]
+        for created in api_client.create_tasks(tasks):
+            if isinstance(created, dict) and created.get('id') is not None:
+                created_tasks.add(created['id'])
+        titles = [task['title'] for task in tasks]
+        if cassette is not None:
+            cassette.add_seed(titles)
+        return titles
+
+    return seed
+
+
+@pytest.fixture(scope="function")
+def created_task(seed_tasks, browser):
+    """
+    Задача-предусловие, созданная через API.
+    Дашборд открывается раньше создания задачи, поэтому после него страница перезагружается
+    и задача уже есть в списке - порядок фикстур в тесте не важен.
+    """
+    title = seed_tasks(1)[0]
+    browser.refresh()
+    return title
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -47,6 +116,320 @@ def pytest_addoption(parser):
         default="https://avito-tech-internship-psi.vercel.app",
         help="Базовый URL для тестирования"
     )
+    parser.addoption(
+        "--api-url",
+        action="store",
+        default="https://avito-tech-internship-production.up.railway.app",
+        help="URL бэкенда для подготовки данных через API"
+    )
+    parser.addoption(
+        "--stand-in",
+        action="store_true",
+        default=False,
+        help="Поднять локальную заглушку фронтенда и бэкенда вместо --base-url и --api-url"
+    )
+    parser.addoption(
+        "--driver-recycle-after",
+        action="store",
+        type=int,
+        default=25,
+        help="Через сколько тестов пересоздавать браузер из пула (1 - новый браузер на каждый тест)"
+    )
+    parser.addoption(
+        "--driver-dir",
+        action="store",
+        default=os.environ.get('CHROMEDRIVER_DIR'),
+        help="Каталог с заранее скачанным chromedriver (работа без сети)"
+    )
+    parser.addoption(
+        "--network-backend",
+        action="store",
+        default="cdp",
+        choices=sorted(NETWORK_BACKENDS),
+        help="Способ наблюдения за сетью: cdp (события DevTools, без прокси) или seleniumwire (MITM прокси)"
+    )
+    parser.addoption(
+        "--proxy-base-port",
+        action="store",
+        type=int,
+        default=0,
+        help="Базовый порт прокси selenium-wire, воркер gwN использует порт base + N (0 - свободный порт)"
+    )
+    parser.addoption(
+        "--chrome-binary",
+        action="store",
+        default=os.environ.get('CHROME_BINARY'),
+        help="Путь к бинарнику Chrome"
+    )
+    parser.addoption(
+        "--block-resources",
+        action="store_true",
+        default=False,
+        help="Блокировать ресурсы, не нужные проверкам (картинки, шрифты, медиа, аналитика), "
+             "по правилам фикстуры resource_policy"
+    )
+    parser.addoption(
+        "--network-mode",
+        action="store",
+        default="live",
+        choices=NETWORK_MODES,
+        help="Работа с API: live (живой бэкенд), record (записывать кассеты тестов) "
+             "или replay (отвечать из кассет без бэкенда), record и replay только с --network-backend=seleniumwire"
+    )
+    parser.addoption(
+        "--cassette-dir",
+        action="store",
+        default=os.path.join(os.path.dirname(__file__), "tests", "cassettes"),
+        metavar="PATH",
+        help="Каталог кассет API для --network-mode"
+    )
+    parser.addoption(
+        "--keep-tasks",
+        action="store_true",
+        default=False,
+        help="Не удалять задачи, созданные за сессию"
+    )
+    parser.addoption(
+        "--batch-scenarios",
+        action="store_true",
+        default=False,
+        help="Прогонять параметризованные случаи одного теста подряд в одной странице "
+             "с легким сбросом приложения вместо перезагрузки"
+    )
+    parser.addoption(
+        "--asset-cache",
+        action="store_true",
+        default=False,
+        help="Отдавать статику фронтенда (JS/CSS чанки, шрифты, картинки) из общего дискового кэша "
+             "(только --network-backend=seleniumwire)"
+    )
+    parser.addoption(
+        "--asset-cache-dir",
+        action="store",
+        default=os.environ.get('ASSET_CACHE_DIR', DEFAULT_ASSET_CACHE_DIR),
+        metavar="PATH",
+        help="Каталог кэша статики, общий для воркеров и запусков"
+    )
+    parser.addoption(
+        "--asset-cache-size",
+        action="store",
+        type=int,
+        default=512,
+        help="Максимальный размер кэша статики в МБ"
+    )
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default="default",
+        choices=sorted(BROWSER_PROFILES),
+        help="Профиль запуска Chrome: default или fast (headless=new, eager загрузка, без фоновых сервисов, "
+             "запуск из прогретого шаблона профиля)"
+    )
+    parser.addoption(
+        "--log-mode",
+        action="store",
+        default="live",
+        choices=LOG_MODES,
+        help="Лог действий page objects: live (сразу в вывод) или failures (фоновая запись в буфер теста, "
+             "в отчет попадает только у упавших тестов)"
+    )
+    parser.addoption(
+        "--log-buffer-size",
+        action="store",
+        type=int,
+        default=1000,
+        help="Сколько последних записей лога page objects хранить на тест в режиме --log-mode=failures"
+    )
+    parser.addoption(
+        "--failure-artifacts",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Сохранять для упавших тестов скриншот, DOM и перехваченные обмены в PATH/<модуль>/<тест> "
+             "(кодирование и сжатие в фоновых потоках)"
+    )
+    parser.addoption(
+        "--locator-benchmark",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Замерять стратегии локаторов на живом DOM и сохранить отчет в JSON "
+             "(воркер gwN пишет в PATH с суффиксом .gwN)"
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Профилировать команды WebDriver по методам page objects: JSON отчет в PATH "
+             "и folded stacks для flamegraph рядом (воркер gwN пишет с суффиксом .gwN)"
+    )
+    parser.addoption(
+        "--benchmark-rounds",
+        action="store",
+        type=int,
+        default=5,
+        help="Количество замеряемых прогонов каждого сценария в Task2_2/benchmarks"
+    )
+    parser.addoption(
+        "--benchmark-tolerance",
+        action="store",
+        type=float,
+        default=0.2,
+        help="Допустимое относительное ухудшение сценария относительно baseline"
+    )
+    parser.addoption(
+        "--benchmark-baseline",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Baseline для сравнения (по умолчанию последний файл Task2_2/benchmarks/baselines)"
+    )
+    parser.addoption(
+        "--benchmark-save",
+        action="store_true",
+        default=False,
+        help="Сохранить результаты бенчмарка как новый baseline"
+    )
+    parser.addoption(
+        "--scaling-sizes",
+        action="store",
+        default="1000,5000,10000",
+        help="Количество задач на доске для замеров масштабирования дашборда, через запятую"
+    )
+    parser.addoption(
+        "--scaling-rounds",
+        action="store",
+        type=int,
+        default=3,
+        help="Количество прогонов каждого замера масштабирования"
+    )
+    parser.addoption(
+        "--scaling-report",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Сохранить результаты замеров масштабирования дашборда в JSON"
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--asset-cache") and config.getoption("--network-backend") != "seleniumwire":
+        raise pytest.UsageError("--asset-cache работает только с --network-backend=seleniumwire")
+    if config.getoption("--network-mode") != "live" and config.getoption("--network-backend") != "seleniumwire":
+        raise pytest.UsageError("--network-mode=record и replay работают только с --network-backend=seleniumwire")
+    if config.getoption("--batch-scenarios"):
+        if config.getoption("--network-mode") != "live":
+            raise pytest.UsageError("--batch-scenarios нельзя совмещать с кассетами: записанные обмены "
+                                    "зависят от того, перезагружалась ли страница")
+        config._scenario_batcher = ScenarioBatcher()
+    if config.getoption("--log-mode") == "failures":
+        config.pluginmanager.register(
+            FailureLogPlugin(capacity=config.getoption("--log-buffer-size")),
+            FailureLogPlugin.NAME
+        )
+    if config.getoption("--failure-artifacts"):
+        config.pluginmanager.register(
+            FailureArtifactsPlugin(config.getoption("--failure-artifacts")),
+            FailureArtifactsPlugin.NAME
+        )
+    if config.getoption("--locator-benchmark"):
+        BasePage.locator_benchmark = LocatorBenchmark()
+    if config.getoption("--profile-commands"):
+        config.pluginmanager.register(
+            CommandProfilerPlugin(
+                config.getoption("--profile-commands"),
+                classes=(BasePage, CreateTaskPage, DashboardPage),
+                waits=((WebDriverWait, ('until', 'until_not')), (CaptureIndex, ('wait_for',)))
+            ),
+            CommandProfilerPlugin.NAME
+        )
+
+
+def pytest_collection_modifyitems(config, items):
+    batcher = getattr(config, '_scenario_batcher', None)
+    if batcher is not None:
+        items[:] = batcher.plan(items)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Результат фазы теста доступен фикстурам как item.rep_setup / rep_call / rep_teardown"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+def pytest_sessionfinish(session):
+    """Сохранение отчета бенчмарка локаторов"""
+    path = session.config.getoption("--locator-benchmark")
+    benchmark = BasePage.locator_benchmark
+    if not path or benchmark is None:
+        return
+
+    report = benchmark.report()
+    if not report:
+        return
+    worker = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{worker}{ext}"
+    benchmark.write(path)
+    session.config._locator_benchmark_report = (path, report)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Локаторы, у которых быстрее всего работает не первая объявленная стратегия"""
+    path, report = getattr(config, '_locator_benchmark_report', (None, None))
+    if not report:
+        return
+
+    terminalreporter.section("locator benchmark")
+    for name, result in report.items():
+        fastest = result['fastest_unique']
+        if fastest is None:
+            terminalreporter.write_line(f"{name}: нет стратегии с единственным совпадением")
+        elif not result['declared_first_is_fastest']:
+            terminalreporter.write_line(f"{name}: быстрее всего {fastest['by']} {fastest['value']}")
+    not_measured = [name for name in collect_locators(CreateTaskPage, DashboardPage)
+                    if not any(measured == name or measured.startswith(f"{name}[") for measured in report)]
+    if not_measured:
+        terminalreporter.write_line(f"Не использовались в тестах: {', '.join(not_measured)}")
+    terminalreporter.write_line(f"Отчет: {path}")
+
+
+def _get_worker_index(worker_id):
+    return int(worker_id[2:]) if worker_id.startswith('gw') else 0
+
+
+def _resolve_chromedriver(config):
+    resolver = ChromeDriverResolver(
+        cache_dir=os.environ.get('CHROMEDRIVER_CACHE', DEFAULT_CACHE_DIR),
+        offline_dir=config.getoption("--driver-dir"),
+        chrome_binary=config.getoption("--chrome-binary")
+    )
+    return resolver.resolve()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Путь к chromedriver определяется один раз в главном процессе и передается воркерам xdist"""
+    config = node.config
+    if not hasattr(config, '_chromedriver_path'):
+        config._chromedriver_path = _resolve_chromedriver(config)
+    node.workerinput['chromedriver_path'] = config._chromedriver_path
+
+
+@pytest.fixture(scope="session")
+def worker_id():
+    """Идентификатор воркера xdist (gw0, gw1, ...) или 'master' при последовательном запуске"""
+    return os.environ.get('PYTEST_XDIST_WORKER', 'master')
+
+
+@pytest.fixture(scope="session")
+def worker_tmp_dir(tmp_path_factory, worker_id):
+    """Временный каталог воркера для профилей браузера и хранилища selenium-wire"""
+    return tmp_path_factory.mktemp(f"worker-{worker_id}")
 
 
 @pytest.fixture(scope="session")
@@ -54,11 +437,15 @@ def headless_mode(request):
     return request.config.getoption("--headless")
 
 
-@pytest.fixture(scope="function")
-def driver(headless_mode):
+def _create_driver(headless_mode, driver_path, network_backend, work_dir, chrome_binary=None,
+                   browser_profile=None, user_data_dir=None):
+    browser_profile = browser_profile or get_browser_profile('default')
     chrome_options = Options()
-    if headless_mode:
-        chrome_options.add_argument("--headless")
+    user_data_dir = user_data_dir or tempfile.mkdtemp(prefix='profile-', dir=work_dir)
+    chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    if chrome_binary:
+        chrome_options.binary_location = chrome_binary
+    browser_profile.configure(chrome_options, headless_mode)
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-logging")
@@ -66,40 +453,210 @@ def driver(headless_mode):
     chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
     chrome_options.add_experimental_option('useAutomationExtension', False)
     
-    driver_path = ChromeDriverManager().install()
-    
-    if not driver_path.endswith('chromedriver.exe'):
-        driver_dir = os.path.dirname(driver_path)
-        chromedriver_exe = os.path.join(driver_dir, 'chromedriver.exe')
-        if os.path.exists(chromedriver_exe):
-            driver_path = chromedriver_exe
-        else:
-            for root, dirs, files in os.walk(driver_dir):
-                if 'chromedriver.exe' in files:
-                    driver_path = os.path.join(root, 'chromedriver.exe')
-                    break
-    
     service = Service(driver_path, log_output=subprocess.DEVNULL)
-    seleniumwire_options = {
-        'suppress_connection_errors': True,
-    }
-    driver = webdriver.Chrome(service=service, options=chrome_options, seleniumwire_options=seleniumwire_options)
-    driver.maximize_window()
-    driver.implicitly_wait(10)
-    
-    yield driver
-    driver.quit()
+    driver = network_backend.create_driver(service, chrome_options)
+    driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': BasePage.NETWORK_TRACKER_JS})
+    browser_profile.after_launch(driver)
+    # Все ожидания в page objects явные, неявное ожидание только складывалось бы с ними
+    driver.implicitly_wait(0)
+    return driver
 
 
 @pytest.fixture(scope="session")
-def base_url(request):
-    return request.config.getoption("--base-url")
+def chrome_binary(request):
+    return request.config.getoption("--chrome-binary")
+
+
+@pytest.fixture(scope="session")
+def chromedriver_path(request):
+    workerinput = getattr(request.config, 'workerinput', None)
+    if workerinput and 'chromedriver_path' in workerinput:
+        return workerinput['chromedriver_path']
+    return _resolve_chromedriver(request.config)
+
+
+@pytest.fixture(scope="session")
+def proxy_port(request, worker_id):
+    base_port = request.config.getoption("--proxy-base-port")
+    return base_port + _get_worker_index(worker_id) if base_port else 0
+
+
+@pytest.fixture(scope="session")
+def capture_config():
+    """Перехватываются только API эндпоинты, объявленные в page objects"""
+    return CaptureConfig.from_pages([CreateTaskPage, DashboardPage])
+
+
+@pytest.fixture(scope="session")
+def asset_cache(request, capture_config):
+    """Дисковый кэш статики при --asset-cache, API эндпоинты через него не проходят"""
+    if not request.config.getoption("--asset-cache"):
+        yield None
+        return
+    cache = AssetCache(
+        request.config.getoption("--asset-cache-dir"),
+        max_bytes=request.config.getoption("--asset-cache-size") * 1024 * 1024,
+        skip_scopes=capture_config.scopes
+    )
+    yield cache
+    logging.getLogger(__name__).info(f"Кэш статики {cache.cache_dir}: {cache.stats()}")
+
+
+@pytest.fixture(scope="session")
+def network_backend(request, capture_config, worker_tmp_dir, proxy_port, asset_cache):
+    return get_network_backend(
+        request.config.getoption("--network-backend"), capture_config, worker_tmp_dir, proxy_port, asset_cache,
+        request.config.getoption("--network-mode")
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_profile(request):
+    return get_browser_profile(request.config.getoption("--browser-profile"))
+
+
+@pytest.fixture(scope="session")
+def profile_template(browser_profile, headless_mode, chromedriver_path, chrome_binary, network_backend,
+                     worker_tmp_dir, base_url):
+    """
+    Прогретый шаблон user-data-dir воркера, если его требует профиль браузера.
+    Браузер шаблона открывает дашборд и ждет завершения его запросов.
+    """
+    if not browser_profile.warm_template:
+        return None
+
+    def launch(user_data_dir):
+        return _create_driver(headless_mode, chromedriver_path, network_backend, worker_tmp_dir, chrome_binary,
+                              browser_profile, user_data_dir)
+
+    def warm(driver):
+        driver.get(base_url)
+        BasePage(driver).wait_for_network_idle()
+
+    return ProfileTemplate.build(str(worker_tmp_dir / "profile-template"), launch, warm)
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, headless_mode, chromedriver_path, chrome_binary, network_backend, worker_tmp_dir,
+                browser_profile, profile_template):
+    profiler_plugin = request.config.pluginmanager.get_plugin(CommandProfilerPlugin.NAME)
+
+    def factory():
+        user_data_dir = profile_template.clone(worker_tmp_dir) if profile_template else None
+        driver = _create_driver(headless_mode, chromedriver_path, network_backend, worker_tmp_dir, chrome_binary,
+                                browser_profile, user_data_dir)
+        if profiler_plugin is not None:
+            profiler_plugin.profiler.attach(driver)
+        return driver
+
+    pool = DriverPool(factory, max_uses=request.config.getoption("--driver-recycle-after"))
+    yield pool
+    pool.close()
 
 
 @pytest.fixture(scope="function")
-def browser(driver, base_url):
-    driver.get(base_url)
+def resource_policy(request):
+    """
+    Правила блокировки ресурсов при --block-resources.
+    Набор тестов может переопределить фикстуру в своем conftest.py и вернуть свой ResourcePolicy.
+    """
+    if not request.config.getoption("--block-resources"):
+        return None
+    return DEFAULT_RESOURCE_POLICY
+
+
+@pytest.fixture(scope="function")
+def cassette(request, capture_config):
+    """
+    Кассета API теста при --network-mode=record или replay.
+    Записанная кассета сохраняется после теста в <--cassette-dir>/<модуль>/<тест>.har.
+    """
+    mode = request.config.getoption("--network-mode")
+    if mode == "live":
+        yield None
+        return
+
+    path = cassette_path(request.config.getoption("--cassette-dir"), str(request.node.fspath), request.node.name)
+    if mode == "replay":
+        try:
+            cassette = Cassette.load(path, capture_config.scopes)
+        except FileNotFoundError:
+            pytest.fail(f"Кассета {path} не записана, запустите тест с --network-mode=record")
+    else:
+        cassette = Cassette(path, mode, capture_config.scopes)
+
+    yield cassette
+
+    if mode == "record":
+        cassette.save()
+    elif cassette.misses:
+        logging.getLogger(__name__).warning(
+            f"Запросы без записи в кассете {path}: {', '.join(cassette.misses)}. "
+            f"Перезапишите кассету с --network-mode=record"
+        )
+
+
+@pytest.fixture(scope="session")
+def scenario_batcher(request):
+    """Группы сценариев при --batch-scenarios"""
+    return getattr(request.config, '_scenario_batcher', None)
+
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool, network_backend, resource_policy, cassette, scenario_batcher):
+    driver = driver_pool.acquire()
+    batch = scenario_batcher.key(request.node) if scenario_batcher else None
+    if getattr(driver, 'scenario_batch', None) not in (None, batch):
+        # Страница осталась от другой группы: xdist выдал воркеру не следующий по порядку тест
+        driver_pool.reset_state(driver)
+        driver.scenario_batch = None
+    network_backend.apply_resource_policy(driver, resource_policy)
+    network_backend.use_cassette(driver, cassette)
     yield driver
+    network_backend.use_cassette(driver, None)
+    keep_page = scenario_batcher is not None and scenario_batcher.keeps_page(request.node)
+    driver.scenario_batch = batch if keep_page else None
+    driver_pool.release(driver, keep_page=keep_page)
+
 
+@pytest.fixture(scope="session")
+def stand_in(request):
+    """Локальная заглушка трекера задач, если передан --stand-in"""
+    if not request.config.getoption("--stand-in"):
+        yield None
+        return
+
+    server = StandInServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(request, stand_in):
+    if stand_in is not None:
+        return stand_in.url
+    return request.config.getoption("--base-url")
 
 
+@pytest.fixture(scope="session")
+def api_url(request, stand_in):
+    if stand_in is not None:
+        return stand_in.url
+    return request.config.getoption("--api-url")
+
+
+@pytest.fixture(scope="function")
+def browser(driver, base_url):
+    """
+    Браузер с открытым дашбордом. Случай группы сценариев продолжает страницу
+    предыдущего случая после легкого сброса приложения.
+    """
+    if getattr(driver, 'scenario_batch', None) is None:
+        driver.get(base_url)
+    else:
+        try:
+            DashboardPage(driver).reset_view(base_url)
+        except (WebDriverException, AssertionError) as e:
+            logging.getLogger(__name__).warning(f"Легкий сброс страницы не удался, перезагружаем: {e}")
+            driver.get(base_url)
+    yield driver
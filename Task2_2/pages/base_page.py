@@ -1,8 +1,11 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        ElementNotInteractableException, ElementClickInterceptedException)
 import logging
+import time
 from selenium.webdriver.support.ui import Select
+from .locators import LocatorTemplate
 
 # Создаем объект логгера на уровне модуля
 LOGGING = logging.getLogger(__name__)
@@ -10,12 +13,52 @@ LOGGING = logging.getLogger(__name__)
 
 class BasePage:
 
+    POLL_FREQUENCY = 0.05
+    DEFAULT_SCRIPT_TIMEOUT = 30
+
+    # Сборщик замеров стратегий локаторов (utils.locator_benchmark.LocatorBenchmark),
+    # задается фикстурами при запуске с --locator-benchmark
+    locator_benchmark = None
+
+    # Счетчик незавершенных fetch/XHR запросов страницы. Устанавливается через
+    # Page.addScriptToEvaluateOnNewDocument при создании драйвера, а если его нет -
+    # при первом ожидании.
+    NETWORK_TRACKER_JS = """
+    if (window.__networkTracker === undefined) {
+        const tracker = window.__networkTracker = {pending: 0, last: performance.now()};
+        const start = () => { tracker.pending++; tracker.last = performance.now(); };
+        const done = () => { tracker.pending = Math.max(0, tracker.pending - 1); tracker.last = performance.now(); };
+        const originalFetch = window.fetch;
+        window.fetch = function () {
+            start();
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+        const originalSend = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            start();
+            this.addEventListener('loadend', done, {once: true});
+            return originalSend.apply(this, arguments);
+        };
+    }
+    """
+
+    MODAL_MOUNTED_JS = """
+    const modal = arguments[0].closest('.MuiModal-root');
+    if (!modal) return true;
+    for (let node = arguments[0]; node && node !== modal.parentElement; node = node.parentElement) {
+        if (getComputedStyle(node).opacity !== '1') return false;
+    }
+    return modal.getAnimations({subtree: true}).every(a => a.playState !== 'running' && a.playState !== 'pending');
+    """
+
     def __init__(self, driver, base_url="https://avito-tech-internship-psi.vercel.app/issues"):
         self.driver = driver
         self.base_url = base_url
+        self._element_cache = {}
 
     def open(self):
-        LOGGING.info(f"Открытие страницы: {self.base_url}")
+        LOGGING.info("Открытие страницы: %s", self.base_url, extra={'action': 'open'})
+        self._element_cache.clear()
         self.driver.get(self.base_url)
 
     def find_element(self, locator, timeout=10):
@@ -26,23 +69,95 @@ class BasePage:
         :return: WebElement
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            LOGGING.info(f"Элемент найден: {locator}")
+            element = self._resolve(locator, EC.presence_of_element_located, timeout)
+            LOGGING.info("Элемент найден: %s", locator, extra={'action': 'find'})
             return element
         except TimeoutException:
-            LOGGING.error(f"Элемент не найден: {locator}")
+            LOGGING.error("Элемент не найден: %s", locator, extra={'action': 'find'})
             raise
 
+    @staticmethod
+    def locator_strategies(locator):
+        """
+        Стратегии поиска локатора в порядке предпочтения
+        :param locator: Locator или кортеж (By, значение)
+        :return: Список кортежей (By, значение)
+        """
+        return getattr(locator, 'strategies', None) or [tuple(locator)]
+
+    def _current(self, locator):
+        """Стратегия, которой локатор сейчас ищется в первую очередь"""
+        return tuple(self.locator_strategies(locator)[0])
+
+    def _resolve(self, locator, condition, timeout):
+        """
+        Разрешение локатора одним ожиданием condition и сохранение WebElement в кэше страницы.
+        Стратегии Locator перебираются по порядку, сработавшая запасная стратегия
+        переносится в начало списка.
+
+        :param locator: Locator или кортеж (By, значение)
+        :param condition: Фабрика условия из expected_conditions, принимающая локатор
+        :param timeout: Время ожидания в секундах
+        :return: WebElement
+        """
+        strategies = self.locator_strategies(locator)
+        conditions = [(strategy, condition(strategy)) for strategy in strategies]
+
+        def any_strategy(driver):
+            for strategy, check in conditions:
+                try:
+                    element = check(driver)
+                except NoSuchElementException:
+                    continue
+                if element:
+                    if strategy != strategies[0]:
+                        LOGGING.info("Локатор %s найден запасной стратегией: %s", locator, strategy, extra={'action': 'find'})
+                        locator.promote(strategy)
+                    return element
+            return False
+
+        element = WebDriverWait(self.driver, timeout, self.POLL_FREQUENCY,
+                                ignored_exceptions=(StaleElementReferenceException,)
+                                ).until(any_strategy)
+        self._element_cache[(locator, condition)] = element
+        if self.locator_benchmark is not None:
+            self.locator_benchmark.measure(self.driver, locator)
+        return element
+
+    def _perform(self, locator, action, condition=EC.presence_of_element_located, timeout=10):
+        """
+        Выполнение действия над элементом с переиспользованием найденного ранее WebElement.
+        Если закэшированный элемент устарел или недоступен, локатор разрешается заново
+        с ожиданием condition; для кликов кликабельность закэшированного элемента
+        проверяется перед каждым действием.
+
+        :param locator: Кортеж (By, значение)
+        :param action: Функция, принимающая WebElement
+        :param condition: Условие, которому должен удовлетворять элемент
+        :param timeout: Время ожидания в секундах
+        :return: Результат action
+        """
+        element = self._element_cache.get((locator, condition))
+        if element is not None:
+            try:
+                # Кнопка могла стать неактивной или скрытой с прошлого раза: клик по ней
+                # прошел бы молча, поэтому кликабельность проверяется заново
+                if condition is EC.element_to_be_clickable and not (element.is_displayed() and element.is_enabled()):
+                    raise ElementNotInteractableException(f"Элемент {locator} больше не кликабелен")
+                return action(element)
+            except (StaleElementReferenceException, ElementNotInteractableException,
+                    ElementClickInterceptedException):
+                self._element_cache.pop((locator, condition), None)
+        return action(self._resolve(locator, condition, timeout))
+
     def select_by_text(self, locator, text, timeout=10):
         try:
             select = Select(self.find_element(locator, timeout))
             select.select_by_visible_text(text)
-            LOGGING.info(f"Выбран элемент: {text}")
+            LOGGING.info("Выбран элемент: %s", text, extra={'action': 'select'})
             return select
         except TimeoutException:
-            LOGGING.error(f"Не удалось выбрать элемент: {text}")
+            LOGGING.error("Не удалось выбрать элемент: %s", text, extra={'action': 'select'})
             raise
 
     def click_in_dropdown(self, menu_locator, option_locator, timeout=10):
@@ -56,16 +171,18 @@ class BasePage:
             self.click_button(menu_locator, timeout=timeout)
             self.click_button(option_locator, timeout=timeout)
         except TimeoutException:
-            LOGGING.error(f"Невозможно выбрать опцию: {option_locator}")
+            LOGGING.error("Невозможно выбрать опцию: %s", option_locator, extra={'action': 'select'})
             raise
 
     def get_dynamic_locator(self, template: tuple, value: str):
         """
         возвращает динамический локатор по шаблону
-        :param template: Шаблон локатора
+        :param template: LocatorTemplate или кортеж (By, шаблон)
         :param value: Значение для замены в шаблоне
         :return: Динамический локатор
         """
+        if isinstance(template, LocatorTemplate):
+            return template.format(value)
         return (template[0], template[1].replace("*", value))
 
     def find_elements(self, locator, timeout=10):
@@ -77,12 +194,10 @@ class BasePage:
         :return: Список WebElement
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            return self.driver.find_elements(*locator)
+            self._resolve(locator, EC.presence_of_element_located, timeout)
+            return self.driver.find_elements(*self._current(locator))
         except TimeoutException:
-            LOGGING.warning(f"Элементы не найдены: {locator}")
+            LOGGING.warning("Элементы не найдены: %s", locator, extra={'action': 'find'})
             raise
 
     def click_button(self, locator, timeout=10):
@@ -93,15 +208,10 @@ class BasePage:
         :param timeout: Время ожидания в секундах
         """
         try:
-            self.find_element(locator, timeout)
-
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            element.click()
-            LOGGING.info(f"Клик по элементу: {locator}")
+            self._perform(locator, lambda element: element.click(), EC.element_to_be_clickable, timeout)
+            LOGGING.info("Клик по элементу: %s", locator, extra={'action': 'click'})
         except TimeoutException:
-            LOGGING.error(f"Элемент не кликабелен: {locator}")
+            LOGGING.error("Элемент не кликабелен: %s", locator, extra={'action': 'click'})
             raise
 
     def fill_input(self, locator, text, timeout=10):
@@ -113,10 +223,9 @@ class BasePage:
         :param timeout: Время ожидания в секундах
         """
         try:
-            element = self.find_element(locator, timeout)
-            element.send_keys(text)
+            self._perform(locator, lambda element: element.send_keys(text), timeout=timeout)
         except TimeoutException:
-            LOGGING.error(f"Не удалось ввести текст в элемент: {locator}")
+            LOGGING.error("Не удалось ввести текст в элемент: %s", locator, extra={'action': 'input'})
             raise
 
     def get_text(self, locator, timeout=10):
@@ -128,12 +237,11 @@ class BasePage:
         :return: Текст элемента
         """
         try:
-            element = self.find_element(locator, timeout)
-            text = element.text
-            LOGGING.info(f"Получен текст '{text}' из элемента: {locator}")
+            text = self._perform(locator, lambda element: element.text, timeout=timeout)
+            LOGGING.info("Получен текст '%s' из элемента: %s", text, locator, extra={'action': 'text'})
             return text
         except TimeoutException:
-            LOGGING.error(f"Не удалось получить текст из элемента: {locator}")
+            LOGGING.error("Не удалось получить текст из элемента: %s", locator, extra={'action': 'text'})
             raise
 
     def is_element_not_visible(self, locator, timeout=5):
@@ -142,15 +250,18 @@ class BasePage:
         
         :param locator: Кортеж 
         :param timeout: Время ожидания в секундах
-        :raises: TimeoutException если элемент все еще видим после timeout
+        :raises: AssertionError если элемент все еще видим после timeout
         """
+        # Элемент считается исчезнувшим, только если его не видно ни по одной стратегии:
+        # иначе непроверенная первая стратегия, не совпадающая ни с чем, пропустила бы проверку
+        conditions = [EC.invisibility_of_element_located(strategy) for strategy in self.locator_strategies(locator)]
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.invisibility_of_element_located(locator)
+            WebDriverWait(self.driver, timeout, self.POLL_FREQUENCY).until(
+                lambda driver: all(condition(driver) for condition in conditions)
             )
-            LOGGING.info(f"Элемент исчез: {locator}")
+            LOGGING.info("Элемент исчез: %s", locator, extra={'action': 'wait'})
         except TimeoutException:
-            LOGGING.error(f"Элемент НЕ исчез: {locator}")
+            LOGGING.error("Элемент НЕ исчез: %s", locator, extra={'action': 'wait'})
             raise AssertionError(f"Элемент всё ещё видим: {locator}")
 
     def is_button_enabled(self, locator, timeout=10):
@@ -160,13 +271,11 @@ class BasePage:
         """
         try:
             # Ждём, что кнопка кликабельна (видимая + enabled)
-            WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            LOGGING.info(f"Кнопка {locator} доступна для нажатия")
+            self._resolve(locator, EC.element_to_be_clickable, timeout)
+            LOGGING.info("Кнопка %s доступна для нажатия", locator, extra={'action': 'wait'})
             return True
         except (TimeoutException, NoSuchElementException) as e:
-            LOGGING.error(f"Кнопка {locator} НЕ доступна для нажатия: {e}")
+            LOGGING.error("Кнопка %s НЕ доступна для нажатия: %s", locator, e, extra={'action': 'wait'})
             raise AssertionError(f"Кнопка НЕ кликабельна: {locator}")
 
     def is_button_disabled(self, locator, timeout=10):
@@ -175,11 +284,10 @@ class BasePage:
         Падает, если она кликабельна.
         """
         # Ждём появления элемента
-        button = self.find_element(locator, timeout)
-        if button.is_enabled():
-            LOGGING.error(f"Кнопка НЕОЖИДАННО доступна: {locator}")
+        if self._perform(locator, lambda button: button.is_enabled(), timeout=timeout):
+            LOGGING.error("Кнопка НЕОЖИДАННО доступна: %s", locator, extra={'action': 'wait'})
             raise AssertionError(f"Кнопка НЕОЖИДАННО доступна: {locator}")
-        LOGGING.info(f"Кнопка {locator} отключена (как и ожидалось)")
+        LOGGING.info("Кнопка %s отключена (как и ожидалось)", locator, extra={'action': 'wait'})
         return True
 
     def get_current_url(self):
@@ -198,5 +306,120 @@ class BasePage:
         """
         element = self.find_element(locator)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        LOGGING.info(f"Прокрутка до элемента: {locator}")
+        LOGGING.info("Прокрутка до элемента: %s", locator, extra={'action': 'scroll'})
+
+    def execute_async_script(self, script, *args, timeout=10):
+        """
+        Выполнение асинхронного скрипта, который сам ограничивает ожидание timeout секундами.
+        Таймаут скриптов драйвера увеличивается, только если он меньше timeout, и после
+        вызова возвращается к DEFAULT_SCRIPT_TIMEOUT: драйвер из пула переходит к следующим тестам.
+        """
+        if timeout + 1 <= self.DEFAULT_SCRIPT_TIMEOUT:
+            return self.driver.execute_async_script(script, *args)
+        self.driver.set_script_timeout(timeout + 1)
+        try:
+            return self.driver.execute_async_script(script, *args)
+        finally:
+            self.driver.set_script_timeout(self.DEFAULT_SCRIPT_TIMEOUT)
+
+    def wait_for_network_idle(self, idle_ms=100, timeout=10):
+        """
+        Ожидание, пока у страницы не останется незавершенных fetch/XHR запросов
+
+        :param idle_ms: Сколько миллисекунд сеть должна простаивать
+        :param timeout: Время ожидания в секундах
+        """
+        script = self.NETWORK_TRACKER_JS + """
+        const tracker = window.__networkTracker;
+        return tracker.pending === 0 && performance.now() - tracker.last >= arguments[0];
+        """
+        try:
+            WebDriverWait(self.driver, timeout, self.POLL_FREQUENCY).until(
+                lambda driver: driver.execute_script(script, idle_ms)
+            )
+        except TimeoutException:
+            LOGGING.error("Сетевые запросы страницы не завершились за %s секунд", timeout, extra={'action': 'wait'})
+            raise
+
+    def wait_for_animations(self, timeout=5):
+        """
+        Ожидание завершения CSS анимаций и переходов (MUI transitions) на странице
+
+        :param timeout: Время ожидания в секундах
+        """
+        script = """
+        return document.getAnimations().every(a => a.playState !== 'running' && a.playState !== 'pending');
+        """
+        try:
+            WebDriverWait(self.driver, timeout, self.POLL_FREQUENCY).until(
+                lambda driver: driver.execute_script(script)
+            )
+        except TimeoutException:
+            LOGGING.error("Анимации на странице не завершились за %s секунд", timeout, extra={'action': 'wait'})
+            raise
+
+    def wait_for_text_stable(self, locator, stable_ms=150, timeout=10):
+        """
+        Ожидание, пока непустой текст элемента не перестанет меняться
+
+        :param locator: Кортеж (By, значение)
+        :param stable_ms: Сколько миллисекунд текст должен оставаться неизменным
+        :param timeout: Время ожидания в секундах
+        :return: Текст элемента
+        """
+        state = {'text': None, 'since': 0.0}
+        deadline = time.monotonic() + timeout
+
+        def text_is_stable(driver):
+            element = self._element_cache.get((locator, EC.presence_of_element_located))
+            if element is None:
+                element = self._resolve(locator, EC.presence_of_element_located, max(deadline - time.monotonic(), 0))
+            try:
+                text = element.text.strip()
+            except StaleElementReferenceException:
+                self._element_cache.pop((locator, EC.presence_of_element_located), None)
+                raise
+            now = time.monotonic()
+            if text != state['text']:
+                state['text'], state['since'] = text, now
+                return False
+            return text if text and (now - state['since']) * 1000 >= stable_ms else False
+
+        try:
+            text = WebDriverWait(self.driver, timeout, self.POLL_FREQUENCY,
+                                 ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+                                 ).until(text_is_stable)
+            LOGGING.info("Текст элемента %s установился: '%s'", locator, text, extra={'action': 'wait'})
+            return text
+        except TimeoutException:
+            LOGGING.error("Текст элемента %s не установился за %s секунд", locator, timeout, extra={'action': 'wait'})
+            raise
+
+    def wait_for_modal_mounted(self, locator, timeout=10):
+        """
+        Ожидание полностью открытого модального окна: элемент внутри него виден,
+        а переходы появления модального окна завершены
+
+        :param locator: Кортеж (By, значение) элемента внутри MuiModal-root
+        :param timeout: Время ожидания в секундах
+        :return: WebElement
+        """
+        try:
+            element = self._resolve(locator, self._modal_is_mounted, timeout)
+            LOGGING.info("Модальное окно открыто: %s", locator, extra={'action': 'wait'})
+            return element
+        except TimeoutException:
+            LOGGING.error("Модальное окно не открылось: %s", locator, extra={'action': 'wait'})
+            raise
+
+    def _modal_is_mounted(self, strategy):
+        """
+        Условие для _resolve: элемент по стратегии виден, а его модальное окно
+        непрозрачно и без незавершенных анимаций
+        """
+        is_visible = EC.visibility_of_element_located(strategy)
 
+        def check(driver):
+            element = is_visible(driver)
+            return element if element and driver.execute_script(self.MODAL_MOUNTED_JS, element) else False
+        return check
@@ -1,8 +1,9 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import Locator, LocatorTemplate
 import logging
-import time
 import json
+import time
 
 LOGGING = logging.getLogger(__name__)
 
@@ -10,22 +11,58 @@ LOGGING = logging.getLogger(__name__)
 class CreateTaskPage(BasePage):
     """Класс для работы с формой создания/редактирования задачи"""
 
-    TITLE_INPUT = (By.XPATH, "//input[@type='text' and @required]")
-    DESCRIPTION_TEXTAREA = (By.CSS_SELECTOR, "textarea")
-
-    OPTION_TEMPLATE = (By.CSS_SELECTOR, "[data-value='*']")
-    DROPDOWN_TEMPLATE = (By.XPATH,
-                         "(//div[contains(@class, 'MuiModal-root')]//div[contains(@class, 'MuiSelect-root')])[*]")
-
-    CREATE_BUTTON = (By.XPATH, "//div[contains(@class, 'MuiModal-root')]//*[contains(text(), 'Создать')]")
-    UPDATE_BUTTON = (By.XPATH, "//div[contains(@class, 'MuiModal-root')]//*[contains(text(), 'Обновить')]")
-
-    MODAL_CREATE_TITLE = (By.XPATH, "//div[contains(@class, 'MuiModal-root')]//*[contains(text(), 'Создание')]")
-    MODAL_UPDATE_TITLE = (By.XPATH, "//div[contains(@class, 'MuiModal-root')]//*[contains(text(), 'Редактирование')]")
+    # Стратегии перечислены в порядке предпочтения: узкие CSS/XPath без сканирования текста
+    # всего документа идут первыми, исходные XPath оставлены запасными
+    TITLE_INPUT = Locator((By.CSS_SELECTOR, "input[type='text'][required]"),
+                          (By.XPATH, "//input[@type='text' and @required]"),
+                          (By.CSS_SELECTOR, "[data-testid='task-title-input']"))
+    DESCRIPTION_TEXTAREA = Locator((By.CSS_SELECTOR, "textarea"),
+                                   (By.CSS_SELECTOR, "[data-testid='task-description-input']"))
+
+    OPTION_TEMPLATE = LocatorTemplate((By.CSS_SELECTOR, "li[data-value='*']"),
+                                      (By.CSS_SELECTOR, "[data-value='*']"))
+    DROPDOWN_TEMPLATE = LocatorTemplate((By.XPATH, "(//div[contains(@class, 'MuiModal-root')]"
+                                                   "//div[contains(@class, 'MuiSelect-root')])[*]"))
+
+    CREATE_BUTTON = Locator((By.XPATH, "//div[contains(@class, 'MuiModal-root')]//button[contains(text(), 'Создать')]"),
+                            (By.XPATH, "//div[contains(@class, 'MuiModal-root')]//*[contains(text(), 'Создать')]"))
+    UPDATE_BUTTON = Locator((By.XPATH, "//div[contains(@class, 'MuiModal-root')]//button[contains(text(), 'Обновить')]"),
+                            (By.XPATH, "//div[contains(@class, 'MuiModal-root')]//*[contains(text(), 'Обновить')]"))
+
+    # Заголовки модальных окон проверяются и на исчезновение: исходный XPath остается первым,
+    # пока --locator-benchmark не покажет, что h2 находит тот же элемент в живом приложении
+    MODAL_CREATE_TITLE = Locator((By.XPATH, "//div[contains(@class, 'MuiModal-root')]//*[contains(text(), 'Создание')]"),
+                                 (By.XPATH, "//div[contains(@class, 'MuiModal-root')]//h2[contains(text(), 'Создание')]"))
+    MODAL_UPDATE_TITLE = Locator((By.XPATH, "//div[contains(@class, 'MuiModal-root')]"
+                                            "//*[contains(text(), 'Редактирование')]"),
+                                 (By.XPATH, "//div[contains(@class, 'MuiModal-root')]"
+                                            "//h2[contains(text(), 'Редактирование')]"))
+
+    # Порядковые номера выпадающих списков в модальном окне
+    FORM_DROPDOWNS = {'project': 1, 'priority': 2, 'status': 3, 'assignee': 4}
+
+    CREATE_TASK_API = ('POST', '/api/v1/tasks/create')
+    UPDATE_TASK_API = ('PUT', '/api/v1/tasks/update/')
+    API_ENDPOINTS = (CREATE_TASK_API, UPDATE_TASK_API)
+
+    # Реестр созданных задач (utils.task_registry.CreatedTaskRegistry) для очистки после сессии,
+    # задается фикстурой created_tasks
+    task_registry = None
 
     def __init__(self, driver):
         super().__init__(driver)
-        self._initial_request_count = len(driver.requests) if hasattr(driver, 'requests') else 0
+        # id задачи из ответа на создание
+        self.created_task_id = None
+        self._capture = getattr(driver, 'capture_index', None)
+        self._capture_cursor = 0
+        # Драйвер selenium-wire без индекса (создан не фикстурами): запросы ищутся в driver.requests
+        self._seen_requests = set()
+        if self._capture is not None:
+            self._capture.watch(*self.CREATE_TASK_API)
+            self._capture.watch(*self.UPDATE_TASK_API)
+            self._capture_cursor = self._capture.cursor()
+        elif hasattr(driver, 'requests'):
+            self._seen_requests = {request.id for request in driver.requests}
         self._form_data = {
             'title': None,
             'description': None,
@@ -57,37 +94,33 @@ class CreateTaskPage(BasePage):
         return self.get_dynamic_locator(self.DROPDOWN_TEMPLATE, str(number))
 
     def select_project(self, project_id):
-        project_dropdown_locator = self.return_dropdown_locator(1)
+        project_dropdown_locator = self.return_dropdown_locator(self.FORM_DROPDOWNS['project'])
         option_locator = self.return_option_locator(project_id)
         self.click_in_dropdown(project_dropdown_locator, option_locator)
-
-        time.sleep(0.3)
-        project_element = self.find_element(project_dropdown_locator)
-        project_name = project_element.text.strip()
+        project_name = self.wait_for_text_stable(project_dropdown_locator)
 
         self._form_data['project_id'] = project_id
         self._form_data['project_name'] = project_name
         return self
 
     def select_priority(self, priority_name):
-        priority_dropdown_locator = self.return_dropdown_locator(2)
+        priority_dropdown_locator = self.return_dropdown_locator(self.FORM_DROPDOWNS['priority'])
         self.click_in_dropdown(priority_dropdown_locator, self.return_option_locator(priority_name))
         self._form_data['priority'] = priority_name
         return self
 
     def select_status(self, status_name):
-        status_dropdown_locator = self.return_dropdown_locator(3)
+        status_dropdown_locator = self.return_dropdown_locator(self.FORM_DROPDOWNS['status'])
         self.click_in_dropdown(status_dropdown_locator, self.return_option_locator(status_name))
         self._form_data['status'] = status_name
         return self
 
     def select_assignee(self, assignee_id):
-        assignee_dropdown_locator = self.return_dropdown_locator(4)
+        assignee_dropdown_locator = self.return_dropdown_locator(self.FORM_DROPDOWNS['assignee'])
         self.click_button(assignee_dropdown_locator)
-        time.sleep(0.3)
 
         option_locator = self.return_option_locator(assignee_id)
-        option_element = self.find_element(option_locator)
+        option_element = self.wait_for_modal_mounted(option_locator)
         assignee_name = option_element.text.strip()
 
         self.click_button(option_locator)
@@ -97,30 +130,26 @@ class CreateTaskPage(BasePage):
         return self
 
     def _wait_for_api_request(self, method, url_pattern, timeout=10):
-        start_time = time.time()
-        checked_requests = set()
-
-        while time.time() - start_time < timeout:
-            all_requests = list(self.driver.requests) if hasattr(self.driver, 'requests') else []
-
-            for request in all_requests:
-                request_id = id(request)
-                if request_id in checked_requests:
-                    continue
-
-                if request.method == method and url_pattern in request.url:
-                    checked_requests.add(request_id)
-                    max_wait_for_response = 5
-                    response_wait_start = time.time()
-
-                    while time.time() - response_wait_start < max_wait_for_response:
-                        if hasattr(request, 'response') and request.response:
-                            return request
-                        time.sleep(0.2)
-
-                    return request
-
-            time.sleep(0.3)
+        """
+        Ожидание запроса к API, отправленного после создания page object
+        :return: CapturedExchange или запрос selenium-wire с ответом
+        """
+        if self._capture is not None:
+            exchange = self._capture.wait_for(method, url_pattern, self._capture_cursor, timeout)
+            if exchange is not None:
+                return exchange
+        elif hasattr(self.driver, 'requests'):
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                for request in self.driver.requests:
+                    if (request.id not in self._seen_requests and request.method == method
+                            and url_pattern in request.url and request.response):
+                        return request
+                time.sleep(0.2)
+        else:
+            raise RuntimeError(
+                "Драйвер не перехватывает сеть: нужен capture_index (utils.network_backends) или selenium-wire"
+            )
 
         raise AssertionError(f"API запрос {method} {url_pattern} не найден за {timeout} секунд")
 
@@ -221,11 +250,15 @@ class CreateTaskPage(BasePage):
         self._check_status(payload)
         self._check_assignee_id_update(payload)
 
-    def _check_api_response(self, method, url_pattern, payload_checker, error_message, expected_status=200, timeout=10):
+    def _check_api_response(self, method, url_pattern, payload_checker, error_message, expected_status=200, timeout=10,
+                            on_captured=None):
         api_request = self._wait_for_api_request(method, url_pattern, timeout)
         if not hasattr(api_request, 'response') or not api_request.response:
             raise AssertionError(error_message)
 
+        # Обработка обмена до проверок: упавшая проверка не должна его терять
+        if on_captured is not None:
+            on_captured(api_request)
         payload_checker(api_request)
 
         status_code = api_request.response.status_code
@@ -233,21 +266,41 @@ class CreateTaskPage(BasePage):
 
         assert status_code == expected_status, \
             f"Ожидался статус {expected_status}, получен {status_code}. Тело ответа: {response_body}"
+        return api_request
+
+    def _register_created_task(self, api_request):
+        """
+        Запоминает id задачи из ответа на создание для поиска карточки и очистки после сессии.
+        Вызывается до проверок запроса и статуса: задачи упавших тестов тоже удаляются.
+        """
+        if api_request.response.status_code >= 300:
+            return
+        try:
+            body = json.loads(self._get_response_body(api_request) or '{}')
+        except json.JSONDecodeError:
+            return
+        data = body.get('data', body) if isinstance(body, dict) else None
+        if isinstance(data, dict) and data.get('id') is not None:
+            self.created_task_id = data['id']
+            if self.task_registry is not None:
+                self.task_registry.add(data['id'])
+        elif self.task_registry is not None:
+            LOGGING.warning("В ответе на создание задачи нет id, задача не будет удалена: %s", body,
+                            extra={'action': 'register'})
 
     def check_response_code(self, expected_status=200, timeout=10):
         self._check_api_response(
-            'POST',
-            "https://avito-tech-internship-production.up.railway.app/api/v1/tasks/create",
+            *self.CREATE_TASK_API,
             self._check_request_payload,
             "POST /api/v1/tasks/create не найден или без ответа",
             expected_status,
-            timeout
+            timeout,
+            on_captured=self._register_created_task
         )
 
     def check_update_response_code(self, expected_status=200, timeout=10):
         self._check_api_response(
-            'PUT',
-            "/api/v1/tasks/update/",
+            *self.UPDATE_TASK_API,
             self._check_update_request_payload,
             "PUT /api/v1/tasks/update/* не найден или без ответа",
             expected_status,
@@ -278,10 +331,15 @@ class CreateTaskPage(BasePage):
         self.click_button(self.UPDATE_BUTTON)
 
     def submit_form(self, code=200):
+        from .dashboard_page import DashboardPage
+        dashboard = DashboardPage(self.driver)
+        title = self._form_data['title']
+        known = dashboard.mark_existing_tasks('title', title) if title else None
         self.click_create_button()
         self.check_after_create(code)
-        from .dashboard_page import DashboardPage
-        return DashboardPage(self.driver)
+        if title:
+            dashboard.expect_new_task(title, known, self.created_task_id)
+        return dashboard
 
     def update_form(self, code=200):
         self.click_update_button()
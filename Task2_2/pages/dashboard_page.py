@@ -1,8 +1,10 @@
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
 from .base_page import BasePage
+from .locators import Locator
 import logging
-import time
 
 LOGGING = logging.getLogger(__name__)
 
@@ -10,11 +12,298 @@ LOGGING = logging.getLogger(__name__)
 class DashboardPage(BasePage):
     """Класс для работы со страницей дашборда"""
 
-    CREATE_TASK_BUTTON = (By.XPATH, "//button[contains(text(), 'Создать задачу')]")
-    TASK_CARD = (By.CSS_SELECTOR, "div.MuiPaper-root.MuiPaper-outlined")
+    CREATE_TASK_BUTTON = Locator((By.XPATH, "//header//button[contains(text(), 'Создать задачу')]"),
+                                 (By.XPATH, "//button[contains(text(), 'Создать задачу')]"),
+                                 (By.CSS_SELECTOR, "[data-testid='create-task-button']"))
+    # Селектор карточки передается в скрипты индекса как CSS, поэтому стратегия одна
+    TASK_CARD = Locator((By.CSS_SELECTOR, "div.MuiPaper-root.MuiPaper-outlined"))
+    # Пагинация MUI на больших досках
+    NEXT_PAGE_BUTTON = Locator((By.CSS_SELECTOR, "button[aria-label='Go to next page']"))
+    PREVIOUS_PAGE_BUTTON = Locator((By.CSS_SELECTOR, "button[aria-label='Go to previous page']"))
+    LAST_PAGE_BUTTON = Locator((By.CSS_SELECTOR, "button[aria-label='Go to last page']"))
+    FIRST_PAGE_BUTTON = Locator((By.CSS_SELECTOR, "button[aria-label='Go to first page']"))
+    # Открытые модалки и выпадающие меню MUI
+    OPEN_MODAL = Locator((By.CSS_SELECTOR, "div.MuiModal-root"))
+
+    # Возврат на маршрут списка задач без перезагрузки: роутер SPA слушает popstate
+    RETURN_TO_ROUTE_JS = """
+    const target = new URL(arguments[0], location.href);
+    if (location.pathname === target.pathname) {
+        return false;
+    }
+    history.pushState(null, '', target.pathname + target.search);
+    window.dispatchEvent(new PopStateEvent('popstate', {state: null}));
+    return true;
+    """
+
+    # Данные карточки, которые раньше читались отдельными find_elements/.text
+    CARD_DATA_JS = """
+    const cardData = (card, index, withElement) => {
+        const text = selector => {
+            const node = card.querySelector(selector);
+            return node ? node.innerText : null;
+        };
+        const title = text('h4, h5, h6');
+        const status = text('.MuiChip-root .MuiChip-label');
+        return {
+            index: index,
+            title: title === null ? null : title.trim(),
+            status: status === null ? null : status.trim(),
+            description: text('p.MuiTypography-body2'),
+            element: withElement ? card : null,
+        };
+    };
+    """
+    CARDS_SNAPSHOT_JS = CARD_DATA_JS + """
+    const [selector, start, end, withElements] = arguments;
+    const cards = Array.from(document.querySelectorAll(selector));
+    const normalize = (value, fallback) => value === null ? fallback : (value < 0 ? Math.max(cards.length + value, 0) : value);
+    const from = normalize(start, 0);
+    return cards.slice(from, normalize(end, cards.length)).map((card, offset) => cardData(card, from + offset, withElements));
+    """
+    CARD_INFO_JS = CARD_DATA_JS + """
+    return cardData(arguments[0], null, false);
+    """
+
+    # Индекс карточек в странице: title/board/assignee -> карточки. Ставится один раз
+    # на загрузку страницы и обновляется MutationObserver по мере добавления и изменения карточек
+    TASK_INDEX_JS = CARD_DATA_JS + """
+    const selector = arguments[0];
+    if (!window.__taskIndex) {
+        const taskIndex = window.__taskIndex = {
+            fields: {title: new Map(), board: new Map(), assignee: new Map()},
+            keys: new Map(),
+            waiters: [],
+            // Карточки, которые были на странице до создания задачи (mark_existing_tasks)
+            known: new Map(),
+            lastMark: 0,
+        };
+        const parse = card => {
+            const data = cardData(card, null, false);
+            const description = data.description || '';
+            return {
+                title: data.title,
+                board: description.includes('Доска:') ? description.split('Доска:')[1].split('|')[0].trim() : null,
+                assignee: description.includes('Исполнитель:') ? description.split('Исполнитель:')[1].trim() : null,
+            };
+        };
+        const remove = card => {
+            const keys = taskIndex.keys.get(card);
+            if (!keys) return;
+            Object.entries(keys).forEach(([field, value]) => {
+                const cards = taskIndex.fields[field].get(value);
+                if (!cards) return;
+                cards.delete(card);
+                if (!cards.size) taskIndex.fields[field].delete(value);
+            });
+            taskIndex.keys.delete(card);
+        };
+        const add = card => {
+            remove(card);
+            const keys = parse(card);
+            taskIndex.keys.set(card, keys);
+            Object.entries(keys).forEach(([field, value]) => {
+                if (value === null) return;
+                if (!taskIndex.fields[field].has(value)) taskIndex.fields[field].set(value, new Set());
+                taskIndex.fields[field].get(value).add(card);
+            });
+        };
+        const visit = (node, callback) => {
+            if (node.nodeType !== Node.ELEMENT_NODE) return;
+            if (node.matches(selector)) callback(node);
+            node.querySelectorAll(selector).forEach(callback);
+        };
+        taskIndex.lookup = (field, value) => Array.from(taskIndex.fields[field].get(value) || [])
+            .filter(card => card.isConnected)
+            .sort((a, b) => a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1);
+        new MutationObserver(records => {
+            records.forEach(record => {
+                record.removedNodes.forEach(node => visit(node, remove));
+                record.addedNodes.forEach(node => visit(node, add));
+                const target = record.target.nodeType === Node.ELEMENT_NODE ? record.target : record.target.parentElement;
+                const card = target && target.closest(selector);
+                if (card) add(card);
+            });
+            taskIndex.waiters = taskIndex.waiters.filter(waiter => {
+                const cards = taskIndex.lookup(waiter.field, waiter.value).filter(waiter.accept);
+                if (!cards.length) return true;
+                waiter.resolve(cards);
+                return false;
+            });
+        }).observe(document.body, {childList: true, subtree: true, characterData: true});
+        document.querySelectorAll(selector).forEach(add);
+    }
+    const taskIndex = window.__taskIndex;
+    """
+    TASK_LOOKUP_JS = TASK_INDEX_JS + """
+    const [, field, value, withElements] = arguments;
+    return taskIndex.lookup(field, value).map(card => cardData(card, null, withElements));
+    """
+    TASK_MARK_JS = TASK_INDEX_JS + """
+    const [, field, value] = arguments;
+    const mark = ++taskIndex.lastMark;
+    taskIndex.known.set(mark, new Set(taskIndex.lookup(field, value)));
+    return mark;
+    """
+    # Обход списка, в DOM которого есть только часть карточек: виртуализированный список
+    # прокручивается окнами, постраничный листается кнопками. Обход идет от конца списка,
+    # где появляются новые задачи. step() возвращает false, когда список пройден,
+    # restore(callback) возвращает прокрутку или страницу, с которых начинался обход.
+    TASK_SCANNER_JS = """
+    const makeScanner = (selector, nextSelector, previousSelector, lastSelector, firstSelector) => {
+        const card = document.querySelector(selector);
+        let scroller = card && card.parentElement;
+        while (scroller && scroller !== document.body) {
+            const overflow = getComputedStyle(scroller).overflowY;
+            if ((overflow === 'auto' || overflow === 'scroll') && scroller.scrollHeight > scroller.clientHeight) {
+                break;
+            }
+            scroller = scroller.parentElement;
+        }
+        if (scroller && scroller !== document.body) {
+            const original = scroller.scrollTop;
+            let position = null;
+            return {
+                step: () => {
+                    if (position === 0) return false;
+                    position = Math.max(0, (position === null ? scroller.scrollHeight : position) - scroller.clientHeight);
+                    scroller.scrollTop = position;
+                    return true;
+                },
+                restore: callback => {
+                    scroller.scrollTop = original;
+                    requestAnimationFrame(() => callback());
+                },
+            };
+        }
+        const enabled = css => {
+            const button = document.querySelector(css);
+            return button && !button.disabled && button.getAttribute('aria-disabled') !== 'true' ? button : null;
+        };
+        // С первой страницы обход прыгает на последнюю и идет назад, вернуться можно кнопкой первой
+        // страницы. С другой страницы номер исходной неизвестен: обход идет вперед, а возврат -
+        // тем же числом шагов назад
+        const fromFirst = !enabled(previousSelector);
+        const direction = fromFirst && enabled(lastSelector) ? previousSelector : nextSelector;
+        let started = false;
+        let moved = 0;
+        return {
+            step: () => {
+                if (!started) {
+                    started = true;
+                    const last = direction === previousSelector ? enabled(lastSelector) : null;
+                    if (last) {
+                        last.click();
+                        moved++;
+                        return true;
+                    }
+                }
+                const button = enabled(direction);
+                if (!button) return false;
+                button.click();
+                moved++;
+                return true;
+            },
+            restore: callback => {
+                if (!moved) return callback();
+                const deadline = performance.now() + 2000;
+                if (fromFirst) {
+                    const back = () => {
+                        if (!enabled(previousSelector) || performance.now() > deadline) return callback();
+                        (enabled(firstSelector) || enabled(previousSelector)).click();
+                        setTimeout(back, 50);
+                    };
+                    return back();
+                }
+                let remaining = moved;
+                const back = () => {
+                    const button = enabled(previousSelector);
+                    if (!remaining || !button || performance.now() > deadline) return callback();
+                    button.click();
+                    remaining--;
+                    setTimeout(back, 50);
+                };
+                back();
+            },
+        };
+    };
+    """
+    TASK_WAIT_JS = TASK_INDEX_JS + TASK_SCANNER_JS + """
+    const [, field, value, timeoutMs, scanDelayMs, pagerSelectors, restore, mark, taskId] = arguments;
+    const done = arguments[arguments.length - 1];
+    // Новая карточка: ее не было среди отмеченных до создания, а если в разметке есть
+    // data-task-id - он совпадает с id из ответа на создание
+    const known = mark === null ? null : taskIndex.known.get(mark);
+    const accept = card => !(known && known.has(card))
+        && (taskId === null || !card.dataset.taskId || card.dataset.taskId === String(taskId));
+    let scanner = null;
+    // Данные карточек читаются до возврата списка: в виртуализированном или постраничном
+    // списке после него карточка может уйти из DOM
+    const finish = cards => {
+        const result = cards.map(card => cardData(card, null, true));
+        if (scanner && restore) {
+            scanner.restore(() => done(result));
+        } else {
+            done(result);
+        }
+    };
+    const found = taskIndex.lookup(field, value).filter(accept);
+    if (found.length) {
+        done(found.map(card => cardData(card, null, true)));
+    } else {
+        const waiter = {field: field, value: value, accept: accept, resolve: finish};
+        taskIndex.waiters.push(waiter);
+        // Обход только по запросу вызывающего: если карточка не появилась сама, список обходится,
+        // найденную карточку индекс отдаст ожидающему
+        if (scanDelayMs >= 0) {
+            const step = () => {
+                if (taskIndex.waiters.indexOf(waiter) < 0) return;
+                scanner = scanner || makeScanner(selector, ...pagerSelectors);
+                if (scanner.step()) setTimeout(step, 50);
+            };
+            setTimeout(step, scanDelayMs);
+        }
+        setTimeout(() => {
+            const position = taskIndex.waiters.indexOf(waiter);
+            if (position >= 0) {
+                taskIndex.waiters.splice(position, 1);
+                finish([]);
+            }
+        }, timeoutMs);
+    }
+    """
+
+    # Сколько секунд ждать карточку до обхода списка (wait_for_task(scan=True))
+    SCAN_DELAY = 0.3
+    # Запас времени скрипта ожидания на возврат списка после обхода
+    RESTORE_TIMEOUT = 2
 
     def __init__(self, driver):
         super().__init__(driver)
+        # title -> отметка карточек до создания задачи и id из ответа на создание
+        self._new_tasks = {}
+
+    def reset_view(self, issues_url, timeout=5):
+        """
+        Легкий сброс приложения между сценариями вместо driver.get: закрытие меню и
+        модалок клавишей Escape и возврат на маршрут списка задач
+
+        :param issues_url: URL списка задач
+        :param timeout: Время ожидания в секундах
+        """
+        modal_selector = self._current(self.OPEN_MODAL)[1]
+
+        def modals_closed(driver):
+            if not driver.execute_script("return document.querySelector(arguments[0]) !== null;", modal_selector):
+                return True
+            ActionChains(driver).send_keys(Keys.ESCAPE).perform()
+            return False
+
+        WebDriverWait(self.driver, timeout, 0.2).until(modals_closed)
+        if self.driver.execute_script(self.RETURN_TO_ROUTE_JS, issues_url):
+            LOGGING.info("Возврат на маршрут %s", issues_url, extra={'action': 'open'})
+        self.find_element(self.CREATE_TASK_BUTTON, timeout)
+        self.wait_for_network_idle(timeout=timeout)
 
     def click_create_task_button(self):
         self.click_button(self.CREATE_TASK_BUTTON)
@@ -22,89 +311,147 @@ class DashboardPage(BasePage):
         return CreateTaskPage(self.driver)
 
     def open_edit_task_form(self, task_title=None):
-        cards = self.find_elements(self.TASK_CARD, timeout=10)
-        assert len(cards) > 0, "Карточки задач не найдены на дашборде"
-
-        last_card = cards[-1]
-        self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", last_card)
-        time.sleep(0.5)
+        """
+        Открытие формы редактирования задачи
+        :param task_title: Название задачи, по умолчанию - последняя карточка на странице
+        """
+        self.wait_for_network_idle()
+        if task_title is not None:
+            card = self.find_task_by_title(task_title)
+        else:
+            self.find_element(self.TASK_CARD, timeout=10)
+            cards = self.get_cards_snapshot(start=-1, with_elements=True)
+            assert len(cards) > 0, "Карточки задач не найдены на дашборде"
+            card = cards[0]['element']
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
 
         try:
-            last_card.click()
+            card.click()
         except Exception:
-            self.driver.execute_script("arguments[0].click();", last_card)
+            self.driver.execute_script("arguments[0].click();", card)
 
-        time.sleep(0.5)
         from .create_task_page import CreateTaskPage
-        return CreateTaskPage(self.driver)
-
-    def find_task_by_title(self, title, timeout=10):
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            try:
-                cards = self.find_elements(self.TASK_CARD, timeout=5)
-            except TimeoutException:
-                time.sleep(0.5)
-                continue
-
-            last_card = cards[-1]
-            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'end'});", last_card)
-            time.sleep(0.3)
-
-            try:
-                card_text = last_card.text
-
-                if title not in card_text:
-                    time.sleep(0.5)
-                    continue
-
-                title_elems = last_card.find_elements(By.CSS_SELECTOR, "h4, h5, h6")
-                if title_elems and title_elems[0].text.strip() == title:
-                    return last_card
-
-                time.sleep(0.5)
-                continue
-
-            except Exception:
-                time.sleep(0.5)
-                continue
-
-        raise AssertionError(f"Задача с названием '{title}' не найдена за {timeout} секунд")
+        edit_task_page = CreateTaskPage(self.driver)
+        edit_task_page.wait_for_modal_mounted(CreateTaskPage.MODAL_UPDATE_TITLE)
+        return edit_task_page
+
+    def get_cards_snapshot(self, start=None, end=None, with_elements=False):
+        """
+        Данные карточек задач за один вызов execute_script.
+        В виртуализированном или постраничном списке - только карточки, которые сейчас в DOM
+
+        :param start: Индекс первой карточки (как в срезе, допускаются отрицательные)
+        :param end: Индекс после последней карточки
+        :param with_elements: Добавить в результат WebElement карточки (ключ 'element')
+        :return: Список словарей title, status, board, assignee, index
+        """
+        cards = self.driver.execute_script(self.CARDS_SNAPSHOT_JS, self.TASK_CARD[1], start, end, with_elements)
+        return [self._build_task_info(card, with_elements) for card in cards]
+
+    def find_tasks(self, field, value, with_elements=False):
+        """
+        Поиск карточек по индексу в странице без ожидания
+
+        :param field: 'title', 'board' или 'assignee'
+        :param value: Значение поля
+        :param with_elements: Добавить в результат WebElement карточки (ключ 'element')
+        :return: Список данных карточек в порядке на странице
+        """
+        cards = self.driver.execute_script(self.TASK_LOOKUP_JS, self.TASK_CARD[1], field, value, with_elements)
+        return [self._build_task_info(card, with_elements) for card in cards]
+
+    def mark_existing_tasks(self, field, value):
+        """
+        Отметка карточек с указанным значением поля, которые уже есть на странице.
+        Вызывается до создания задачи: повторяющиеся названия не должны находиться
+        как только что созданная карточка
+
+        :param field: 'title', 'board' или 'assignee'
+        :param value: Значение поля
+        :return: Отметка для wait_for_task(known=...)
+        """
+        return self.driver.execute_script(self.TASK_MARK_JS, self.TASK_CARD[1], field, value)
+
+    def expect_new_task(self, title, known=None, task_id=None):
+        """
+        Запоминает, как отличить созданную задачу от старых с тем же названием:
+        verify_task_created и find_task_by_title будут ждать только новую карточку
+
+        :param title: Название созданной задачи
+        :param known: Отметка mark_existing_tasks, сделанная до создания
+        :param task_id: id задачи из ответа на создание
+        """
+        self._new_tasks[title] = {'known': known, 'task_id': task_id}
+
+    def find_tasks_by_board(self, board):
+        return self.find_tasks('board', board)
+
+    def find_tasks_by_assignee(self, assignee):
+        return self.find_tasks('assignee', assignee)
+
+    def wait_for_task(self, field, value, timeout=10, scan=False, restore=True, known=None, task_id=None):
+        """
+        Ожидание появления карточки с указанным значением поля.
+        Возвращается сразу, как только MutationObserver проиндексирует карточку.
+
+        По умолчанию ожидание ничего не меняет на странице. С scan=True, если за SCAN_DELAY
+        карточка не появилась, виртуализированный или постраничный список обходится
+        в странице от конца к началу, без запроса всех карточек, а перед возвратом
+        прокрутка и страница списка восстанавливаются (restore=False оставляет список
+        там, где нашлась карточка).
+
+        :param field: 'title', 'board' или 'assignee'
+        :param value: Значение поля
+        :param timeout: Время ожидания в секундах
+        :param scan: Обходить список, если карточки нет в DOM
+        :param restore: Вернуть прокрутку и страницу после обхода
+        :param known: Отметка mark_existing_tasks: отмеченные карточки не подходят
+        :param task_id: id задачи; карточки с другим data-task-id не подходят
+        :return: Данные последней на странице подходящей карточки, включая 'element'
+                 (после обхода с restore=True элемент может быть уже не в DOM)
+        """
+        pager_selectors = [self._current(locator)[1] for locator in
+                           (self.NEXT_PAGE_BUTTON, self.PREVIOUS_PAGE_BUTTON, self.LAST_PAGE_BUTTON,
+                            self.FIRST_PAGE_BUTTON)]
+        scan_delay_ms = int(self.SCAN_DELAY * 1000) if scan else -1
+        cards = self.execute_async_script(
+            self.TASK_WAIT_JS, self.TASK_CARD[1], field, value, int(timeout * 1000), scan_delay_ms,
+            pager_selectors, restore, known, task_id, timeout=timeout + self.RESTORE_TIMEOUT
+        )
+        if not cards:
+            raise AssertionError(f"Задача с {field} '{value}' не найдена за {timeout} секунд")
+        return self._build_task_info(cards[-1], with_element=True)
+
+    def find_task_by_title(self, title, timeout=10, scan=False, restore=True):
+        return self.wait_for_task('title', title, timeout, scan, restore, **self._new_tasks.get(title, {}))['element']
 
     def get_task_info(self, task_card):
         try:
-            task_info = {
-                'title': None,
-                'status': None,
-                'board': None,
-                'assignee': None
-            }
-
-            title_elems = task_card.find_elements(By.CSS_SELECTOR, "h4, h5, h6")
-            if title_elems:
-                task_info['title'] = title_elems[0].text.strip()
-
-            status_chips = task_card.find_elements(By.CSS_SELECTOR, ".MuiChip-root .MuiChip-label")
-            if status_chips:
-                task_info['status'] = status_chips[0].text.strip()
-
-            description_elems = task_card.find_elements(By.CSS_SELECTOR, "p.MuiTypography-body2")
-            if description_elems:
-                description_text = description_elems[0].text
+            return self._build_task_info(self.driver.execute_script(self.CARD_INFO_JS, task_card))
+        except Exception:
+            return {}
 
-                if "Доска:" in description_text:
-                    board_part = description_text.split("Доска:")[1].split("|")[0].strip()
-                    task_info['board'] = board_part
+    def _build_task_info(self, card, with_element=False):
+        task_info = {
+            'title': card['title'],
+            'status': card['status'],
+            'board': None,
+            'assignee': None
+        }
+        if card['index'] is not None:
+            task_info['index'] = card['index']
+        if with_element:
+            task_info['element'] = card['element']
 
-                if "Исполнитель:" in description_text:
-                    assignee_part = description_text.split("Исполнитель:")[1].strip()
-                    task_info['assignee'] = assignee_part
+        description_text = card['description']
+        if description_text:
+            if "Доска:" in description_text:
+                task_info['board'] = description_text.split("Доска:")[1].split("|")[0].strip()
 
-            return task_info
+            if "Исполнитель:" in description_text:
+                task_info['assignee'] = description_text.split("Исполнитель:")[1].strip()
 
-        except Exception:
-            return {}
+        return task_info
 
     def _validate_title_in_form_data(self, form_data):
         title = form_data.get('title')
@@ -112,9 +459,9 @@ class DashboardPage(BasePage):
             raise AssertionError("Название задачи не указано в form_data")
         return title
 
-    def _find_task_card(self, title, timeout):
-        time.sleep(1)
-        return self.find_task_by_title(title, timeout)
+    def _find_task_info(self, title, timeout, scan=False):
+        self.wait_for_network_idle()
+        return self.wait_for_task('title', title, timeout, scan, **self._new_tasks.get(title, {}))
 
     def _verify_title(self, task_info, expected_title):
         actual_title = task_info.get('title')
@@ -136,10 +483,9 @@ class DashboardPage(BasePage):
         assert actual_assignee == expected_assignee, \
             f"Исполнитель не совпадает: ожидалось '{expected_assignee}', получено '{actual_assignee}'"
 
-    def verify_task_created(self, form_data, timeout=10):
+    def verify_task_created(self, form_data, timeout=10, scan=False):
         title = self._validate_title_in_form_data(form_data)
-        task_card = self._find_task_card(title, timeout)
-        task_info = self.get_task_info(task_card)
+        task_info = self._find_task_info(title, timeout, scan)
 
         self._verify_title(task_info, title)
         self._verify_status(task_info)
@@ -0,0 +1,91 @@
+from selenium.webdriver.common.by import By
+
+
+class Locator(tuple):
+    """
+    Локатор с несколькими стратегиями поиска в порядке предпочтения.
+
+    Ведет себя как кортеж (By, значение) первой объявленной стратегии, поэтому
+    принимается везде, где ожидается обычный локатор. BasePage при разрешении
+    перебирает strategies и переносит сработавшую стратегию в начало списка,
+    чтобы следующие поиски сразу шли по ней.
+    """
+
+    def __new__(cls, *strategies, name=None):
+        locator = super().__new__(cls, strategies[0])
+        locator.strategies = list(strategies)
+        locator.declared = tuple(strategies)
+        locator.name = name
+        return locator
+
+    def __set_name__(self, owner, name):
+        if self.name is None:
+            self.name = f"{owner.__name__}.{name}"
+
+    @property
+    def current(self):
+        """Стратегия, которая сейчас используется первой"""
+        return self.strategies[0]
+
+    def promote(self, strategy):
+        """Переносит стратегию в начало списка"""
+        if strategy in self.strategies and self.strategies[0] != strategy:
+            self.strategies.remove(strategy)
+            self.strategies.insert(0, strategy)
+
+
+class LocatorTemplate:
+    """
+    Шаблон локатора с подстановкой значения вместо '*'.
+
+    Строки стратегий разбиваются на части один раз при объявлении,
+    готовые Locator кэшируются по значению.
+    """
+
+    PLACEHOLDER = '*'
+
+    def __init__(self, *strategies):
+        """
+        :param strategies: Кортежи (By, шаблон) в порядке предпочтения
+        """
+        self.strategies = list(strategies)
+        self.name = None
+        self._parts = [(by, value.split(self.PLACEHOLDER)) for by, value in strategies]
+        self._cache = {}
+
+    def __set_name__(self, owner, name):
+        self.name = f"{owner.__name__}.{name}"
+
+    def __getitem__(self, index):
+        # Совместимость с кортежем (By, шаблон) для get_dynamic_locator
+        return self.strategies[0][index]
+
+    def format(self, value):
+        """
+        Локатор для конкретного значения
+        :param value: Значение для подстановки
+        :return: Locator
+        """
+        value = str(value)
+        locator = self._cache.get(value)
+        if locator is None:
+            strategies = [(by, value.join(parts)) for by, parts in self._parts]
+            locator = self._cache[value] = Locator(*strategies, name=f"{self.name}[{value}]")
+        return locator
+
+
+def collect_locators(*pages):
+    """
+    Все локаторы и шаблоны, объявленные в классах страниц
+    :return: Словарь имя -> Locator или LocatorTemplate
+    """
+    locators = {}
+    for page in pages:
+        for klass in reversed(page.__mro__):
+            for value in vars(klass).values():
+                if isinstance(value, (Locator, LocatorTemplate)):
+                    locators[value.name] = value
+    return locators
+
+
+__all__ = ['By', 'Locator', 'LocatorTemplate', 'collect_locators']
@@ -0,0 +1,3 @@
+from .server import StandInServer, TaskStore
+
+__all__ = ['StandInServer', 'TaskStore']
@@ -0,0 +1,26 @@
+import argparse
+import logging
+
+from .server import StandInServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальная заглушка трекера задач")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--api-url", default="", help="URL API для фронтенда (по умолчанию тот же сервер)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = StandInServer(args.host, args.port, args.api_url)
+    print(f"Заглушка доступна по адресу {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+LOGGING = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+
+BOARDS = [
+    {'id': 1, 'name': 'Редизайн карточки товара'},
+    {'id': 2, 'name': 'Оптимизация производительности'},
+    {'id': 3, 'name': 'Рефакторинг API'},
+    {'id': 4, 'name': 'Миграция на новую БД'},
+    {'id': 5, 'name': 'Автоматизация тестирования'},
+    {'id': 6, 'name': 'Переход на Kubernetes'},
+]
+
+USERS = [
+    {'id': 1, 'fullName': 'Александра Ветрова', 'email': 'ga@avito.ru'},
+    {'id': 2, 'fullName': 'Илья Романов', 'email': 'ir@avito.ru'},
+    {'id': 3, 'fullName': 'Дмитрий Козлов', 'email': 'dk@avito.ru'},
+]
+
+PRIORITIES = ('Low', 'Medium', 'High')
+STATUSES = ('Backlog', 'InProgress', 'Done')
+
+BAD_REQUEST_MESSAGE = "Неверный формат данных"
+
+MAX_SEED_COUNT = 100000
+
+
+class ValidationError(Exception):
+    pass
+
+
+class TaskStore:
+    """
+    Хранилище задач локальной заглушки.
+
+    Повторяет контракт бэкенда, на который опираются page objects, включая
+    обязательное поле description при создании (см. BUGS.MD, баг #1).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tasks = {}
+        self._next_id = 1
+
+    def reset(self):
+        """Удаляет все задачи, нумерация начинается заново"""
+        with self._lock:
+            self._tasks.clear()
+            self._next_id = 1
+
+    def list(self):
+        with self._lock:
+            return [self._serialize(task) for task in self._tasks.values()]
+
+    def create(self, payload):
+        self._require(payload, 'CreateTaskRequest', ('title', 'description', 'boardId', 'assigneeId', 'priority'))
+        board = self._find(BOARDS, payload['boardId'], 'CreateTaskRequest.BoardID')
+        assignee = self._find(USERS, payload['assigneeId'], 'CreateTaskRequest.AssigneeID')
+        self._check_choice(payload['priority'], PRIORITIES, 'CreateTaskRequest.Priority')
+
+        with self._lock:
+            task_id = self._next_id
+            self._next_id += 1
+            self._tasks[task_id] = {
+                'id': task_id,
+                'title': payload['title'],
+                'description': payload['description'],
+                'priority': payload['priority'],
+                'status': 'Backlog',
+                'board': board,
+                'assignee': assignee,
+            }
+        return {'id': task_id}
+
+    def update(self, task_id, payload):
+        self._require(payload, 'UpdateTaskRequest', ('title', 'assigneeId', 'priority', 'status'))
+        assignee = self._find(USERS, payload['assigneeId'], 'UpdateTaskRequest.AssigneeID')
+        self._check_choice(payload['priority'], PRIORITIES, 'UpdateTaskRequest.Priority')
+        self._check_choice(payload['status'], STATUSES, 'UpdateTaskRequest.Status')
+
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                raise LookupError(f"Задача {task_id} не найдена")
+            task.update({
+                'title': payload['title'],
+                'description': payload.get('description', task['description']),
+                'priority': payload['priority'],
+                'status': payload['status'],
+                'assignee': assignee,
+            })
+        return {'message': "Задача обновлена"}
+
+    def seed(self, count, title_prefix='Нагрузка'):
+        """
+        Массовое создание задач для замеров на большом дашборде (без проверок create)
+        :param count: Количество задач
+        :param title_prefix: Префикс названия, к нему добавляется id задачи
+        :return: Список id созданных задач
+        """
+        if not isinstance(count, int) or not 0 < count <= MAX_SEED_COUNT:
+            raise ValidationError(f"count должно быть числом от 1 до {MAX_SEED_COUNT}")
+        with self._lock:
+            task_ids = list(range(self._next_id, self._next_id + count))
+            self._next_id += count
+            for number, task_id in enumerate(task_ids):
+                self._tasks[task_id] = {
+                    'id': task_id,
+                    'title': f"{title_prefix}_{task_id}",
+                    'description': "Описание",
+                    'priority': PRIORITIES[number % len(PRIORITIES)],
+                    'status': 'Backlog',
+                    'board': BOARDS[number % len(BOARDS)],
+                    'assignee': USERS[number % len(USERS)],
+                }
+        return task_ids
+
+    def delete(self, task_ids):
+        """
+        Удаление задач (есть только у заглушки, для очистки после тестов)
+        :param task_ids: Идентификаторы задач, неизвестные пропускаются
+        :return: Количество удаленных задач
+        """
+        if not isinstance(task_ids, list):
+            raise ValidationError("ids должно быть списком")
+        with self._lock:
+            return sum(self._tasks.pop(int(task_id), None) is not None for task_id in task_ids)
+
+    def _serialize(self, task):
+        return {
+            'id': task['id'],
+            'title': task['title'],
+            'description': task['description'],
+            'priority': task['priority'],
+            'status': task['status'],
+            'boardId': task['board']['id'],
+            'boardName': task['board']['name'],
+            'assignee': task['assignee'],
+        }
+
+    def _require(self, payload, request_name, fields):
+        for field in fields:
+            if payload.get(field) in (None, ''):
+                name = field[0].upper() + field[1:].replace('Id', 'ID')
+                raise ValidationError(
+                    f"Key: '{request_name}.{name}' Error:Field validation for '{name}' failed on the 'required' tag"
+                )
+
+    def _find(self, items, item_id, field):
+        for item in items:
+            if item['id'] == item_id:
+                return item
+        raise ValidationError(f"Key: '{field}' Error:unknown id {item_id}")
+
+    def _check_choice(self, value, choices, field):
+        if value not in choices:
+            raise ValidationError(f"Key: '{field}' Error:Field validation for '{field}' failed on the 'oneof' tag")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов заглушки: API задач и одностраничный дашборд"""
+
+    UPDATE_PATH = re.compile(r'^/api/v1/tasks/update/(\d+)$')
+    DELETE_PATH = re.compile(r'^/api/v1/tasks/(\d+)$')
+
+    def do_OPTIONS(self):
+        self.server.count_request('OPTIONS')
+        self._send(204, b'')
+
+    def do_GET(self):
+        self.server.count_request('GET')
+        path = urlsplit(self.path).path
+        if path == '/api/v1/tasks':
+            self._send_json(200, {'data': self.server.store.list()})
+        elif path == '/api/v1/boards':
+            self._send_json(200, {'data': BOARDS})
+        elif path == '/api/v1/users':
+            self._send_json(200, {'data': USERS})
+        elif path.startswith('/api/'):
+            self._send_json(404, {'error': 'not found', 'message': "Ресурс не найден"})
+        else:
+            self._send(200, self.server.index_html, 'text/html; charset=utf-8')
+
+    def do_POST(self):
+        self.server.count_request('POST')
+        path = urlsplit(self.path).path
+        if path == '/api/v1/tasks/create':
+            self._handle(lambda payload: self.server.store.create(payload))
+        elif path == '/api/v1/tasks/seed':
+            self._handle(lambda payload: self._seed(payload))
+        elif path == '/api/v1/tasks/delete':
+            self._handle(lambda payload: {'deleted': self.server.store.delete(payload.get('ids'))})
+        else:
+            self._send_json(404, {'error': 'not found', 'message': "Ресурс не найден"})
+
+    def do_PUT(self):
+        self.server.count_request('PUT')
+        match = self.UPDATE_PATH.match(urlsplit(self.path).path)
+        if match:
+            self._handle(lambda payload: self.server.store.update(int(match.group(1)), payload))
+        else:
+            self._send_json(404, {'error': 'not found', 'message': "Ресурс не найден"})
+
+    def do_DELETE(self):
+        self.server.count_request('DELETE')
+        match = self.DELETE_PATH.match(urlsplit(self.path).path)
+        if match and self.server.store.delete([int(match.group(1))]):
+            self._send_json(200, {'data': {'deleted': 1}})
+        else:
+            self._send_json(404, {'error': 'not found', 'message': "Задача не найдена"})
+
+    def _seed(self, payload):
+        task_ids = self.server.store.seed(payload.get('count'), payload.get('titlePrefix') or 'Нагрузка')
+        return {'created': len(task_ids), 'firstId': task_ids[0], 'lastId': task_ids[-1]}
+
+    def log_message(self, format, *args):
+        LOGGING.debug(format, *args)
+
+    def _handle(self, action):
+        try:
+            payload = json.loads(self._read_body() or b'{}')
+            if not isinstance(payload, dict):
+                raise ValidationError("тело запроса должно быть JSON объектом")
+            self._send_json(200, {'data': action(payload)})
+        except (ValueError, ValidationError) as e:
+            self._send_json(400, {'error': str(e), 'message': BAD_REQUEST_MESSAGE})
+        except LookupError as e:
+            self._send_json(404, {'error': str(e), 'message': "Задача не найдена"})
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send_json(self, status, body):
+        self._send(status, json.dumps(body, ensure_ascii=False).encode('utf-8'), 'application/json')
+
+    def _send(self, status, body, content_type=None):
+        self.send_response(status)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StandInServer:
+    """
+    Локальная заглушка фронтенда и бэкенда трекера задач.
+
+    Отдает дашборд с DOM, совпадающим с локаторами DashboardPage и
+    CreateTaskPage, и реализует API создания, обновления и получения задач.
+    Дашборд рисует список целиком, а с ?render=virtual или ?render=paged
+    (&pageSize=N) - виртуализированным окном или постранично, как большие доски.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, api_url=''):
+        """
+        :param host: Адрес для прослушивания
+        :param port: Порт (0 - свободный порт)
+        :param api_url: URL API, который использует фронтенд (по умолчанию тот же сервер)
+        """
+        self.httpd = ThreadingHTTPServer((host, port), StandInHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = TaskStore()
+        self.httpd.request_counts = Counter()
+        self.httpd.request_lock = threading.Lock()
+        self.httpd.count_request = self._count_request
+        with open(os.path.join(STATIC_DIR, 'index.html'), encoding='utf-8') as f:
+            index_html = f.read().replace('__API_URL__', api_url.rstrip('/'))
+        self.httpd.index_html = index_html.encode('utf-8')
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def store(self):
+        return self.httpd.store
+
+    @property
+    def request_count(self):
+        """Количество обработанных HTTP запросов с момента запуска"""
+        with self.httpd.request_lock:
+            return sum(self.httpd.request_counts.values())
+
+    def _count_request(self, method):
+        with self.httpd.request_lock:
+            self.httpd.request_counts[method] += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='stand-in', daemon=True)
+        self._thread.start()
+        LOGGING.info(f"Локальная заглушка запущена: {self.url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
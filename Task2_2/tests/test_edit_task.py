@@ -9,7 +9,7 @@ def test_edit_task_status_field(browser, created_task):
     Редактирование статуса задачи
     """
     dashboard = DashboardPage(browser)
-    edit_task_page = dashboard.open_edit_task_form()
+    edit_task_page = dashboard.open_edit_task_form(created_task)
     edit_task_page.select_status('InProgress')
     edit_task_page.update_form()
 
@@ -20,7 +20,7 @@ def test_edit_task_priority_and_status(browser, created_task):
     Редактирование полей задачи (приоритет и статус)
     """
     dashboard = DashboardPage(browser)
-    edit_task_page = dashboard.open_edit_task_form()
+    edit_task_page = dashboard.open_edit_task_form(created_task)
     edit_task_page.select_priority('High') \
                     .select_status('InProgress')
     edit_task_page.update_form()
@@ -0,0 +1,9 @@
+import pytest
+
+from utils.task_registry import CreatedTaskRegistry
+
+
+@pytest.fixture(scope="session", autouse=True)
+def created_tasks():
+    """Модульным тестам не нужен API трекера: реестр задач без очистки"""
+    return CreatedTaskRegistry()
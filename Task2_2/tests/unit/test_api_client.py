@@ -0,0 +1,54 @@
+"""
+Тест-кейсы массового удаления задач через API клиент
+"""
+import json
+
+import pytest
+import requests
+
+from utils.api_client import TaskApiClient
+
+
+def make_response(status_code, body):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+    return response
+
+
+@pytest.fixture
+def api_client():
+    client = TaskApiClient('http://stand-in')
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize(
+    "body,deleted",
+    [
+        pytest.param({'data': {'deleted': 2}}, 2, id="ответ_с_количеством"),
+        pytest.param({'deleted': 1}, 1, id="без_data"),
+        pytest.param({'data': []}, 3, id="data_список"),
+        pytest.param([1, 2, 3], 3, id="тело_список"),
+        pytest.param(b'', 3, id="пустое_тело"),
+        pytest.param(b'OK', 3, id="не_json"),
+    ]
+)
+def test_bulk_delete_response_body(api_client, monkeypatch, body, deleted):
+    monkeypatch.setattr(api_client, '_send', lambda method, path, **kwargs: make_response(200, body))
+
+    assert api_client.delete_tasks([1, 2, 3]) == deleted
+
+
+def test_delete_falls_back_to_single_requests(api_client, monkeypatch):
+    sent = []
+
+    def send(method, path, **kwargs):
+        sent.append((method, path))
+        return make_response(404 if path == TaskApiClient.BULK_DELETE_API[1] else 200, {})
+
+    monkeypatch.setattr(api_client, '_send', send)
+
+    assert api_client.delete_tasks([1, 2]) == 2
+    assert sorted(sent) == [('DELETE', '/api/v1/tasks/1'), ('DELETE', '/api/v1/tasks/2'),
+                            ('POST', '/api/v1/tasks/delete')]
@@ -0,0 +1,37 @@
+"""
+Тест-кейсы определения неизменяемых ресурсов кэша статики
+"""
+import pytest
+
+from utils.asset_cache import AssetCache
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        pytest.param("http://host/assets/index-BxYz12ab.js", id="vite_чанк"),
+        pytest.param("http://host/static/css/main.3f9a8c1d.css", id="webpack_hex"),
+        pytest.param("http://host/static/js/vendor.deadbeefcafe.js", id="hex_без_цифр"),
+        pytest.param("http://host/assets/Roboto-Regular-Ab3dEf9h.woff2?v=1", id="шрифт_с_query"),
+    ]
+)
+def test_hashed_name_is_immutable(url):
+    assert AssetCache._is_immutable(url, {})
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        pytest.param("http://host/js/react-dom.production.js", id="react_dom"),
+        pytest.param("http://host/css/theme-bootstrap.css", id="bootstrap"),
+        pytest.param("http://host/js/jquery.slim.min.js", id="jquery_slim"),
+        pytest.param("http://host/img/background.png", id="картинка"),
+        pytest.param("http://host/assets/index.js", id="без_хэша"),
+    ]
+)
+def test_plain_name_is_not_immutable(url):
+    assert not AssetCache._is_immutable(url, {})
+
+
+def test_immutable_cache_control():
+    assert AssetCache._is_immutable("http://host/js/app.js", {'Cache-Control': 'public, max-age=31536000, Immutable'})
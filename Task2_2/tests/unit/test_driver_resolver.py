@@ -0,0 +1,50 @@
+"""
+Тест-кейсы поиска chromedriver с локальным кэшем
+"""
+import json
+import os
+import stat
+import sys
+
+import pytest
+
+from utils.driver_resolver import DRIVER_NAME, ChromeDriverResolver
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith('win'), reason="Бинарники Chrome и драйвера - shell скрипты")
+
+
+def fake_binary(path, output):
+    with open(path, 'w') as f:
+        f.write(f"#!/bin/sh\necho '{output}'\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return str(path)
+
+
+@pytest.fixture
+def chrome(tmp_path):
+    return fake_binary(tmp_path / 'chrome', 'Google Chrome 120.0.6099.109')
+
+
+def test_offline_driver_is_cached_in_manifest(tmp_path, chrome):
+    offline_dir = tmp_path / 'drivers'
+    (offline_dir / '120').mkdir(parents=True)
+    driver_path = fake_binary(offline_dir / '120' / DRIVER_NAME, 'ChromeDriver 120.0.6099.109 (abc)')
+    resolver = ChromeDriverResolver(str(tmp_path / 'cache'), str(offline_dir), chrome)
+
+    assert resolver.resolve() == driver_path
+
+    with open(tmp_path / 'cache' / ChromeDriverResolver.MANIFEST_NAME, encoding='utf-8') as f:
+        manifest = json.load(f)
+    assert manifest['drivers'] == {'120': driver_path}
+    assert manifest['browsers'][chrome]['full_version'] == '120.0.6099.109'
+
+
+def test_driver_with_other_major_is_not_cached(tmp_path, chrome):
+    offline_dir = tmp_path / 'drivers'
+    offline_dir.mkdir()
+    fake_binary(offline_dir / DRIVER_NAME, 'ChromeDriver 119.0.6045.105 (abc)')
+    resolver = ChromeDriverResolver(str(tmp_path / 'cache'), str(offline_dir), chrome)
+
+    with pytest.raises(RuntimeError, match="chromedriver 119 не подходит для Chrome 120"):
+        resolver.resolve()
+    assert not os.path.exists(tmp_path / 'cache' / ChromeDriverResolver.MANIFEST_NAME)
@@ -0,0 +1,103 @@
+"""
+Тест-кейсы индекса перехваченных запросов и ожидания API запросов в page objects
+"""
+import threading
+import time
+import uuid
+
+import pytest
+
+from pages.create_task_page import CreateTaskPage
+from utils.network_capture import CaptureConfig, CaptureIndex, CapturedResponse
+
+CREATE = ('POST', '/api/v1/tasks/create')
+
+
+def push(index, method, url, status=200):
+    return index.push(method, url, {}, b'{}', CapturedResponse(status, {}, b'{}'))
+
+
+def test_wait_for_returns_only_exchanges_after_cursor():
+    index = CaptureIndex(CaptureConfig([CREATE], []))
+    push(index, 'POST', 'http://host/api/v1/tasks/create')
+    cursor = index.cursor()
+    assert index.wait_for(*CREATE, after=cursor, timeout=0) is None
+
+    exchange = push(index, 'POST', 'http://host/api/v1/tasks/create')
+    assert index.wait_for(*CREATE, after=cursor, timeout=0) is exchange
+
+
+def test_wait_for_wakes_up_on_push():
+    index = CaptureIndex(CaptureConfig([CREATE], []))
+    timer = threading.Timer(0.1, push, (index, 'POST', 'http://host/api/v1/tasks/create'))
+    timer.start()
+    start = time.monotonic()
+    exchange = index.wait_for(*CREATE, timeout=5)
+    timer.join()
+
+    assert exchange is not None and exchange.seq == 1
+    assert time.monotonic() - start < 1
+
+
+def test_wait_for_timeout():
+    index = CaptureIndex(CaptureConfig([CREATE], []))
+    push(index, 'GET', 'http://host/api/v1/tasks')
+    start = time.monotonic()
+
+    assert index.wait_for(*CREATE, timeout=0.2) is None
+    assert time.monotonic() - start >= 0.2
+
+
+def test_ring_buffer_eviction():
+    index = CaptureIndex(CaptureConfig([CREATE], [], buffer_size=3))
+    for number in range(5):
+        push(index, 'GET', f'http://host/api/v1/tasks/{number}')
+    created = [push(index, 'POST', 'http://host/api/v1/tasks/create') for _ in range(4)]
+
+    assert [exchange.url for exchange in index.recent_other()] == [
+        f'http://host/api/v1/tasks/{number}' for number in (2, 3, 4)
+    ]
+    assert index.wait_for(*CREATE, timeout=0) is created[1]
+    assert [exchange.seq for exchange in index.exchanges()] == [3, 4, 5, 7, 8, 9]
+
+
+def test_clear_keeps_cursor_growing():
+    index = CaptureIndex(CaptureConfig([CREATE], []))
+    push(index, 'POST', 'http://host/api/v1/tasks/create')
+    index.clear()
+
+    assert index.exchanges() == []
+    assert push(index, 'GET', 'http://host/api/v1/tasks').seq == 2
+
+
+class FakeRequest:
+    def __init__(self, method, url, status=200):
+        self.id = str(uuid.uuid4())
+        self.method = method
+        self.url = url
+        self.body = b'{}'
+        self.response = CapturedResponse(status, {}, b'{}')
+
+
+class FakeWireDriver:
+    """Драйвер selenium-wire без capture_index: только driver.requests"""
+
+    def __init__(self, requests):
+        self.requests = requests
+
+
+def test_create_page_falls_back_to_driver_requests():
+    old = FakeRequest('POST', 'http://host/api/v1/tasks/create')
+    driver = FakeWireDriver([old])
+    page = CreateTaskPage(driver)
+    new = FakeRequest('POST', 'http://host/api/v1/tasks/create', status=201)
+    driver.requests.append(new)
+
+    assert page._wait_for_api_request(*CREATE, timeout=1) is new
+
+
+def test_create_page_without_network_capture():
+    page = CreateTaskPage(object())
+
+    with pytest.raises(RuntimeError, match="Драйвер не перехватывает сеть"):
+        page._wait_for_api_request(*CREATE, timeout=0)
@@ -0,0 +1,114 @@
+"""
+Тест-кейсы записи и воспроизведения кассет обменов с API
+"""
+import json
+
+import pytest
+
+from utils.network_cassette import CASSETTE_HEADER, Cassette, cassette_path
+
+SCOPES = [r'.*/api/v1/.*']
+
+
+class FakeRequest:
+    """Запрос selenium-wire: replay отвечает через create_response"""
+
+    def __init__(self, method, url):
+        self.method = method
+        self.url = url
+        self.response = None
+
+    def create_response(self, status_code, headers, body):
+        self.response = {'status': status_code, 'headers': headers, 'body': body}
+
+
+def entry(method, url, status, body):
+    return {
+        'request': {'method': method, 'url': url, 'headers': []},
+        'response': {
+            'status': status,
+            'headers': [{'name': 'Content-Type', 'value': 'application/json'}],
+            'content': {'size': len(body), 'mimeType': 'application/json', 'text': body},
+        },
+    }
+
+
+def replay(cassette, method, url):
+    request = FakeRequest(method, url)
+    cassette.replay(None, request)
+    return request.response
+
+
+@pytest.fixture
+def cassette(tmp_path):
+    entries = [
+        entry('GET', 'http://recorded-host/api/v1/tasks', 200, '{"data": []}'),
+        entry('POST', 'http://recorded-host/api/v1/tasks/create', 200, '{"data": {"id": 7}}'),
+        entry('GET', 'http://recorded-host/api/v1/tasks', 200, '{"data": [{"id": 7}]}'),
+        entry('GET', 'http://recorded-host/api/v1/tasks?boardId=1', 200, '{"data": ["board"]}'),
+    ]
+    return Cassette(str(tmp_path / 'case.har'), 'replay', SCOPES, entries)
+
+
+def test_replay_matches_by_method_and_path_without_host(cassette):
+    response = replay(cassette, 'POST', 'http://127.0.0.1:8000/api/v1/tasks/create')
+
+    assert response['status'] == 200
+    assert json.loads(response['body']) == {'data': {'id': 7}}
+    assert response['headers'][CASSETTE_HEADER] == 'replay'
+    assert response['headers']['Content-Length'] == str(len(response['body']))
+
+
+def test_replay_query_is_part_of_key(cassette):
+    assert json.loads(replay(cassette, 'GET', 'http://host/api/v1/tasks?boardId=1')['body']) == {'data': ['board']}
+    assert replay(cassette, 'GET', 'http://host/api/v1/tasks?boardId=2')['status'] == 404
+
+
+def test_replay_is_sequential_and_repeats_last_entry(cassette):
+    bodies = [json.loads(replay(cassette, 'GET', 'http://host/api/v1/tasks')['body']) for _ in range(3)]
+
+    assert bodies == [{'data': []}, {'data': [{'id': 7}]}, {'data': [{'id': 7}]}]
+    assert cassette.misses == []
+
+
+def test_replay_miss_returns_404(cassette):
+    response = replay(cassette, 'PUT', 'http://host/api/v1/tasks/update/7')
+
+    assert response['status'] == 404
+    assert response['headers'][CASSETTE_HEADER] == 'miss'
+    assert cassette.misses == ['PUT http://host/api/v1/tasks/update/7']
+
+
+def test_replay_skips_out_of_scope_requests(cassette):
+    assert replay(cassette, 'GET', 'http://host/assets/index-BxYz12ab.js') is None
+
+
+def test_seeded_titles_round_trip(tmp_path):
+    recorded = Cassette(str(tmp_path / 'module' / 'case.har'), 'record', SCOPES)
+    recorded.add_seed(['Тест_1', 'Тест_2'])
+    recorded.save()
+
+    loaded = Cassette.load(recorded.path, SCOPES)
+    assert loaded.next_seed() == ['Тест_1', 'Тест_2']
+    with pytest.raises(AssertionError, match="нет данных фикстуры"):
+        loaded.next_seed()
+
+
+@pytest.mark.parametrize(
+    "test_name,expected",
+    [
+        pytest.param("test_edit[Low-1]", "test_edit[Low-1].har", id="параметры"),
+        pytest.param("test_titles[a b/c]", "test_titles[a_b_c].har", id="спецсимволы"),
+    ]
+)
+def test_cassette_path(test_name, expected):
+    assert cassette_path('/cassettes', '/repo/tests/test_edit_task.py', test_name) == \
+        f"/cassettes/test_edit_task/{expected}"
+
+
+def test_cassette_path_long_name_is_shortened():
+    path = cassette_path('/cassettes', 'test_create_task.py', 'test_titles[' + 'a' * 300 + ']')
+
+    name = path.split('/')[-1]
+    assert len(name) == len('.har') + 111
+    assert path != cassette_path('/cassettes', 'test_create_task.py', 'test_titles[' + 'a' * 301 + ']')
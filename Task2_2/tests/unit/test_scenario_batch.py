@@ -0,0 +1,63 @@
+"""
+Тест-кейсы группировки параметризованных случаев в одну страницу
+"""
+from types import SimpleNamespace
+
+from utils.scenario_batch import ScenarioBatcher
+
+
+def make_item(nodeid, fixtures, params=None, scopes=None, passed=True):
+    """pytest.Item с полями, которые читает ScenarioBatcher"""
+    scopes = scopes or {}
+    name2fixturedefs = {name: [SimpleNamespace(scope=scopes.get(name, 'function'))] for name in fixtures}
+    return SimpleNamespace(
+        nodeid=nodeid,
+        fixturenames=list(fixtures),
+        callspec=SimpleNamespace(params=params) if params is not None else None,
+        _fixtureinfo=SimpleNamespace(name2fixturedefs=name2fixturedefs),
+        rep_call=SimpleNamespace(passed=passed),
+    )
+
+
+def case(test, param, fixtures=('request', 'browser', 'driver'), **kwargs):
+    return make_item(f"tests/test_create_task.py::{test}[{param}]", (*fixtures, 'title'), {'title': param}, **kwargs)
+
+
+def test_batch_key_groups_cases_of_one_test():
+    first, second = case('test_titles', 'a'), case('test_titles', 'b')
+
+    assert ScenarioBatcher.batch_key(first) is not None
+    assert ScenarioBatcher.batch_key(first) == ScenarioBatcher.batch_key(second)
+
+
+def test_batch_key_skips_not_batchable_cases():
+    not_parametrized = make_item("tests/test_edit_task.py::test_edit", ('browser', 'driver'))
+    without_browser = case('test_titles', 'a', fixtures=('request',))
+    with_data = case('test_titles', 'a', fixtures=('browser', 'driver', 'created_task'))
+    session_fixture = case('test_titles', 'a', fixtures=('browser', 'driver', 'base_url'),
+                           scopes={'base_url': 'session'})
+
+    assert ScenarioBatcher.batch_key(not_parametrized) is None
+    assert ScenarioBatcher.batch_key(without_browser) is None
+    assert ScenarioBatcher.batch_key(with_data) is None
+    assert ScenarioBatcher.batch_key(session_fixture) is not None
+
+
+def test_plan_puts_group_cases_together_and_keeps_order():
+    items = [case('test_titles', 'a'), make_item("tests/test_edit_task.py::test_edit", ('browser',)),
+             case('test_descriptions', 'a'), case('test_titles', 'b'), case('test_descriptions', 'b')]
+
+    planned = ScenarioBatcher().plan(items)
+
+    assert [item.nodeid.split('::')[1] for item in planned] == [
+        'test_titles[a]', 'test_titles[b]', 'test_edit', 'test_descriptions[a]', 'test_descriptions[b]'
+    ]
+
+
+def test_keeps_page_only_inside_group_after_passed_case():
+    failed = case('test_titles', 'b', passed=False)
+    items = [case('test_titles', 'a'), failed, case('test_titles', 'c'), case('test_descriptions', 'a')]
+    batcher = ScenarioBatcher()
+    planned = batcher.plan(items)
+
+    assert [batcher.keeps_page(item) for item in planned] == [True, False, False, False]
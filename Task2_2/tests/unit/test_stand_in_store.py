@@ -0,0 +1,77 @@
+"""
+Тест-кейсы хранилища задач локальной заглушки
+"""
+import pytest
+
+from stand_in import TaskStore
+from stand_in.server import MAX_SEED_COUNT, ValidationError
+
+TASK = {'title': 'Тест_1', 'description': 'Описание', 'boardId': 2, 'assigneeId': 1, 'priority': 'Low'}
+
+
+@pytest.fixture
+def store():
+    return TaskStore()
+
+
+def test_create_and_list(store):
+    assert store.create(TASK) == {'id': 1}
+    assert store.create(dict(TASK, title='Тест_2')) == {'id': 2}
+
+    tasks = store.list()
+    assert [task['title'] for task in tasks] == ['Тест_1', 'Тест_2']
+    assert tasks[0]['status'] == 'Backlog'
+    assert tasks[0]['boardName'] == 'Оптимизация производительности'
+    assert tasks[0]['assignee']['id'] == 1
+
+
+@pytest.mark.parametrize(
+    "payload,message",
+    [
+        pytest.param(dict(TASK, description=''), "Description", id="без_описания"),
+        pytest.param(dict(TASK, boardId=None), "BoardID", id="без_доски"),
+        pytest.param(dict(TASK, boardId=99), "unknown id 99", id="неизвестная_доска"),
+        pytest.param(dict(TASK, priority='Urgent'), "oneof", id="неизвестный_приоритет"),
+    ]
+)
+def test_create_validation(store, payload, message):
+    with pytest.raises(ValidationError, match=message):
+        store.create(payload)
+    assert store.list() == []
+
+
+def test_update(store):
+    task_id = store.create(TASK)['id']
+    store.update(task_id, {'title': 'Новое', 'assigneeId': 2, 'priority': 'High', 'status': 'InProgress'})
+
+    task = store.list()[0]
+    assert (task['title'], task['priority'], task['status'], task['description']) == \
+        ('Новое', 'High', 'InProgress', 'Описание')
+    with pytest.raises(LookupError):
+        store.update(99, {'title': 'Новое', 'assigneeId': 2, 'priority': 'High', 'status': 'Done'})
+
+
+def test_seed_continues_numbering(store):
+    store.create(TASK)
+
+    assert store.seed(3, 'Нагрузка') == [2, 3, 4]
+    assert [task['title'] for task in store.list()[1:]] == ['Нагрузка_2', 'Нагрузка_3', 'Нагрузка_4']
+    with pytest.raises(ValidationError):
+        store.seed(MAX_SEED_COUNT + 1)
+
+
+def test_delete_skips_unknown_ids(store):
+    store.seed(3)
+
+    assert store.delete([1, '3', 42]) == 2
+    assert [task['id'] for task in store.list()] == [2]
+    with pytest.raises(ValidationError):
+        store.delete(2)
+
+
+def test_reset_restarts_numbering(store):
+    store.seed(2)
+    store.reset()
+
+    assert store.list() == []
+    assert store.create(TASK) == {'id': 1}
@@ -0,0 +1,45 @@
+"""
+Тест-кейсы реестра задач, созданных за сессию
+"""
+import pytest
+
+from utils.task_registry import CreatedTaskRegistry
+
+
+class FakeApiClient:
+    def __init__(self, error=None):
+        self.deleted = []
+        self.error = error
+
+    def delete_tasks(self, task_ids):
+        if self.error is not None:
+            raise self.error
+        self.deleted.append(list(task_ids))
+        return len(task_ids)
+
+
+def test_cleanup_deletes_registered_tasks_in_one_call():
+    registry = CreatedTaskRegistry()
+    for task_id in (3, 1, 3, 2):
+        registry.add(task_id)
+    api_client = FakeApiClient()
+
+    assert registry.cleanup(api_client) == 3
+    assert api_client.deleted == [[1, 2, 3]]
+    assert len(registry) == 0
+
+
+def test_cleanup_without_tasks_does_not_call_api():
+    api_client = FakeApiClient()
+
+    assert CreatedTaskRegistry().cleanup(api_client) == 0
+    assert api_client.deleted == []
+
+
+def test_failed_cleanup_keeps_tasks():
+    registry = CreatedTaskRegistry()
+    registry.add(1)
+
+    with pytest.raises(AssertionError):
+        registry.cleanup(FakeApiClient(AssertionError("500")))
+    assert registry.ids() == [1]
@@ -0,0 +1,129 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pages.create_task_page import CreateTaskPage
+
+LOGGING = logging.getLogger(__name__)
+
+
+class TaskApiClient:
+    """
+    HTTP клиент для эндпоинтов задач, которые проверяют page objects.
+
+    Используется для подготовки данных в обход UI и очистки после сессии. Все
+    запросы идут через один requests.Session с пулом keep-alive соединений.
+    """
+
+    # Массовое удаление есть у локальной заглушки, DELETE по задаче - запасной вариант
+    BULK_DELETE_API = ('POST', '/api/v1/tasks/delete')
+    DELETE_TASK_API = ('DELETE', '/api/v1/tasks/')
+    # Ответы бэкенда без поддержки удаления
+    UNSUPPORTED_STATUSES = (404, 405, 501)
+
+    def __init__(self, api_url, pool_size=10, timeout=10):
+        """
+        :param api_url: Базовый URL бэкенда без /api/v1
+        :param pool_size: Размер пула соединений и число потоков при массовом создании
+        :param timeout: Таймаут запроса в секундах
+        """
+        self.api_url = api_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def create_task(self, title, description, board_id, assignee_id, priority):
+        """
+        Создание задачи
+        :return: Данные из ответа бэкенда (содержат id задачи)
+        """
+        payload = {
+            'title': title,
+            'description': description,
+            'boardId': int(board_id),
+            'assigneeId': int(assignee_id),
+            'priority': priority,
+        }
+        return self._request(*CreateTaskPage.CREATE_TASK_API, json=payload)
+
+    def update_task(self, task_id, title, description, assignee_id, priority, status):
+        """
+        Обновление задачи
+        :return: Данные из ответа бэкенда
+        """
+        payload = {
+            'title': title,
+            'description': description,
+            'assigneeId': int(assignee_id),
+            'priority': priority,
+            'status': status,
+        }
+        method, path = CreateTaskPage.UPDATE_TASK_API
+        return self._request(method, f"{path}{task_id}", json=payload)
+
+    def create_tasks(self, tasks):
+        """
+        Массовое создание задач параллельными запросами через общий пул соединений
+        :param tasks: Список словарей с аргументами create_task()
+        :return: Список ответов в порядке tasks
+        """
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return list(executor.map(lambda task: self.create_task(**task), tasks))
+
+    def delete_tasks(self, task_ids):
+        """
+        Массовое удаление задач: один запрос на массовое удаление, а если бэкенд его
+        не поддерживает - параллельные DELETE по задаче через общий пул соединений
+        :param task_ids: Идентификаторы задач
+        :return: Количество удаленных задач
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return 0
+
+        response = self._send(*self.BULK_DELETE_API, json={'ids': task_ids})
+        if response.ok:
+            LOGGING.info(f"{self.BULK_DELETE_API[0]} {self.BULK_DELETE_API[1]}: {response.status_code}")
+            try:
+                body = response.json() if response.content else {}
+            except ValueError:
+                body = {}
+            data = body.get('data', body) if isinstance(body, dict) else None
+            deleted = data.get('deleted') if isinstance(data, dict) else None
+            return deleted if isinstance(deleted, int) else len(task_ids)
+        if response.status_code not in self.UNSUPPORTED_STATUSES:
+            raise AssertionError(f"Массовое удаление задач: получен {response.status_code}. "
+                                 f"Тело ответа: {response.text}")
+
+        method, path = self.DELETE_TASK_API
+        first = self._send(method, f"{path}{task_ids[0]}")
+        if first.status_code in self.UNSUPPORTED_STATUSES:
+            LOGGING.warning(f"Бэкенд {self.api_url} не поддерживает удаление задач, "
+                            f"{len(task_ids)} задач остаются на дашборде")
+            return 0
+
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            deleted = list(executor.map(lambda task_id: self._send(method, f"{path}{task_id}").ok, task_ids[1:]))
+        return int(first.ok) + sum(deleted)
+
+    def close(self):
+        self.session.close()
+
+    def _send(self, method, path, **kwargs):
+        return self.session.request(method, f"{self.api_url}{path}", timeout=self.timeout, **kwargs)
+
+    def _request(self, method, path, **kwargs):
+        response = self._send(method, path, **kwargs)
+        if not response.ok:
+            raise AssertionError(
+                f"{method} {path}: ожидался успешный ответ, получен {response.status_code}. "
+                f"Тело ответа: {response.text}"
+            )
+        LOGGING.info(f"{method} {path}: {response.status_code}")
+        body = response.json() if response.content else {}
+        return body.get('data', body) if isinstance(body, dict) else body
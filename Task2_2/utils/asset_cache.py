@@ -0,0 +1,275 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from .resource_blocking import resource_type
+
+LOGGING = logging.getLogger(__name__)
+
+DEFAULT_ASSET_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'task-tracker-assets')
+
+# Имя файла с хэшем содержимого, как у чанков Vite/webpack: index-BxYz12ab.js, main.3f9a8c1d.css.
+# Хэш - шестнадцатеричный или с цифрой, иначе под него попадают обычные имена: react-dom.production.js
+HASHED_NAME = re.compile(
+    r'[.-](?:[0-9a-f]{8,}|(?=[A-Za-z0-9_]*[0-9])[A-Za-z0-9_]{8,})\.(?:m?js|css|woff2?|ttf|svg|png|jpe?g|webp|avif|ico)$'
+)
+
+CACHEABLE_TYPES = ('script', 'stylesheet', 'font', 'image', 'media')
+
+# Заголовки соединения не сохраняются, Content-Length выставляется по телу
+SKIPPED_HEADERS = {'connection', 'keep-alive', 'transfer-encoding', 'content-length', 'date', 'age', 'set-cookie'}
+
+CACHE_HEADER = 'X-Asset-Cache'
+
+
+class AssetCache:
+    """
+    Дисковый кэш статических ресурсов фронтенда перед браузером (через прокси selenium-wire).
+
+    Тела хранятся по sha256 содержимого в objects/, индекс URL -> метаданные - по
+    одному JSON файлу на URL в index/. Все записи атомарные (os.replace), поэтому
+    каталог можно делить между воркерами xdist и запусками. Неизменяемые ресурсы
+    (Cache-Control: immutable или хэш в имени файла) отдаются из кэша без обращения
+    к серверу, остальные - в пределах max-age, а после него перепроверяются
+    условным запросом (If-None-Match / If-Modified-Since): на 304 браузер получает
+    тело из кэша. Размер objects/ ограничен max_bytes, вытесняются давно
+    не использованные тела (время использования - mtime файла).
+    """
+
+    EVICT_EVERY = 20
+
+    def __init__(self, cache_dir=DEFAULT_ASSET_CACHE_DIR, max_bytes=512 * 1024 * 1024, skip_scopes=()):
+        """
+        :param cache_dir: Каталог кэша
+        :param max_bytes: Максимальный размер тел в кэше
+        :param skip_scopes: Регулярные выражения URL, которые не кэшируются (API)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._skip_scopes = [re.compile(scope) for scope in skip_scopes]
+        self._objects_dir = os.path.join(cache_dir, 'objects')
+        self._index_dir = os.path.join(cache_dir, 'index')
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._index_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stores = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    # --- обработчики selenium-wire ---
+
+    def handle_request(self, driver, request):
+        """
+        Обработчик запроса: отдает свежую запись из кэша или добавляет условные заголовки
+        """
+        if request.method != 'GET' or self._skipped(request.url):
+            return
+        entry = self._load_entry(request.url)
+        if entry is None:
+            return
+
+        if self._is_fresh(entry):
+            body = self._read_object(entry['digest'])
+            if body is not None:
+                self._count('hits')
+                request.create_response(status_code=200, headers=self._response_headers(entry, body, 'hit'),
+                                        body=body)
+                return
+
+        if entry.get('etag'):
+            self._replace_header(request.headers, 'If-None-Match', entry['etag'])
+        if entry.get('last_modified'):
+            self._replace_header(request.headers, 'If-Modified-Since', entry['last_modified'])
+
+    def handle_response(self, driver, request, response):
+        """
+        Обработчик ответа: подставляет тело из кэша на 304 и сохраняет кэшируемые ответы
+        """
+        if request.method != 'GET' or response.headers.get(CACHE_HEADER) or self._skipped(request.url):
+            return
+
+        if response.status_code == 304:
+            entry = self._load_entry(request.url)
+            body = self._read_object(entry['digest']) if entry else None
+            if body is None:
+                return
+            entry.update(self._validators(response.headers, entry))
+            entry['stored_at'] = time.time()
+            self._write_entry(request.url, entry)
+            self._count('revalidated')
+            response.status_code = 200
+            response.reason = 'OK'
+            self._replace_all_headers(response, self._response_headers(entry, body, 'revalidated'))
+            response.body = body
+            return
+
+        if response.status_code != 200 or not self._is_cacheable(request, response):
+            return
+        self._count('misses')
+        self.store(request.url, response.headers, response.body)
+
+    # --- хранилище ---
+
+    def store(self, url, headers, body):
+        """
+        Сохранение ответа
+        :param url: URL ресурса
+        :param headers: Заголовки ответа
+        :param body: Тело ответа как есть (с исходным Content-Encoding)
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            self._atomic_write(object_path, body)
+
+        entry = {
+            'digest': digest,
+            'headers': {name: value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS},
+            'immutable': self._is_immutable(url, headers),
+            'max_age': self._max_age(headers),
+            'stored_at': time.time(),
+        }
+        entry.update(self._validators(headers))
+        self._write_entry(url, entry)
+
+        with self._lock:
+            self._stores += 1
+            evict = self._stores % self.EVICT_EVERY == 0
+        if evict:
+            self.evict()
+
+    def evict(self):
+        """
+        Удаление давно не использованных тел, пока размер кэша больше max_bytes.
+        Записи индекса без тела считаются промахом и удаляются при следующем обращении.
+        """
+        objects = []
+        for root, dirs, files in os.walk(self._objects_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                objects.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in objects)
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(objects):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_bytes * 0.9:
+                break
+        LOGGING.info(f"Кэш статики сокращен до {total // 1024} КБ: {self.cache_dir}")
+
+    def stats(self):
+        return {'hits': self.hits, 'revalidated': self.revalidated, 'misses': self.misses}
+
+    def _load_entry(self, url):
+        path = self._index_path(url)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self._object_path(entry['digest'])):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return None
+        return entry
+
+    def _write_entry(self, url, entry):
+        self._atomic_write(self._index_path(url), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+
+    def _read_object(self, digest):
+        path = self._object_path(digest)
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+            os.utime(path)
+            return body
+        except FileNotFoundError:
+            return None
+
+    def _atomic_write(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _object_path(self, digest):
+        return os.path.join(self._objects_dir, digest[:2], digest)
+
+    def _index_path(self, url):
+        return os.path.join(self._index_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    # --- правила кэширования ---
+
+    def _skipped(self, url):
+        return any(scope.match(url) for scope in self._skip_scopes)
+
+    def _is_cacheable(self, request, response):
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control or 'private' in cache_control:
+            return False
+        if resource_type(request.url, request.headers) not in CACHEABLE_TYPES:
+            return False
+        return self._is_immutable(request.url, response.headers) or bool(
+            response.headers.get('ETag') or response.headers.get('Last-Modified')
+        )
+
+    def _is_fresh(self, entry):
+        return entry['immutable'] or time.time() - entry['stored_at'] < entry['max_age']
+
+    @staticmethod
+    def _is_immutable(url, headers):
+        return 'immutable' in headers.get('Cache-Control', '').lower() or bool(HASHED_NAME.search(url.split('?')[0]))
+
+    @staticmethod
+    def _max_age(headers):
+        match = re.search(r'max-age=(\d+)', headers.get('Cache-Control', ''))
+        return int(match.group(1)) if match else 0
+
+    @staticmethod
+    def _validators(headers, previous=None):
+        previous = previous or {}
+        return {
+            'etag': headers.get('ETag') or previous.get('etag'),
+            'last_modified': headers.get('Last-Modified') or previous.get('last_modified'),
+        }
+
+    @staticmethod
+    def _response_headers(entry, body, state):
+        headers = dict(entry['headers'])
+        headers['Content-Length'] = str(len(body))
+        headers[CACHE_HEADER] = state
+        return headers
+
+    @staticmethod
+    def _replace_header(headers, name, value):
+        if name in headers:
+            del headers[name]
+        headers[name] = value
+
+    def _replace_all_headers(self, response, headers):
+        for name in list(response.headers.keys()):
+            del response.headers[name]
+        for name, value in headers.items():
+            response.headers[name] = value
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
@@ -0,0 +1,133 @@
+import logging
+import os
+import shutil
+import tempfile
+
+LOGGING = logging.getLogger(__name__)
+
+
+class BrowserProfile:
+    """
+    Набор параметров запуска Chrome.
+
+    configure() дополняет Options аргументами профиля, after_launch()
+    выполняет действия над уже запущенным браузером (размер окна).
+    """
+
+    def __init__(self, name, arguments=(), headless_argument='--headless', force_headless=False,
+                 page_load_strategy='normal', window_size=None, warm_template=False):
+        """
+        :param name: Имя профиля для --browser-profile
+        :param arguments: Дополнительные аргументы командной строки Chrome
+        :param headless_argument: Аргумент headless режима
+        :param force_headless: Запускать headless независимо от --headless
+        :param page_load_strategy: normal, eager или none
+        :param window_size: (ширина, высота) или None - развернуть окно после запуска
+        :param warm_template: Запускать браузеры из прогретого шаблона профиля
+        """
+        self.name = name
+        self.arguments = tuple(arguments)
+        self.headless_argument = headless_argument
+        self.force_headless = force_headless
+        self.page_load_strategy = page_load_strategy
+        self.window_size = window_size
+        self.warm_template = warm_template
+
+    def configure(self, options, headless):
+        """
+        Применение профиля к Options
+        :param options: selenium.webdriver.chrome.options.Options
+        :param headless: Значение --headless
+        """
+        if headless or self.force_headless:
+            options.add_argument(self.headless_argument)
+        for argument in self.arguments:
+            options.add_argument(argument)
+        if self.window_size:
+            options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+        options.page_load_strategy = self.page_load_strategy
+
+    def after_launch(self, driver):
+        if self.window_size is None:
+            driver.maximize_window()
+
+
+BROWSER_PROFILES = {
+    'default': BrowserProfile('default'),
+    # Быстрый старт: новый headless, driver.get возвращается после DOMContentLoaded (page objects
+    # дальше ждут явно), фоновые сервисы Chrome отключены, размер окна задан заранее
+    'fast': BrowserProfile(
+        'fast',
+        arguments=(
+            '--disable-background-networking',
+            '--disable-component-update',
+            '--disable-default-apps',
+            '--disable-extensions',
+            '--disable-sync',
+            '--disable-features=Translate,OptimizationHints,MediaRouter',
+            '--metrics-recording-only',
+            '--no-default-browser-check',
+            '--no-first-run',
+        ),
+        headless_argument='--headless=new',
+        force_headless=True,
+        page_load_strategy='eager',
+        window_size=(1920, 1080),
+        warm_template=True,
+    ),
+}
+
+
+def get_browser_profile(name):
+    """
+    Профиль запуска браузера по имени
+    :param name: 'default' или 'fast'
+    """
+    return BROWSER_PROFILES[name]
+
+
+class ProfileTemplate:
+    """
+    Прогретый каталог user-data-dir, который копируется для каждого нового браузера.
+
+    Шаблон создается один раз на воркер: браузер запускается с каталогом
+    шаблона, открывает тестируемое приложение (заполняются HTTP кэш, service
+    worker и первичная настройка профиля) и закрывается. Новые браузеры
+    стартуют с копии, а не с пустого профиля.
+    """
+
+    # Файлы блокировок и данные, которые не нужны копии профиля
+    IGNORED = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile',
+               'Crashpad', 'BrowserMetrics', 'ShaderCache', 'GrShaderCache', 'DevToolsActivePort')
+
+    def __init__(self, path):
+        self.path = path
+
+    @classmethod
+    def build(cls, path, launch, warm):
+        """
+        Создание шаблона
+        :param path: Каталог шаблона
+        :param launch: Функция, запускающая браузер с переданным user-data-dir
+        :param warm: Функция, прогревающая профиль в запущенном браузере
+        :return: ProfileTemplate
+        """
+        os.makedirs(path, exist_ok=True)
+        driver = launch(path)
+        try:
+            warm(driver)
+        finally:
+            driver.quit()
+        LOGGING.info(f"Шаблон профиля браузера создан: {path}")
+        return cls(path)
+
+    def clone(self, work_dir):
+        """
+        Копия шаблона для нового браузера
+        :param work_dir: Каталог, в котором создается копия
+        :return: Путь к user-data-dir
+        """
+        user_data_dir = tempfile.mkdtemp(prefix='profile-', dir=work_dir)
+        shutil.copytree(self.path, user_data_dir, symlinks=True, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns(*self.IGNORED))
+        return user_data_dir
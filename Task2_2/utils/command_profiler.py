@@ -0,0 +1,336 @@
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+LOGGING = logging.getLogger(__name__)
+
+
+class _Frame:
+    """Кадр стека профилировщика: вызов метода page object или ожидание"""
+
+    __slots__ = ('label', 'kind', 'start', 'child_ms')
+
+    def __init__(self, label, kind):
+        self.label = label
+        self.kind = kind
+        self.start = time.perf_counter()
+        self.child_ms = 0.0
+
+
+class _TestProfile:
+    """Замеры одного теста"""
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.start = time.perf_counter()
+        self.duration_ms = 0.0
+        self.round_trips = 0
+        self.command_ms = 0.0
+        self.methods = defaultdict(lambda: {'calls': 0, 'total_ms': 0.0, 'wait_ms': 0.0,
+                                            'action_ms': 0.0, 'round_trips': 0})
+        self.commands = defaultdict(lambda: {'count': 0, 'ms': 0.0})
+        self.folded = defaultdict(float)
+
+    def to_dict(self):
+        return {
+            'duration_ms': round(self.duration_ms, 1),
+            'round_trips': self.round_trips,
+            'command_ms': round(self.command_ms, 1),
+            'methods': {label: _rounded(stats) for label, stats in
+                        sorted(self.methods.items(), key=lambda item: -item[1]['total_ms'])},
+            'commands': {command: _rounded(stats) for command, stats in
+                         sorted(self.commands.items(), key=lambda item: -item[1]['ms'])},
+        }
+
+
+def _rounded(stats):
+    return {key: round(value, 1) if isinstance(value, float) else value for key, value in stats.items()}
+
+
+def _locator_label(args):
+    if args and isinstance(args[0], tuple) and len(args[0]) == 2 and isinstance(args[0][0], str):
+        return getattr(args[0], 'name', None) or args[0][1]
+    return None
+
+
+class CommandProfiler:
+    """
+    Профилировщик команд WebDriver.
+
+    Оборачивает методы page objects и ожидания (кадры стека) и метод execute
+    command executor драйвера (одна команда - один round trip). Для каждого метода
+    page object с локатором считаются вызовы, общее время, время в ожиданиях,
+    время команд вне ожиданий (действия) и число round trip. Время ожидания и
+    команд относится к ближайшему вызову page object в стеке.
+
+    Стек хранится отдельно для каждого потока, команды из других потоков
+    (например, перехватчики selenium-wire) к тесту не относятся и не учитываются.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._patched = []
+        self._tests = {}
+        self._current = None
+        self._lock = threading.Lock()
+
+    # --- подключение ---
+
+    def instrument(self, cls, methods=None, kind='call'):
+        """
+        Оборачивает методы класса
+        :param cls: Класс page object или ожидания
+        :param methods: Имена методов, по умолчанию публичные функции, объявленные в классе
+        :param kind: 'call' для методов page objects, 'wait' для ожиданий
+        """
+        if methods is None:
+            methods = [name for name, value in vars(cls).items()
+                       if inspect.isfunction(value) and not name.startswith('_')]
+        for name in methods:
+            original = vars(cls)[name]
+            if getattr(original, '__profiled__', False):
+                continue
+            setattr(cls, name, self._wrap(original, kind))
+            self._patched.append((cls, name, original))
+
+    def uninstrument(self):
+        """Возвращает исходные методы классов"""
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched.clear()
+
+    def attach(self, driver):
+        """
+        Оборачивает command_executor.execute драйвера
+        :param driver: WebDriver
+        :return: driver
+        """
+        executor = driver.command_executor
+        if getattr(executor, '__profiled__', False):
+            return driver
+        original = executor.execute
+
+        @functools.wraps(original)
+        def execute(command, params):
+            start = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                self._record_command(command, (time.perf_counter() - start) * 1000)
+
+        executor.execute = execute
+        executor.__profiled__ = True
+        return driver
+
+    # --- границы тестов ---
+
+    def start_test(self, nodeid):
+        with self._lock:
+            self._current = self._tests[nodeid] = _TestProfile(nodeid)
+            self._local.stack = []
+            self._local.owner = True
+
+    def finish_test(self, nodeid):
+        """
+        :return: Сводка теста или None, если тест не профилировался
+        """
+        with self._lock:
+            profile = self._tests.get(nodeid)
+            if profile is None:
+                return None
+            profile.duration_ms = (time.perf_counter() - profile.start) * 1000
+            self._current = None
+            return profile.to_dict()
+
+    # --- запись ---
+
+    def _stack(self):
+        if not getattr(self._local, 'owner', False):
+            return None
+        return self._local.stack
+
+    def _wrap(self, func, kind):
+        qualname = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            if stack is None or self._current is None:
+                return func(*args, **kwargs)
+
+            locator = _locator_label(args[1:]) if kind == 'call' else None
+            frame = _Frame(f"{qualname}({locator})" if locator else qualname, kind)
+            stack.append(frame)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stack.pop()
+                self._record_frame(stack, frame)
+
+        wrapper.__profiled__ = True
+        return wrapper
+
+    def _record_frame(self, stack, frame):
+        profile = self._current
+        if profile is None:
+            return
+        duration = (time.perf_counter() - frame.start) * 1000
+        profile.folded[self._folded_key(stack + [frame])] += duration - frame.child_ms
+        if stack:
+            stack[-1].child_ms += duration
+
+        if frame.kind == 'call':
+            stats = profile.methods[frame.label]
+            stats['calls'] += 1
+            stats['total_ms'] += duration
+        elif not any(parent.kind == 'wait' for parent in stack):
+            owner = self._nearest_call(stack)
+            if owner is not None:
+                profile.methods[owner.label]['wait_ms'] += duration
+
+    def _record_command(self, command, duration):
+        stack = self._stack()
+        profile = self._current
+        if stack is None or profile is None:
+            return
+        profile.round_trips += 1
+        profile.command_ms += duration
+        profile.commands[command]['count'] += 1
+        profile.commands[command]['ms'] += duration
+        profile.folded[self._folded_key(stack, command)] += duration
+        if stack:
+            stack[-1].child_ms += duration
+
+        owner = self._nearest_call(stack)
+        if owner is not None:
+            stats = profile.methods[owner.label]
+            stats['round_trips'] += 1
+            if not any(frame.kind == 'wait' for frame in stack):
+                stats['action_ms'] += duration
+
+    @staticmethod
+    def _nearest_call(stack):
+        for frame in reversed(stack):
+            if frame.kind == 'call':
+                return frame
+        return None
+
+    def _folded_key(self, stack, leaf=None):
+        labels = [self._current.nodeid] + [frame.label for frame in stack]
+        if leaf:
+            labels.append(leaf)
+        return ';'.join(label.replace(';', ',') for label in labels)
+
+    # --- отчеты ---
+
+    def has_data(self):
+        with self._lock:
+            return bool(self._tests)
+
+    def report(self):
+        """
+        Сводка по всем тестам
+        :return: Словарь tests (по тестам) и methods (суммарно по методам page objects)
+        """
+        with self._lock:
+            tests = {nodeid: profile.to_dict() for nodeid, profile in self._tests.items()}
+            totals = defaultdict(lambda: defaultdict(float))
+            for profile in self._tests.values():
+                for label, stats in profile.methods.items():
+                    for key, value in stats.items():
+                        totals[label][key] += value
+        methods = {label: _rounded(dict(stats)) for label, stats in
+                   sorted(totals.items(), key=lambda item: -item[1]['total_ms'])}
+        for stats in methods.values():
+            stats['calls'] = int(stats['calls'])
+            stats['round_trips'] = int(stats['round_trips'])
+        return {'tests': tests, 'methods': methods}
+
+    def write(self, json_path, folded_path=None):
+        """
+        Сохранение отчета в JSON и стеков в формате flamegraph.pl / speedscope (значения в микросекундах)
+        :param json_path: Путь к JSON отчету
+        :param folded_path: Путь к файлу folded stacks, по умолчанию <json_path без расширения>.folded
+        :return: Отчет
+        """
+        report = self.report()
+        folded_path = folded_path or f"{os.path.splitext(json_path)[0]}.folded"
+        for path in (json_path, folded_path):
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        with self._lock:
+            lines = [f"{key} {int(value * 1000)}"
+                     for profile in self._tests.values()
+                     for key, value in profile.folded.items() if value >= 0.001]
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        LOGGING.info(f"Профиль команд WebDriver сохранен: {json_path}, {folded_path}")
+        return report
+
+
+class CommandProfilerPlugin:
+    """
+    pytest плагин профилировщика: границы тестов, секция в отчете теста и файлы в конце сессии.
+
+    Регистрируется из conftest при запуске с --profile-commands под именем NAME.
+    """
+
+    NAME = 'command-profiler'
+
+    def __init__(self, path, classes=(), waits=()):
+        """
+        :param path: Путь к JSON отчету (рядом пишется .folded)
+        :param classes: Классы page objects, публичные методы которых профилируются
+        :param waits: Пары (класс, имена методов) ожиданий
+        """
+        self.path = path
+        self.profiler = CommandProfiler()
+        for cls in classes:
+            self.profiler.instrument(cls)
+        for cls, methods in waits:
+            self.profiler.instrument(cls, methods, kind='wait')
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self.profiler.start_test(nodeid)
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self.profiler.finish_test(nodeid)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_makereport(self, item, call):
+        if call.when != 'teardown':
+            return
+        summary = self.profiler.finish_test(item.nodeid)
+        if not summary:
+            return
+        lines = [f"{summary['duration_ms']} ms, round trips: {summary['round_trips']}, "
+                 f"команды: {summary['command_ms']} ms"]
+        for label, stats in summary['methods'].items():
+            lines.append(f"  {label}: {stats['calls']} x, {stats['total_ms']} ms "
+                         f"(ожидание {stats['wait_ms']} ms, действия {stats['action_ms']} ms, "
+                         f"round trips {stats['round_trips']})")
+        item.add_report_section('teardown', 'webdriver profile', '\n'.join(lines))
+
+    def pytest_sessionfinish(self, session):
+        if not self.profiler.has_data():
+            return
+        path = self.path
+        worker = os.environ.get('PYTEST_XDIST_WORKER')
+        if worker:
+            root, ext = os.path.splitext(path)
+            path = f"{root}.{worker}{ext}"
+        self.profiler.write(path)
+
+    def pytest_unconfigure(self, config):
+        self.profiler.uninstrument()
@@ -0,0 +1,135 @@
+import json
+import logging
+import statistics
+import time
+
+from pages.dashboard_page import DashboardPage
+from .flow_benchmark import count_commands
+
+LOGGING = logging.getLogger(__name__)
+
+RENDER_MODES = ('all', 'virtual', 'paged')
+
+PHASES = ('load', 'lookup', 'scrape', 'verify')
+
+
+class DashboardScaling:
+    """
+    Замер хелперов DashboardPage на доске с большим количеством задач.
+
+    Хранилище заглушки заполняется count - 1 задачами и одной целевой задачей в
+    конце списка (туда же попадают задачи, созданные тестами). Для каждого
+    прогона дашборд открывается заново, замеряются время и команды WebDriver фаз:
+    load (открытие дашборда и ожидание запросов), lookup (find_task_by_title),
+    scrape (get_task_info) и verify (verify_task_created). Поиск и проверка идут с
+    обходом списка (scan=True); поиск оставляет список на найденной карточке, чтобы
+    scrape читал живой элемент, поэтому перед проверкой дашборд открывается заново
+    вне замера и проверка тоже обходит список от исходного вида.
+    """
+
+    TARGET = {
+        'title': "Масштаб_цель",
+        'description': "Описание",
+        'boardId': 2,
+        'assigneeId': 2,
+        'priority': 'High',
+    }
+
+    # Поиск карточки не должен зависеть от количества задач: весь обход идет в странице
+    MAX_LOOKUP_COMMANDS = 3
+
+    def __init__(self, rounds=3):
+        """
+        :param rounds: Количество прогонов на каждую комбинацию режима и размера
+        """
+        self.rounds = rounds
+        self.results = {}
+
+    def run(self, render_mode, count, driver, stand_in, base_url, reset_driver):
+        """
+        Замер на доске из count задач
+        :param render_mode: all, virtual или paged (см. StandInServer)
+        :param count: Количество задач на доске
+        :param driver: WebDriver
+        :param stand_in: StandInServer
+        :param base_url: URL дашборда
+        :param reset_driver: Функция сброса состояния браузера между прогонами
+        :return: Словарь фаза -> {'ms': медиана, 'commands': медиана}
+        """
+        stand_in.store.reset()
+        stand_in.store.seed(count - 1)
+        stand_in.store.create(self.TARGET)
+        form_data = self._form_data(stand_in)
+        url = f"{base_url}/?render={render_mode}"
+
+        samples = {phase: {'ms': [], 'commands': []} for phase in PHASES}
+        rendered = []
+        for _ in range(self.rounds):
+            reset_driver(driver)
+            dashboard = DashboardPage(driver)
+
+            def load():
+                driver.get(url)
+                dashboard.find_element(dashboard.CREATE_TASK_BUTTON)
+                dashboard.wait_for_network_idle()
+
+            def lookup():
+                return dashboard.find_task_by_title(form_data['title'], scan=True, restore=False)
+
+            self._measure(samples['load'], driver, load)
+            card = self._measure(samples['lookup'], driver, lookup)
+            info = self._measure(samples['scrape'], driver, lambda: dashboard.get_task_info(card))
+            assert info.get('title') == form_data['title'], f"get_task_info вернул {info}"
+            load()
+            self._measure(samples['verify'], driver, lambda: dashboard.verify_task_created(form_data, scan=True))
+            rendered.append(driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", dashboard.TASK_CARD[1]
+            ))
+
+        result = {
+            phase: {
+                'ms': round(statistics.median(values['ms']), 1),
+                'commands': int(statistics.median(values['commands'])),
+            }
+            for phase, values in samples.items()
+        }
+        result['rendered_cards'] = int(statistics.median(rendered))
+        self.results.setdefault(render_mode, {})[count] = result
+        LOGGING.info(f"Дашборд {render_mode}, {count} задач: {result}")
+        return result
+
+    def check(self, result):
+        """
+        :raises AssertionError: если поиск карточки стал зависеть от количества задач
+        """
+        commands = result['lookup']['commands']
+        assert commands <= self.MAX_LOOKUP_COMMANDS, \
+            f"find_task_by_title выполнил {commands} команд WebDriver, ожидалось не больше {self.MAX_LOOKUP_COMMANDS}"
+
+    def report(self):
+        """
+        Таблица результатов: режим -> количество задач -> фазы
+        """
+        return {mode: dict(sorted(sizes.items())) for mode, sizes in sorted(self.results.items())}
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'rounds': self.rounds, 'results': self.report()}, f, ensure_ascii=False, indent=2)
+        LOGGING.info(f"Отчет масштабирования дашборда сохранен: {path}")
+
+    def _form_data(self, stand_in):
+        task = next(task for task in stand_in.store.list() if task['title'] == self.TARGET['title'])
+        return {
+            'title': task['title'],
+            'project_name': task['boardName'],
+            'assignee_name': task['assignee']['fullName'],
+        }
+
+    @staticmethod
+    def _measure(samples, driver, action):
+        with count_commands(driver) as counter:
+            start = time.perf_counter()
+            value = action()
+            samples['ms'].append((time.perf_counter() - start) * 1000)
+        samples['commands'].append(counter[0])
+        return value
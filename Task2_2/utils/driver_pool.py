@@ -0,0 +1,121 @@
+import logging
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+LOGGING = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """
+    Пул живых экземпляров браузера, переиспользуемых между тестами.
+
+    Драйвер выдается тесту через acquire() и возвращается через release().
+    Между тестами выполняется дешевый сброс состояния (лишние окна, cookies,
+    localStorage/sessionStorage, driver.requests и индекс перехвата). Драйвер пересоздается,
+    если он отработал max_uses тестов или перестал отвечать. Тест группы сценариев
+    может вернуть драйвер с живой страницей (keep_page), тогда сбрасывается только перехват.
+    """
+
+    def __init__(self, factory, max_uses=25):
+        """
+        :param factory: Функция без аргументов, создающая новый драйвер
+        :param max_uses: Количество тестов, после которого драйвер пересоздается
+                         (1 - новый браузер на каждый тест)
+        """
+        self._factory = factory
+        self._max_uses = max(1, max_uses)
+        self._idle = []
+        self._uses = {}
+
+    def acquire(self):
+        """
+        Выдает живой драйвер из пула или создает новый
+        :return: WebDriver
+        """
+        while self._idle:
+            driver = self._idle.pop()
+            if self._is_alive(driver):
+                return driver
+            LOGGING.warning("Драйвер из пула не отвечает, пересоздаем")
+            self._discard(driver)
+
+        start = time.perf_counter()
+        driver = self._factory()
+        LOGGING.info(f"Запущен новый браузер за {time.perf_counter() - start:.2f} с")
+        self._uses[id(driver)] = 0
+        return driver
+
+    def release(self, driver, recycle=False, keep_page=False):
+        """
+        Возвращает драйвер в пул после теста
+        :param driver: WebDriver, полученный через acquire()
+        :param recycle: Принудительно пересоздать драйвер
+        :param keep_page: Не сбрасывать страницу, следующий тест продолжит работу в ней
+        """
+        self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+
+        if recycle or self._uses[id(driver)] >= self._max_uses:
+            self._discard(driver)
+            return
+
+        try:
+            if keep_page:
+                self.clear_capture(driver)
+            else:
+                self.reset_state(driver)
+        except WebDriverException as e:
+            LOGGING.warning(f"Не удалось сбросить состояние драйвера, пересоздаем: {e}")
+            self._discard(driver)
+            return
+
+        self._idle.append(driver)
+
+    def reset_state(self, driver):
+        """
+        Сброс состояния браузера между тестами без перезапуска
+
+        :param driver: WebDriver
+        """
+        handles = driver.window_handles
+        main_handle = handles[0]
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(main_handle)
+
+        driver.delete_all_cookies()
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        self.clear_capture(driver)
+
+    def clear_capture(self, driver):
+        """
+        Очистка перехваченных запросов без изменения страницы
+
+        :param driver: WebDriver
+        """
+        if hasattr(driver, 'requests'):
+            del driver.requests
+        if hasattr(driver, 'capture_index'):
+            driver.capture_index.clear()
+
+    def close(self):
+        """Закрывает все драйверы пула"""
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    def _is_alive(self, driver):
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            LOGGING.warning(f"Ошибка при закрытии драйвера: {e}")
@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+LOGGING = logging.getLogger(__name__)
+
+DRIVER_NAME = 'chromedriver.exe' if sys.platform.startswith('win') else 'chromedriver'
+
+CHROME_CANDIDATES = (
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    'chrome',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'chromedriver-resolver')
+
+
+class ChromeDriverResolver:
+    """
+    Поиск chromedriver с локальным кэшем.
+
+    Путь к драйверу хранится в manifest.json, ключ - мажорная версия Chrome.
+    Версия Chrome тоже кэшируется по пути и mtime бинарника, поэтому при
+    прогретом кэше поиск сводится к stat двух файлов. Если задан offline_dir,
+    драйвер берется только оттуда и сеть не используется.
+    """
+
+    MANIFEST_NAME = 'manifest.json'
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, offline_dir=None, chrome_binary=None):
+        """
+        :param cache_dir: Каталог с manifest.json
+        :param offline_dir: Заранее подготовленный каталог с драйверами
+                            (<dir>/<мажорная версия>/chromedriver или <dir>/chromedriver)
+        :param chrome_binary: Путь к бинарнику Chrome, по умолчанию ищется в PATH
+        """
+        self.cache_dir = cache_dir
+        self.offline_dir = offline_dir
+        self.chrome_binary = chrome_binary or self._find_chrome_binary()
+        self._manifest_path = os.path.join(cache_dir, self.MANIFEST_NAME)
+
+    def resolve(self):
+        """
+        Возвращает путь к chromedriver для установленной версии Chrome
+        :return: Путь к бинарнику драйвера
+        """
+        manifest = self._load_manifest()
+        known_browsers = dict(manifest['browsers'])
+        full_version = self._get_chrome_version(manifest)
+        version = full_version.split('.')[0]
+
+        driver_path = manifest['drivers'].get(version)
+        if driver_path and os.path.isfile(driver_path):
+            if manifest['browsers'] != known_browsers:
+                self._save_manifest(manifest)
+            LOGGING.info(f"chromedriver для Chrome {version} взят из кэша: {driver_path}")
+            return driver_path
+
+        if self.offline_dir:
+            driver_path = self._find_in_offline_dir(version)
+        else:
+            driver_path = self._download(full_version)
+        self._check_driver_version(driver_path, version)
+
+        manifest['drivers'][version] = driver_path
+        self._save_manifest(manifest)
+        LOGGING.info(f"chromedriver для Chrome {version}: {driver_path}")
+        return driver_path
+
+    def _get_chrome_version(self, manifest):
+        if not self.chrome_binary:
+            return self._get_chrome_version_from_os()
+
+        mtime = os.stat(self.chrome_binary).st_mtime
+        cached = manifest['browsers'].get(self.chrome_binary)
+        if cached and cached['mtime'] == mtime and 'full_version' in cached:
+            return cached['full_version']
+
+        output = subprocess.run(
+            [self.chrome_binary, '--version'], capture_output=True, text=True, timeout=30
+        ).stdout
+        match = re.search(r'(\d+)\.\d+\.\d+\.\d+', output)
+        if not match:
+            raise RuntimeError(f"Не удалось определить версию Chrome: {self.chrome_binary}")
+
+        full_version = match.group(0)
+        manifest['browsers'][self.chrome_binary] = {'mtime': mtime, 'version': match.group(1),
+                                                    'full_version': full_version}
+        return full_version
+
+    def _get_chrome_version_from_os(self):
+        from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+        full_version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        if not full_version:
+            raise RuntimeError("Chrome не найден, укажите путь через --chrome-binary")
+        return full_version
+
+    def _find_in_offline_dir(self, version):
+        for path in (os.path.join(self.offline_dir, version, DRIVER_NAME),
+                     os.path.join(self.offline_dir, DRIVER_NAME)):
+            if os.path.isfile(path):
+                return path
+        raise RuntimeError(f"chromedriver для Chrome {version} не найден в {self.offline_dir}")
+
+    def _download(self, full_version):
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        # Без driver_version webdriver-manager берет версию Chrome из ОС, а не chrome_binary
+        driver_path = ChromeDriverManager(driver_version=full_version).install()
+        if os.path.basename(driver_path) == DRIVER_NAME:
+            return driver_path
+
+        # webdriver-manager иногда возвращает путь к соседнему файлу из архива
+        for root, dirs, files in os.walk(os.path.dirname(driver_path)):
+            if DRIVER_NAME in files:
+                return os.path.join(root, DRIVER_NAME)
+        raise RuntimeError(f"chromedriver для Chrome {full_version} не найден после загрузки: {driver_path}")
+
+    @staticmethod
+    def _check_driver_version(driver_path, version):
+        """
+        Сверка мажорной версии драйвера с Chrome до записи в manifest.json:
+        неподходящий драйвер в кэше ломал бы каждый следующий запуск
+        :param driver_path: Путь к бинарнику драйвера
+        :param version: Мажорная версия Chrome
+        """
+        output = subprocess.run(
+            [driver_path, '--version'], capture_output=True, text=True, timeout=30
+        ).stdout
+        match = re.search(r'ChromeDriver (\d+)\.', output)
+        if not match:
+            raise RuntimeError(f"Не удалось определить версию chromedriver: {driver_path}")
+        if match.group(1) != version:
+            raise RuntimeError(f"chromedriver {match.group(1)} не подходит для Chrome {version}: {driver_path}")
+
+    def _find_chrome_binary(self):
+        for candidate in CHROME_CANDIDATES:
+            path = shutil.which(candidate)
+            if path:
+                return path
+        return None
+
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault('browsers', {})
+        manifest.setdefault('drivers', {})
+        return manifest
+
+    def _save_manifest(self, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self._manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self._manifest_path)
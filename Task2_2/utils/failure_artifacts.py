@@ -0,0 +1,205 @@
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+LOGGING = logging.getLogger(__name__)
+
+# Тела обменов в артефактах обрезаются: для разбора падения хватает начала ответа
+MAX_BODY_SIZE = 64 * 1024
+
+MAX_EXCHANGES = 200
+
+
+def artifact_dir(output_dir, nodeid):
+    """
+    Каталог артефактов теста: <output_dir>/<модуль>/<имя теста>
+    :param output_dir: Каталог артефактов сессии
+    :param nodeid: nodeid теста
+    """
+    path, _, name = nodeid.partition('::')
+    name = re.sub(r'[^\w.\[\]-]+', '_', name)
+    if len(name) > 120:
+        name = f"{name[:100]}-{hashlib.sha1(nodeid.encode('utf-8')).hexdigest()[:10]}"
+    module = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(output_dir, module, name)
+
+
+class _Snapshot:
+    """Данные браузера, снятые в момент падения, до кодирования и сжатия"""
+
+    def __init__(self, nodeid, when, url, screenshot, dom, exchanges, decode_bodies):
+        self.nodeid = nodeid
+        self.when = when
+        self.url = url
+        self.screenshot = screenshot
+        self.dom = dom
+        self.exchanges = exchanges
+        self.decode_bodies = decode_bodies
+
+
+class FailureArtifacts:
+    """
+    Артефакты упавших тестов: скриншот, DOM и перехваченные обмены.
+
+    В потоке теста снимаются только сырые данные (скриншот в base64, page_source и
+    ссылки на обмены driver.requests или CaptureIndex) - несколько команд WebDriver без
+    обработки. Декодирование скриншота, сериализация обменов в HAR и gzip выполняются
+    в пуле потоков, поэтому teardown и следующий тест их не ждут. Каждый тест
+    получает свой каталог: screenshot.png, dom.html.gz, network.har.gz.
+    """
+
+    def __init__(self, output_dir, max_workers=2):
+        """
+        :param output_dir: Каталог артефактов
+        :param max_workers: Количество потоков записи
+        """
+        self.output_dir = output_dir
+        self.written = []
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='failure-artifacts')
+        self._futures = []
+
+    def capture(self, nodeid, driver, when='call'):
+        """
+        Снимает состояние браузера и ставит запись артефактов в очередь
+        :param nodeid: nodeid упавшего теста
+        :param driver: WebDriver теста
+        :param when: Фаза, в которой тест упал
+        :return: Каталог, в который будут записаны артефакты
+        """
+        start = time.perf_counter()
+        url = self._grab(driver, lambda: driver.current_url)
+        screenshot = self._grab(driver, driver.get_screenshot_as_base64)
+        dom = self._grab(driver, lambda: driver.page_source)
+        if hasattr(driver, 'requests'):
+            exchanges, decode_bodies = self._grab(driver, lambda: driver.requests[-MAX_EXCHANGES:]) or [], True
+        elif hasattr(driver, 'capture_index'):
+            exchanges, decode_bodies = self._grab(driver, driver.capture_index.exchanges) or [], False
+            exchanges = exchanges[-MAX_EXCHANGES:]
+        else:
+            exchanges, decode_bodies = [], False
+        LOGGING.info(f"Состояние браузера для {nodeid} снято за {time.perf_counter() - start:.2f} с")
+
+        snapshot = _Snapshot(nodeid, when, url, screenshot, dom, exchanges, decode_bodies)
+        directory = artifact_dir(self.output_dir, nodeid)
+        self._futures.append(self._executor.submit(self._write, directory, snapshot))
+        return directory
+
+    def close(self):
+        """Дожидается записи всех артефактов"""
+        self._executor.shutdown(wait=True)
+        for future in self._futures:
+            error = future.exception()
+            if error is not None:
+                LOGGING.error(f"Не удалось записать артефакты падения: {error}")
+        self._futures.clear()
+
+    def _grab(self, driver, getter):
+        try:
+            return getter()
+        except WebDriverException as e:
+            LOGGING.warning(f"Не удалось снять состояние браузера: {e.msg}")
+            return None
+
+    def _write(self, directory, snapshot):
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.makedirs(directory)
+        if snapshot.screenshot:
+            with open(os.path.join(directory, 'screenshot.png'), 'wb') as f:
+                f.write(base64.b64decode(snapshot.screenshot))
+        if snapshot.dom is not None:
+            with gzip.open(os.path.join(directory, 'dom.html.gz'), 'wt', encoding='utf-8') as f:
+                f.write(snapshot.dom)
+        har = {'log': {
+            'version': '1.2',
+            'creator': {'name': 'Task2_2', 'version': '1'},
+            'pages': [{'id': snapshot.nodeid, 'title': snapshot.url or '', '_when': snapshot.when}],
+            'entries': [self._har_entry(exchange, snapshot.decode_bodies) for exchange in snapshot.exchanges],
+        }}
+        with gzip.open(os.path.join(directory, 'network.har.gz'), 'wt', encoding='utf-8') as f:
+            json.dump(har, f, ensure_ascii=False)
+        self.written.append(directory)
+        return directory
+
+    def _har_entry(self, exchange, decode_bodies):
+        entry = {
+            'request': {
+                'method': exchange.method,
+                'url': exchange.url,
+                'headers': self._har_headers(exchange.headers),
+            },
+        }
+        if exchange.body:
+            entry['request']['postData'] = self._content(exchange.body, exchange.headers)
+        response = exchange.response
+        if response is not None:
+            body = response.body
+            if decode_bodies:
+                from seleniumwire.utils import decode
+
+                try:
+                    body = decode(body, response.headers.get('Content-Encoding', 'identity'))
+                except ValueError:
+                    pass
+            entry['response'] = {
+                'status': response.status_code,
+                'headers': self._har_headers(response.headers),
+                'content': self._content(body, response.headers),
+            }
+        return entry
+
+    @staticmethod
+    def _har_headers(headers):
+        return [{'name': name, 'value': value} for name, value in headers.items()]
+
+    @staticmethod
+    def _content(body, headers):
+        # Заголовки CDP - обычный словарь с именами в нижнем регистре
+        mime_type = next((value for name, value in headers.items() if name.lower() == 'content-type'), '')
+        content = {'size': len(body), 'mimeType': mime_type}
+        body = body[:MAX_BODY_SIZE]
+        try:
+            content['text'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            content['text'] = base64.b64encode(body).decode('ascii')
+            content['encoding'] = 'base64'
+        return content
+
+
+class FailureArtifactsPlugin:
+    """
+    pytest плагин артефактов падений: снимок браузера в makereport упавшей фазы,
+    пока фикстуры теста еще не завершены. Регистрируется из conftest под именем NAME.
+    """
+
+    NAME = 'failure-artifacts'
+
+    def __init__(self, output_dir, max_workers=2):
+        self.artifacts = FailureArtifacts(output_dir, max_workers)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if not report.failed or report.when == 'teardown':
+            return
+        driver = getattr(item, 'funcargs', {}).get('driver')
+        if driver is None:
+            return
+        directory = self.artifacts.capture(item.nodeid, driver, report.when)
+        report.sections.append(("Failure artifacts", directory))
+
+    def pytest_sessionfinish(self, session):
+        self.artifacts.close()
+        if self.artifacts.written:
+            LOGGING.info(f"Артефакты падений: {len(self.artifacts.written)} тестов в {self.artifacts.output_dir}")
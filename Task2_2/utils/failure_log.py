@@ -0,0 +1,122 @@
+import copy
+import logging
+import logging.handlers
+import queue
+import threading
+from collections import deque
+
+import pytest
+
+LOG_MODES = ('live', 'failures')
+
+LOG_FORMAT = '%(asctime)s.%(msecs)03d %(levelname)-7s [%(action)s] %(name)s: %(message)s'
+
+
+class _TestQueueHandler(logging.handlers.QueueHandler):
+    """
+    Постановка записи в очередь без форматирования: сообщение собирается из
+    msg % args только при выводе в отчет упавшего теста.
+    """
+
+    def __init__(self, log_queue, current_test):
+        super().__init__(log_queue)
+        self._current_test = current_test
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.test_id = self._current_test()
+        if not hasattr(record, 'action'):
+            record.action = '-'
+        return record
+
+
+class _RingBufferHandler(logging.Handler):
+    """Последние capacity записей каждого теста, более ранние отбрасываются"""
+
+    def __init__(self, capacity):
+        super().__init__()
+        self.capacity = capacity
+        self._buffers = {}
+        self._dropped = {}
+        self._buffer_lock = threading.Lock()
+
+    def emit(self, record):
+        with self._buffer_lock:
+            buffer = self._buffers.get(record.test_id)
+            if buffer is None:
+                buffer = self._buffers[record.test_id] = deque(maxlen=self.capacity)
+            if len(buffer) == self.capacity:
+                self._dropped[record.test_id] = self._dropped.get(record.test_id, 0) + 1
+            buffer.append(record)
+
+    def pop(self, test_id):
+        """
+        :return: Записи теста и количество отброшенных
+        """
+        with self._buffer_lock:
+            return list(self._buffers.pop(test_id, ())), self._dropped.pop(test_id, 0)
+
+
+class FailureLogPlugin:
+    """
+    pytest плагин режима --log-mode=failures: лог page objects только для упавших тестов.
+
+    Записи логгеров loggers не идут в общий вывод: QueueHandler ставит их в
+    очередь, фоновый QueueListener раскладывает по кольцевым буферам тестов.
+    Когда фаза теста падает, очередь дожидается, буфер форматируется и
+    добавляется в отчет секцией "Captured page log"; у прошедших тестов буфер
+    отбрасывается без форматирования. Регистрируется из conftest под именем NAME.
+    """
+
+    NAME = 'failure-log'
+
+    def __init__(self, capacity=1000, loggers=('pages',), level=logging.INFO):
+        """
+        :param capacity: Максимальное количество записей на тест
+        :param loggers: Имена логгеров, записи которых буферизуются
+        :param level: Минимальный уровень записей
+        """
+        self._current = None
+        self._queue = queue.Queue()
+        self._buffer = _RingBufferHandler(capacity)
+        self._listener = logging.handlers.QueueListener(self._queue, self._buffer)
+        self._handler = _TestQueueHandler(self._queue, lambda: self._current)
+        self._formatter = logging.Formatter(LOG_FORMAT, datefmt='%H:%M:%S')
+        self._loggers = [logging.getLogger(name) for name in loggers]
+        self._saved = []
+        for logger in self._loggers:
+            self._saved.append((logger, logger.propagate, logger.level))
+            logger.addHandler(self._handler)
+            logger.propagate = False
+            logger.setLevel(level)
+        self._listener.start()
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._current = nodeid
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self._current = None
+        self._queue.join()
+        self._buffer.pop(nodeid)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if not report.failed:
+            return
+        self._queue.join()
+        records, dropped = self._buffer.pop(item.nodeid)
+        if not records:
+            return
+        lines = [self._formatter.format(record) for record in records]
+        if dropped:
+            lines.insert(0, f"... пропущено ранних записей: {dropped}")
+        report.sections.append((f"Captured page log {report.when}", '\n'.join(lines)))
+
+    def pytest_unconfigure(self, config):
+        self._listener.stop()
+        for logger, propagate, level in self._saved:
+            logger.removeHandler(self._handler)
+            logger.propagate = propagate
+            logger.setLevel(level)
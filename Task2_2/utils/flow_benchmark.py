@@ -0,0 +1,243 @@
+import contextlib
+import glob
+import hashlib
+import json
+import logging
+import os
+import platform
+import statistics
+import time
+
+import selenium
+
+LOGGING = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+
+@contextlib.contextmanager
+def count_commands(driver):
+    """
+    Подсчет команд WebDriver внутри блока
+    :return: Список с одним элементом - количеством команд (заполняется по ходу блока)
+    """
+    executor = driver.command_executor
+    original = executor.execute
+    counter = [0]
+
+    def execute(command, params):
+        counter[0] += 1
+        return original(command, params)
+
+    executor.execute = execute
+    try:
+        yield counter
+    finally:
+        executor.execute = original
+
+
+def pages_fingerprint(pages_dir):
+    """
+    Хэш исходников page objects, с которыми снят замер
+    :param pages_dir: Каталог pages
+    """
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(pages_dir, '*.py'))):
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+class FlowResult:
+    """Замеры одного сценария за несколько прогонов"""
+
+    def __init__(self, name, wall_ms, commands, requests):
+        self.name = name
+        self.wall_ms = list(wall_ms)
+        self.commands = list(commands)
+        self.requests = list(requests)
+
+    def to_dict(self):
+        return {
+            'wall_ms': {
+                'median': round(statistics.median(self.wall_ms), 1),
+                'min': round(min(self.wall_ms), 1),
+                'max': round(max(self.wall_ms), 1),
+                'samples': [round(value, 1) for value in self.wall_ms],
+            },
+            'commands': int(statistics.median(self.commands)),
+            'requests': int(statistics.median(self.requests)),
+        }
+
+
+class FlowBenchmark:
+    """
+    Прогон сценариев на локальной заглушке и сравнение с сохраненным baseline.
+
+    Сценарий - объект с методами setup(stand_in) (подготовка данных, не замеряется)
+    и run(driver, base_url) (замеряется целиком, включая открытие дашборда).
+    run должен завершаться ожиданием простоя сети, чтобы число запросов не зависело от тайминга.
+    Перед каждым прогоном хранилище заглушки и состояние браузера сбрасываются,
+    первый прогон считается прогревом и в результат не попадает.
+
+    Baseline - JSON файл с версией схемы, отпечатком исходников pages/ и
+    окружением. Новые baseline сохраняются рядом с предыдущими, по умолчанию
+    сравнение идет с последним по имени файлом каталога baselines.
+    """
+
+    # Регрессия по времени засчитывается, только если медиана выросла больше чем на
+    # tolerance и при этом больше чем на MIN_REGRESSION_MS - ниже этого порога шум
+    MIN_REGRESSION_MS = 50
+    # Количество команд зависит от числа итераций опроса в ожиданиях, поэтому
+    # допускается такой же относительный разброс и небольшой абсолютный запас
+    COMMAND_SLACK = 2
+
+    def __init__(self, pages_dir, rounds=5, tolerance=0.2, baseline_path=None, warmup=1, recording=False):
+        """
+        :param pages_dir: Каталог pages (для отпечатка исходников)
+        :param rounds: Количество замеряемых прогонов каждого сценария
+        :param tolerance: Допустимое относительное ухудшение медианы времени и числа команд
+        :param baseline_path: Файл baseline для сравнения (None - без сравнения)
+        :param warmup: Количество прогревочных прогонов
+        :param recording: Прогон сохраняет новый baseline: сценарии без baseline не считаются ошибкой
+        """
+        self.pages_dir = pages_dir
+        self.rounds = rounds
+        self.tolerance = tolerance
+        self.warmup = warmup
+        self.recording = recording
+        self.baseline_path = baseline_path
+        self.baseline = self._load(baseline_path) if baseline_path else None
+        self.environment = {}
+        self.results = {}
+
+    @staticmethod
+    def latest_baseline(baselines_dir):
+        """
+        :return: Путь к последнему сохраненному baseline или None
+        """
+        paths = sorted(glob.glob(os.path.join(baselines_dir, '*.json')))
+        return paths[-1] if paths else None
+
+    def run(self, name, flow, driver, stand_in, base_url, reset_driver):
+        """
+        Прогон сценария
+        :param name: Имя сценария
+        :param flow: Сценарий с методами setup и run
+        :param driver: WebDriver
+        :param stand_in: StandInServer
+        :param base_url: URL дашборда
+        :param reset_driver: Функция сброса состояния браузера между прогонами
+        :return: FlowResult
+        """
+        if not self.environment:
+            self.environment = self._describe_environment(driver)
+
+        wall_ms, commands, requests = [], [], []
+        for round_number in range(self.warmup + self.rounds):
+            stand_in.store.reset()
+            reset_driver(driver)
+            flow.setup(stand_in)
+
+            requests_before = stand_in.request_count
+            with count_commands(driver) as counter:
+                start = time.perf_counter()
+                flow.run(driver, base_url)
+                elapsed = (time.perf_counter() - start) * 1000
+            requests_made = stand_in.request_count - requests_before
+
+            if round_number >= self.warmup:
+                wall_ms.append(elapsed)
+                commands.append(counter[0])
+                requests.append(requests_made)
+
+        result = self.results[name] = FlowResult(name, wall_ms, commands, requests)
+        LOGGING.info(f"Сценарий {name}: {result.to_dict()}")
+        return result
+
+    def check(self, result):
+        """
+        Сравнение результата сценария с baseline
+        :param result: FlowResult
+        :raises AssertionError: если сценарий стал медленнее или сравнивать не с чем
+        """
+        expected = self.baseline['flows'].get(result.name) if self.baseline is not None else None
+        if expected is None:
+            if self.baseline is None:
+                message = f"Baseline не найден, сценарий {result.name} не с чем сравнить"
+            else:
+                message = f"В baseline {self.baseline_path} нет сценария {result.name}"
+            if self.recording:
+                LOGGING.info(f"{message}, результат попадет в новый baseline")
+                return
+            LOGGING.error(message)
+            raise AssertionError(f"{message}: сохраните baseline с --benchmark-save")
+
+        actual = result.to_dict()
+        problems = []
+
+        if self._same_browser():
+            baseline_ms = expected['wall_ms']['median']
+            actual_ms = actual['wall_ms']['median']
+            if actual_ms > baseline_ms * (1 + self.tolerance) and actual_ms - baseline_ms > self.MIN_REGRESSION_MS:
+                problems.append(f"медиана времени {actual_ms} ms, в baseline {baseline_ms} ms")
+        else:
+            LOGGING.warning(f"Baseline снят на другом браузере ({self.baseline['environment'].get('browser')}), "
+                            f"время сценария {result.name} не сравнивается")
+
+        command_limit = expected['commands'] * (1 + self.tolerance) + self.COMMAND_SLACK
+        if actual['commands'] > command_limit:
+            problems.append(f"команд WebDriver {actual['commands']}, в baseline {expected['commands']}")
+        if actual['requests'] > expected['requests']:
+            problems.append(f"сетевых запросов {actual['requests']}, в baseline {expected['requests']}")
+
+        if problems:
+            message = (f"Сценарий {result.name} стал медленнее относительно {os.path.basename(self.baseline_path)} "
+                       f"(pages {self.baseline['pages_fingerprint']} -> {pages_fingerprint(self.pages_dir)}): "
+                       + "; ".join(problems))
+            LOGGING.error(message)
+            raise AssertionError(message)
+
+    def save(self, baselines_dir):
+        """
+        Сохранение результатов как нового baseline
+        :param baselines_dir: Каталог baseline
+        :return: Путь к сохраненному файлу
+        """
+        fingerprint = pages_fingerprint(self.pages_dir)
+        baseline = {
+            'schema_version': SCHEMA_VERSION,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'pages_fingerprint': fingerprint,
+            'rounds': self.rounds,
+            'environment': self.environment,
+            'flows': {name: result.to_dict() for name, result in sorted(self.results.items())},
+        }
+        os.makedirs(baselines_dir, exist_ok=True)
+        path = os.path.join(baselines_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{fingerprint}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        LOGGING.info(f"Baseline сохранен: {path}")
+        return path
+
+    def _load(self, path):
+        with open(path, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('schema_version') != SCHEMA_VERSION:
+            raise ValueError(f"Baseline {path} имеет версию схемы {baseline.get('schema_version')}, "
+                             f"ожидается {SCHEMA_VERSION}: сохраните baseline заново")
+        return baseline
+
+    def _same_browser(self):
+        return self.baseline['environment'].get('browser') == self.environment.get('browser')
+
+    @staticmethod
+    def _describe_environment(driver):
+        capabilities = getattr(driver, 'capabilities', {}) or {}
+        return {
+            'browser': f"{capabilities.get('browserName')} {capabilities.get('browserVersion')}",
+            'selenium': selenium.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        }
@@ -0,0 +1,129 @@
+import json
+import logging
+import os
+import statistics
+import threading
+
+LOGGING = logging.getLogger(__name__)
+
+# Замер стратегий прямо в странице: каждая стратегия выполняется repeat раз,
+# считается полное число совпадений (нужно для проверки уникальности)
+BENCHMARK_JS = """
+const [strategies, repeat] = arguments;
+const count = ([by, value]) => {
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+    }
+    return document.querySelectorAll(value).length;
+};
+return strategies.map(strategy => {
+    try {
+        let matches = 0;
+        const start = performance.now();
+        for (let i = 0; i < repeat; i++) {
+            matches = count(strategy);
+        }
+        return {matches, ms: (performance.now() - start) / repeat};
+    } catch (error) {
+        return {matches: 0, ms: null, error: error.message};
+    }
+});
+"""
+
+SUPPORTED_STRATEGIES = ('xpath', 'css selector')
+
+
+class LocatorBenchmark:
+    """
+    Сборщик замеров стратегий локаторов на живом DOM.
+
+    BasePage вызывает measure() после каждого успешного разрешения локатора, то есть
+    в момент, когда DOM находится в состоянии, для которого локатор написан. Все
+    стратегии локатора выполняются в странице одним execute_script, для каждой
+    запоминаются среднее время и число совпадений. В отчете для каждого локатора
+    указана самая быстрая стратегия, которая во всех замерах нашла ровно один элемент.
+    """
+
+    def __init__(self, repeat=50, max_samples=5):
+        """
+        :param repeat: Сколько раз выполнять стратегию в одном замере
+        :param max_samples: Сколько замеров делать для одного локатора за сессию
+        """
+        self.repeat = repeat
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._order = {}
+
+    def measure(self, driver, locator):
+        """
+        Замер всех стратегий локатора на текущем DOM
+        :param driver: WebDriver с открытой страницей
+        :param locator: Locator или кортеж (By, значение)
+        """
+        name = getattr(locator, 'name', None) or repr(tuple(locator))
+        # Порядок объявления, а не текущий: запасная стратегия могла быть уже поднята в начало
+        strategies = [tuple(strategy) for strategy in getattr(locator, 'declared', None) or [tuple(locator)]]
+        strategies = [strategy for strategy in strategies if strategy[0] in SUPPORTED_STRATEGIES]
+        if not strategies:
+            return
+        with self._lock:
+            samples = self._samples.setdefault(name, {})
+            self._order.setdefault(name, strategies)
+            if all(len(samples.get(strategy, ())) >= self.max_samples for strategy in strategies):
+                return
+
+        try:
+            results = driver.execute_script(BENCHMARK_JS, [list(strategy) for strategy in strategies], self.repeat)
+        except Exception as e:
+            LOGGING.warning(f"Не удалось замерить стратегии локатора {name}: {e}")
+            return
+
+        with self._lock:
+            for strategy, result in zip(strategies, results):
+                samples.setdefault(strategy, []).append(result)
+
+    def report(self):
+        """
+        Сводка замеров
+        :return: Словарь имя локатора -> стратегии с медианным временем и самая быстрая уникальная
+        """
+        report = {}
+        with self._lock:
+            for name, samples in sorted(self._samples.items()):
+                strategies = []
+                for by, value in self._order[name]:
+                    results = samples.get((by, value), [])
+                    timings = [result['ms'] for result in results if result.get('ms') is not None]
+                    matches = sorted({result['matches'] for result in results})
+                    strategies.append({
+                        'by': by,
+                        'value': value,
+                        'samples': len(results),
+                        'median_ms': round(statistics.median(timings), 4) if timings else None,
+                        'matches': matches,
+                        'unique': matches == [1],
+                    })
+
+                unique = [strategy for strategy in strategies if strategy['unique'] and strategy['median_ms'] is not None]
+                fastest = min(unique, key=lambda strategy: strategy['median_ms']) if unique else None
+                report[name] = {
+                    'strategies': strategies,
+                    'fastest_unique': {'by': fastest['by'], 'value': fastest['value']} if fastest else None,
+                    'declared_first_is_fastest': bool(strategies) and fastest is strategies[0],
+                }
+        return report
+
+    def write(self, path):
+        """
+        Сохранение отчета в JSON
+        :param path: Путь к файлу отчета
+        :return: Отчет
+        """
+        report = self.report()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
@@ -0,0 +1,377 @@
+import base64
+import json
+import logging
+import re
+import threading
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+
+from .network_capture import CaptureIndex, CapturedResponse
+
+LOGGING = logging.getLogger(__name__)
+
+
+class SeleniumWireBackend:
+    """
+    Наблюдение за сетью через MITM прокси selenium-wire.
+
+    Нужен там, где требуется подменять запросы или ответы, в остальных
+    случаях дешевле CdpBackend.
+    """
+
+    name = 'seleniumwire'
+
+    def __init__(self, capture_config, work_dir, proxy_port=0, asset_cache=None, network_mode='live'):
+        """
+        :param capture_config: CaptureConfig
+        :param work_dir: Каталог хранилища запросов selenium-wire
+        :param proxy_port: Порт прокси, 0 - любой свободный
+        :param asset_cache: AssetCache для статики фронтенда или None
+        :param network_mode: live, record или replay (кассеты API, см. use_cassette)
+        """
+        self.capture_config = capture_config
+        self.work_dir = work_dir
+        self.proxy_port = proxy_port
+        self.asset_cache = asset_cache
+        self.network_mode = network_mode
+
+    def create_driver(self, service, options):
+        """
+        Запускает Chrome за прокси selenium-wire и подключает индекс перехвата
+        :return: WebDriver с атрибутом capture_index
+        """
+        from seleniumwire import webdriver
+
+        seleniumwire_options = {
+            'suppress_connection_errors': True,
+            'request_storage_base_dir': str(self.work_dir),
+            **self.capture_config.seleniumwire_options(),
+        }
+        if self.proxy_port:
+            seleniumwire_options['port'] = self.proxy_port
+        if self.network_mode != 'live':
+            # CORS preflight тоже записывается и воспроизводится, иначе он уходит на бэкенд
+            seleniumwire_options['ignore_http_methods'] = []
+
+        driver = webdriver.Chrome(service=service, options=options, seleniumwire_options=seleniumwire_options)
+        driver.resource_policy = None
+        driver.cassette = None
+        self._attach_handlers(driver)
+        self._attach_capture_index(driver)
+        if self.asset_cache is not None:
+            driver.request_handlers.append(self.asset_cache.handle_request)
+            driver.response_handlers.insert(0, self.asset_cache.handle_response)
+        self._update_scopes(driver)
+        return driver
+
+    def apply_resource_policy(self, driver, policy):
+        """
+        Включает блокировку ресурсов: заблокированные запросы получают пустой ответ от прокси.
+        Пока политика задана, прокси перехватывает весь трафик, а не только scopes захвата.
+
+        :param driver: WebDriver, созданный этим бэкендом
+        :param policy: ResourcePolicy или None - без блокировки
+        """
+        if driver.resource_policy is policy:
+            return
+        driver.resource_policy = policy
+        self._update_scopes(driver)
+
+    def use_cassette(self, driver, cassette):
+        """
+        Кассета API для следующего теста: в режиме record обмены записываются в нее,
+        в режиме replay бэкенд отвечает из нее.
+
+        :param driver: WebDriver, созданный этим бэкендом
+        :param cassette: Cassette или None - живой бэкенд
+        """
+        driver.cassette = cassette
+
+    def _update_scopes(self, driver):
+        # Блокировке ресурсов и кэшу статики нужен весь трафик, а не только scopes захвата
+        if driver.resource_policy is not None or self.asset_cache is not None:
+            driver.scopes = []
+        else:
+            driver.scopes = self.capture_config.scopes
+
+    def _attach_handlers(self, driver):
+        """
+        Цепочки обработчиков в прокси.
+
+        Обработчик запроса получает (driver, request), первый обработчик, создавший
+        ответ через request.create_response(), завершает цепочку. Обработчики ответа
+        получают (driver, request, response) и вызываются все по порядку.
+        """
+        request_handlers = driver.request_handlers = [self._replay_cassette, self._block_resource]
+        response_handlers = driver.response_handlers = [self._record_cassette]
+
+        def request_interceptor(request):
+            for handler in request_handlers:
+                handler(driver, request)
+                if request.response is not None:
+                    return
+
+        def response_interceptor(request, response):
+            for handler in response_handlers:
+                handler(driver, request, response)
+
+        driver.request_interceptor = request_interceptor
+        driver.response_interceptor = response_interceptor
+
+    def _replay_cassette(self, driver, request):
+        if driver.cassette is not None:
+            driver.cassette.replay(driver, request)
+
+    def _record_cassette(self, driver, request, response):
+        if driver.cassette is not None:
+            driver.cassette.record(driver, request, response)
+
+    def _block_resource(self, driver, request):
+        policy = driver.resource_policy
+        if policy is None:
+            return
+        blocked, kind = policy.is_blocked(request.url, request.headers)
+        if blocked:
+            status_code, headers, body = policy.empty_response(kind)
+            request.create_response(status_code=status_code, headers=headers, body=body)
+
+    def _attach_capture_index(self, driver):
+        from seleniumwire.utils import decode
+
+        index = CaptureIndex(self.capture_config)
+        max_body_size = self.capture_config.max_body_size
+        scopes = [re.compile(scope) for scope in self.capture_config.scopes]
+
+        def capture(driver, request, response):
+            # Без scopes прокси (блокировка ресурсов, кэш статики) сюда приходит и трафик вне API
+            if scopes and not any(scope.match(request.url) for scope in scopes):
+                return
+            if not index.is_watched(request.method, request.url):
+                index.push(request.method, request.url, {}, b'',
+                           CapturedResponse(response.status_code, {}, b''))
+                return
+
+            body = response.body
+            encoding = response.headers.get('Content-Encoding', 'identity')
+            try:
+                body = decode(body, encoding)
+            except ValueError:
+                LOGGING.warning(f"Не удалось декодировать тело ответа {request.url} ({encoding})")
+
+            index.push(
+                request.method,
+                request.url,
+                dict(request.headers),
+                request.body,
+                CapturedResponse(response.status_code, dict(response.headers), body[:max_body_size])
+            )
+
+        driver.response_handlers.append(capture)
+        driver.capture_index = index
+
+
+class CdpBackend:
+    """
+    Наблюдение за сетью через события Chrome DevTools Protocol Network.*.
+
+    Браузер работает без прокси, события читаются из performance лога
+    chromedriver при ожидании в CaptureIndex. Тела ответов запрашиваются
+    через Network.getResponseBody только для индексируемых эндпоинтов.
+    """
+
+    name = 'cdp'
+
+    def __init__(self, capture_config, work_dir=None, proxy_port=0, asset_cache=None, network_mode='live'):
+        if asset_cache is not None:
+            raise ValueError("Кэш статики работает только через прокси, используйте --network-backend=seleniumwire")
+        if network_mode != 'live':
+            raise ValueError("Запись и воспроизведение API работают только через прокси, "
+                             "используйте --network-backend=seleniumwire")
+        self.capture_config = capture_config
+
+    def create_driver(self, service, options):
+        """
+        Запускает Chrome с включенным performance логом сети
+        :return: WebDriver с атрибутом capture_index
+        """
+        from selenium import webdriver
+
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+        driver = webdriver.Chrome(service=service, options=options)
+        index = CaptureIndex(self.capture_config)
+        index.pump = CdpNetworkListener(driver, index).attach().pump
+        driver.capture_index = index
+        driver.resource_policy = None
+        return driver
+
+    def apply_resource_policy(self, driver, policy):
+        """
+        Включает блокировку ресурсов через Network.setBlockedURLs. Chrome отклоняет
+        заблокированные запросы сразу, без обращения к сети; CDP блокирует только
+        по URL, см. ResourcePolicy.blocked_url_patterns().
+
+        :param driver: WebDriver, созданный этим бэкендом
+        :param policy: ResourcePolicy или None - без блокировки
+        """
+        if driver.resource_policy is policy:
+            return
+        patterns = policy.blocked_url_patterns() if policy is not None else []
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        driver.resource_policy = policy
+
+    def use_cassette(self, driver, cassette):
+        """Кассеты не поддерживаются, бэкенд всегда живой"""
+
+
+class CdpNetworkListener:
+    """
+    Собирает пары запрос/ответ из событий Network.* и передает их в CaptureIndex.
+
+    События разбираются при ожидании в индексе и перед каждой навигацией: после
+    смены документа Chrome уже не отдает тела ответов прежней страницы, поэтому
+    тела индексируемых эндпоинтов запрашиваются, пока событие loadingFinished
+    разбирается, и не позже следующего перехода. Запросы без завершения (прерванные
+    загрузки, long polling) хранятся не больше buffer_size, самые старые отбрасываются.
+    """
+
+    # Команды, после которых тела ответов текущей страницы могут стать недоступны
+    NAVIGATION_COMMANDS = frozenset({Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD,
+                                     Command.CLOSE, Command.QUIT})
+
+    def __init__(self, driver, index):
+        self.driver = driver
+        self.index = index
+        self._scopes = [re.compile(scope) for scope in index.config.scopes]
+        self._pending = {}
+        self._max_pending = index.config.buffer_size
+        self._lock = threading.Lock()
+
+    def attach(self):
+        """
+        Оборачивает command_executor.execute драйвера: перед навигацией накопившиеся события разбираются
+        :return: self
+        """
+        executor = self.driver.command_executor
+        original = executor.execute
+
+        def execute(command, params):
+            if command in self.NAVIGATION_COMMANDS:
+                try:
+                    self.pump()
+                except WebDriverException as e:
+                    LOGGING.warning(f"События сети перед {command} не разобраны: {e.msg}")
+            return original(command, params)
+
+        executor.execute = execute
+        return self
+
+    def pump(self):
+        """Разбирает накопившиеся события performance лога"""
+        with self._lock:
+            for entry in self.driver.get_log('performance'):
+                message = json.loads(entry['message'])['message']
+                handler = self._handlers.get(message.get('method'))
+                if handler:
+                    handler(self, message['params'])
+
+    def _in_scope(self, url):
+        return not self._scopes or any(scope.match(url) for scope in self._scopes)
+
+    def _on_request(self, params):
+        request = params['request']
+        if not self._in_scope(request['url']):
+            return
+        if len(self._pending) >= self._max_pending:
+            request_id = next(iter(self._pending))
+            dropped = self._pending.pop(request_id)
+            LOGGING.debug(f"Запрос без завершения отброшен: {dropped['method']} {dropped['url']}")
+        self._pending[params['requestId']] = {
+            'method': request['method'],
+            'url': request['url'],
+            'headers': request.get('headers', {}),
+            'body': request.get('postData'),
+            'has_body': request.get('hasPostData', False),
+            'response': None,
+        }
+
+    def _on_response(self, params):
+        pending = self._pending.get(params['requestId'])
+        if pending is not None:
+            pending['response'] = params['response']
+
+    def _on_finished(self, params):
+        pending = self._pending.pop(params['requestId'], None)
+        if pending is None or pending['response'] is None:
+            return
+
+        request_id = params['requestId']
+        status_code = pending['response']['status']
+        if not self.index.is_watched(pending['method'], pending['url']):
+            self.index.push(pending['method'], pending['url'], {}, b'', CapturedResponse(status_code, {}, b''))
+            return
+
+        request_body = pending['body']
+        if request_body is None and pending['has_body']:
+            request_body = self._execute('Network.getRequestPostData', request_id).get('postData')
+            if request_body is None:
+                LOGGING.warning(f"Тело запроса {pending['method']} {pending['url']} недоступно, "
+                                f"в индекс попадет пустое тело")
+
+        result = self._execute('Network.getResponseBody', request_id)
+        if 'body' not in result:
+            LOGGING.warning(f"Тело ответа {pending['method']} {pending['url']} недоступно (страница могла смениться "
+                            f"до разбора события), в индекс попадет пустое тело")
+        response_body = result.get('body', '')
+        if result.get('base64Encoded'):
+            response_body = base64.b64decode(response_body)
+        else:
+            response_body = response_body.encode('utf-8')
+
+        self.index.push(
+            pending['method'],
+            pending['url'],
+            pending['headers'],
+            request_body.encode('utf-8') if request_body is not None else b'',
+            CapturedResponse(
+                status_code,
+                pending['response'].get('headers', {}),
+                response_body[:self.index.config.max_body_size]
+            )
+        )
+
+    def _on_failed(self, params):
+        self._pending.pop(params['requestId'], None)
+
+    def _execute(self, command, request_id):
+        try:
+            return self.driver.execute_cdp_cmd(command, {'requestId': request_id})
+        except WebDriverException as e:
+            LOGGING.warning(f"{command} для запроса {request_id} не выполнен: {e.msg}")
+            return {}
+
+    _handlers = {
+        'Network.requestWillBeSent': _on_request,
+        'Network.responseReceived': _on_response,
+        'Network.loadingFinished': _on_finished,
+        'Network.loadingFailed': _on_failed,
+    }
+
+
+NETWORK_BACKENDS = {
+    CdpBackend.name: CdpBackend,
+    SeleniumWireBackend.name: SeleniumWireBackend,
+}
+
+
+def get_network_backend(name, capture_config, work_dir, proxy_port=0, asset_cache=None, network_mode='live'):
+    """
+    Создает бэкенд наблюдения за сетью по имени
+    :param name: 'cdp' или 'seleniumwire'
+    :param asset_cache: AssetCache (только seleniumwire)
+    :param network_mode: live, record или replay (record и replay только seleniumwire)
+    """
+    return NETWORK_BACKENDS[name](capture_config, work_dir, proxy_port, asset_cache, network_mode)
@@ -0,0 +1,205 @@
+import re
+import threading
+import time
+from collections import deque
+
+
+class CapturedResponse:
+    """Ответ, перехваченный из сети"""
+
+    def __init__(self, status_code, headers, body):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+
+class CapturedExchange:
+    """
+    Пара запрос/ответ, перехваченная из сети.
+
+    Повторяет поля запроса selenium-wire, которые используют page objects:
+    method, url, body и response (status_code, headers, body).
+    """
+
+    def __init__(self, seq, method, url, headers, body, response):
+        self.seq = seq
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.response = response
+
+    def __repr__(self):
+        status = self.response.status_code if self.response else None
+        return f"CapturedExchange(#{self.seq} {self.method} {self.url} -> {status})"
+
+
+class CaptureConfig:
+    """
+    Настройки перехвата трафика, собранные из API эндпоинтов page objects.
+
+    Прокси сохраняет только запросы в пределах scopes (префиксы API, например
+    /api/v1/), статика и сторонние скрипты проходят мимо хранилища. Обмены с
+    объявленными эндпоинтами индексируются целиком (тело ответа обрезается до
+    max_body_size), остальной трафик в scopes попадает в кольцевой буфер
+    размера buffer_size без тел.
+    """
+
+    def __init__(self, endpoints, scopes, max_body_size=1024 * 1024, buffer_size=200):
+        """
+        :param endpoints: Список (метод, подстрока URL)
+        :param scopes: Регулярные выражения URL для selenium-wire driver.scopes
+        :param max_body_size: Максимальный размер сохраняемого тела ответа в байтах
+        :param buffer_size: Размер кольцевого буфера и хранилища selenium-wire
+        """
+        self.endpoints = list(endpoints)
+        self.scopes = list(scopes)
+        self.max_body_size = max_body_size
+        self.buffer_size = buffer_size
+
+    @classmethod
+    def from_pages(cls, pages, **kwargs):
+        """
+        Собирает настройки из атрибута API_ENDPOINTS классов страниц
+        :param pages: Классы page objects
+        """
+        endpoints = []
+        for page in pages:
+            for endpoint in getattr(page, 'API_ENDPOINTS', ()):
+                if endpoint not in endpoints:
+                    endpoints.append(endpoint)
+
+        prefixes = sorted({'/'.join(path.split('/')[:3]) + '/' for _, path in endpoints})
+        scopes = [f".*{re.escape(prefix)}.*" for prefix in prefixes]
+        return cls(endpoints, scopes, **kwargs)
+
+    def seleniumwire_options(self):
+        """Опции хранилища selenium-wire: в памяти и не больше buffer_size запросов"""
+        return {
+            'request_storage': 'memory',
+            'request_storage_max_size': self.buffer_size,
+        }
+
+
+class CaptureIndex:
+    """
+    Индекс перехваченных запросов с ключом (метод, подстрока URL).
+
+    Бэкенд перехвата вызывает push() на каждый полученный ответ, а ожидающие
+    вызовы wait_for() просыпаются по условию, без опроса всей истории запросов.
+    Позиция в потоке задается курсором: wait_for() возвращает только обмены,
+    пришедшие после переданного курсора. Остальной трафик хранится в
+    кольцевом буфере фиксированного размера.
+
+    Бэкенды без собственного потока доставки событий (CDP) задают pump -
+    функцию, которая забирает накопившиеся события и вызывает push().
+    Индекс вызывает ее перед чтением курсора и во время ожидания.
+    """
+
+    PUMP_INTERVAL = 0.1
+
+    def __init__(self, config=None):
+        self.config = config or CaptureConfig([], [])
+        self.pump = None
+        self._condition = threading.Condition()
+        self._seq = 0
+        self._watched = {}
+        self._other = deque(maxlen=self.config.buffer_size)
+        for method, url_pattern in self.config.endpoints:
+            self.watch(method, url_pattern)
+
+    def watch(self, method, url_pattern):
+        """
+        Начинает индексировать запросы с указанным методом и подстрокой URL
+        :param method: HTTP метод
+        :param url_pattern: Подстрока URL
+        """
+        with self._condition:
+            self._watched.setdefault((method, url_pattern), deque(maxlen=self.config.buffer_size))
+
+    def is_watched(self, method, url):
+        """Проверяет, попадает ли запрос под один из индексируемых ключей"""
+        with self._condition:
+            return any(watched_method == method and url_pattern in url
+                       for watched_method, url_pattern in self._watched)
+
+    def cursor(self):
+        """
+        Текущая позиция в потоке перехваченных запросов
+        :return: Номер последнего перехваченного обмена
+        """
+        self._pump()
+        with self._condition:
+            return self._seq
+
+    def push(self, method, url, headers, body, response):
+        """
+        Добавляет перехваченный обмен в индекс
+        :return: CapturedExchange
+        """
+        with self._condition:
+            self._seq += 1
+            exchange = CapturedExchange(self._seq, method, url, headers, body, response)
+            matched = False
+            for (watched_method, url_pattern), exchanges in self._watched.items():
+                if watched_method == method and url_pattern in url:
+                    exchanges.append(exchange)
+                    matched = True
+            if not matched:
+                self._other.append(exchange)
+            self._condition.notify_all()
+            return exchange
+
+    def recent_other(self):
+        """
+        Последние обмены, не попавшие в индекс
+        :return: Список CapturedExchange без тел
+        """
+        with self._condition:
+            return list(self._other)
+
+    def wait_for(self, method, url_pattern, after=0, timeout=10):
+        """
+        Ожидание первого обмена по ключу, пришедшего после курсора
+        :param method: HTTP метод
+        :param url_pattern: Подстрока URL, ранее переданная в watch()
+        :param after: Курсор, полученный через cursor()
+        :param timeout: Время ожидания в секундах
+        :return: CapturedExchange или None, если за timeout ничего не пришло
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self._pump()
+            with self._condition:
+                exchanges = self._watched.setdefault((method, url_pattern), deque(maxlen=self.config.buffer_size))
+                for exchange in exchanges:
+                    if exchange.seq > after:
+                        return exchange
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._condition.wait(min(remaining, self.PUMP_INTERVAL) if self.pump else remaining)
+
+    def exchanges(self):
+        """
+        Все обмены в индексе и буфере
+        :return: Список CapturedExchange по порядку перехвата
+        """
+        self._pump()
+        with self._condition:
+            by_seq = {exchange.seq: exchange
+                      for exchanges in (*self._watched.values(), self._other) for exchange in exchanges}
+            return [by_seq[seq] for seq in sorted(by_seq)]
+
+    def clear(self):
+        """Очищает индекс, курсор продолжает расти"""
+        self._pump()
+        with self._condition:
+            for exchanges in self._watched.values():
+                exchanges.clear()
+            self._other.clear()
+
+    def _pump(self):
+        if self.pump is not None:
+            self.pump()
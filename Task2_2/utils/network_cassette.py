@@ -0,0 +1,202 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+LOGGING = logging.getLogger(__name__)
+
+NETWORK_MODES = ('live', 'record', 'replay')
+
+# Заголовки, которые не воспроизводятся: тело в кассете хранится раскодированным
+SKIPPED_HEADERS = {'connection', 'keep-alive', 'transfer-encoding', 'content-encoding', 'content-length', 'date'}
+
+CASSETTE_HEADER = 'X-Cassette'
+
+
+def cassette_path(cassette_dir, module_path, test_name):
+    """
+    Путь к кассете теста: <cassette_dir>/<имя модуля>/<имя теста>.har
+    :param cassette_dir: Каталог кассет
+    :param module_path: Путь к файлу теста
+    :param test_name: Имя теста с параметрами
+    """
+    name = re.sub(r'[^\w.\[\]-]+', '_', test_name)
+    if len(name) > 120:
+        name = f"{name[:100]}-{hashlib.sha1(test_name.encode('utf-8')).hexdigest()[:10]}"
+    module = os.path.splitext(os.path.basename(module_path))[0]
+    return os.path.join(cassette_dir, module, f"{name}.har")
+
+
+class Cassette:
+    """
+    Запись обменов теста с API в формате HAR.
+
+    В режиме record обработчик ответов прокси добавляет в кассету каждый обмен
+    в пределах scopes, в режиме replay обработчик запросов отвечает из кассеты,
+    не обращаясь к бэкенду. Запрос сопоставляется по методу, пути и query без
+    хоста, повторные запросы с тем же ключом получают записанные ответы по
+    порядку (список задач до и после создания), после последнего повторяется
+    последний ответ. Запросы без записи получают 404 и попадают в misses.
+
+    Кроме обменов кассета хранит названия задач, созданных фикстурами через API,
+    чтобы при воспроизведении фикстуры вернули те же данные без запросов.
+    """
+
+    def __init__(self, path, mode, scopes, entries=(), seeded=()):
+        """
+        :param path: Путь к файлу кассеты
+        :param mode: 'record' или 'replay'
+        :param scopes: Регулярные выражения URL API
+        :param entries: HAR записи
+        :param seeded: Названия задач, созданных фикстурами (списки по вызовам)
+        """
+        self.path = path
+        self.mode = mode
+        self.entries = list(entries)
+        self.seeded = [list(titles) for titles in seeded]
+        self.misses = []
+        self._scopes = [re.compile(scope) for scope in scopes]
+        self._lock = threading.Lock()
+        self._recorded = defaultdict(list)
+        self._played = defaultdict(int)
+        self._seed_calls = 0
+        for entry in self.entries:
+            self._recorded[self._key(entry['request']['method'], entry['request']['url'])].append(entry)
+
+    @classmethod
+    def load(cls, path, scopes):
+        """
+        Кассета для воспроизведения
+        :raises FileNotFoundError: если кассета не записана
+        """
+        with open(path, encoding='utf-8') as f:
+            log = json.load(f)['log']
+        return cls(path, 'replay', scopes, log['entries'], log.get('_seeded', ()))
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            log = {
+                'version': '1.2',
+                'creator': {'name': 'Task2_2', 'version': '1'},
+                'entries': self.entries,
+                '_seeded': self.seeded,
+            }
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'log': log}, f, ensure_ascii=False, indent=1)
+        LOGGING.info(f"Кассета записана: {self.path} ({len(self.entries)} обменов)")
+
+    # --- обработчики selenium-wire ---
+
+    def replay(self, driver, request):
+        """Обработчик запроса: ответ из кассеты"""
+        if self.mode != 'replay' or not self._in_scope(request.url):
+            return
+        key = self._key(request.method, request.url)
+        with self._lock:
+            recorded = self._recorded.get(key)
+            if recorded:
+                entry = recorded[min(self._played[key], len(recorded) - 1)]
+                self._played[key] += 1
+            else:
+                self.misses.append(f"{request.method} {request.url}")
+
+        if not recorded:
+            LOGGING.warning(f"Нет записи в кассете {self.path}: {request.method} {request.url}")
+            body = json.dumps({'message': 'not recorded'}).encode('utf-8')
+            request.create_response(status_code=404, body=body, headers={
+                'Content-Type': 'application/json', 'Content-Length': str(len(body)), CASSETTE_HEADER: 'miss'
+            })
+            return
+
+        response = entry['response']
+        body = self._decode_content(response['content'])
+        headers = {header['name']: header['value'] for header in response['headers']}
+        headers['Content-Length'] = str(len(body))
+        headers[CASSETTE_HEADER] = 'replay'
+        request.create_response(status_code=response['status'], headers=headers, body=body)
+
+    def record(self, driver, request, response):
+        """Обработчик ответа: запись обмена в кассету"""
+        from seleniumwire.utils import decode
+
+        if self.mode != 'record' or not self._in_scope(request.url):
+            return
+        body = response.body
+        encoding = response.headers.get('Content-Encoding', 'identity')
+        try:
+            body = decode(body, encoding)
+        except ValueError:
+            LOGGING.warning(f"Не удалось декодировать тело ответа {request.url} ({encoding})")
+
+        entry = {
+            'startedDateTime': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'request': {
+                'method': request.method,
+                'url': request.url,
+                'headers': self._har_headers(request.headers),
+            },
+            'response': {
+                'status': response.status_code,
+                'statusText': response.reason,
+                'headers': [header for header in self._har_headers(response.headers)
+                            if header['name'].lower() not in SKIPPED_HEADERS],
+                'content': self._encode_content(body, response.headers.get('Content-Type', '')),
+            },
+        }
+        if request.body:
+            entry['request']['postData'] = self._encode_content(request.body, request.headers.get('Content-Type', ''))
+
+        with self._lock:
+            self.entries.append(entry)
+            self._recorded[self._key(request.method, request.url)].append(entry)
+
+    # --- данные фикстур ---
+
+    def next_seed(self):
+        """Названия задач очередного вызова фикстуры при воспроизведении"""
+        with self._lock:
+            if self._seed_calls >= len(self.seeded):
+                raise AssertionError(f"В кассете {self.path} нет данных фикстуры, перезапишите ее")
+            titles = self.seeded[self._seed_calls]
+            self._seed_calls += 1
+            return list(titles)
+
+    def add_seed(self, titles):
+        with self._lock:
+            self.seeded.append(list(titles))
+
+    def _in_scope(self, url):
+        return any(scope.match(url) for scope in self._scopes)
+
+    @staticmethod
+    def _key(method, url):
+        parts = urlsplit(url)
+        return method, f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    @staticmethod
+    def _har_headers(headers):
+        return [{'name': name, 'value': value} for name, value in headers.items()]
+
+    @staticmethod
+    def _encode_content(body, mime_type):
+        content = {'size': len(body), 'mimeType': mime_type}
+        try:
+            content['text'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            content['text'] = base64.b64encode(body).decode('ascii')
+            content['encoding'] = 'base64'
+        return content
+
+    @staticmethod
+    def _decode_content(content):
+        text = content.get('text', '')
+        if content.get('encoding') == 'base64':
+            return base64.b64decode(text)
+        return text.encode('utf-8')
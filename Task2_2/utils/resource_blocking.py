@@ -0,0 +1,147 @@
+import logging
+import os
+import re
+from urllib.parse import urlsplit
+
+LOGGING = logging.getLogger(__name__)
+
+# Тип ресурса по заголовку Sec-Fetch-Dest, который Chrome отправляет с каждым запросом
+FETCH_DEST_TYPES = {
+    'document': 'document',
+    'iframe': 'document',
+    'script': 'script',
+    'style': 'stylesheet',
+    'image': 'image',
+    'font': 'font',
+    'audio': 'media',
+    'video': 'media',
+    'track': 'media',
+    'manifest': 'other',
+    'empty': 'xhr',
+}
+
+# Тип ресурса по расширению, если заголовка нет (и для паттернов Network.setBlockedURLs)
+EXTENSION_TYPES = {
+    'image': ('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'),
+    'font': ('woff', 'woff2', 'ttf', 'otf', 'eot'),
+    'media': ('mp4', 'webm', 'ogg', 'mp3', 'wav'),
+    'stylesheet': ('css',),
+    'script': ('js', 'mjs'),
+}
+
+CONTENT_TYPES = {
+    'script': 'application/javascript',
+    'stylesheet': 'text/css',
+    'document': 'text/html',
+}
+
+
+def resource_type(url, headers=None):
+    """
+    Тип ресурса запроса: document, script, stylesheet, image, font, media, xhr или other
+    :param url: URL запроса
+    :param headers: Заголовки запроса
+    """
+    destination = (headers or {}).get('Sec-Fetch-Dest')
+    if destination in FETCH_DEST_TYPES:
+        return FETCH_DEST_TYPES[destination]
+
+    extension = os.path.splitext(urlsplit(url).path)[1].lstrip('.').lower()
+    for kind, extensions in EXTENSION_TYPES.items():
+        if extension in extensions:
+            return kind
+    return 'other'
+
+
+class BlockRule:
+    """
+    Правило блокировки: действие allow/deny для типов ресурсов и (или) паттерна URL.
+    Паттерн URL поддерживает только '*' (любая подстрока), как Network.setBlockedURLs.
+    """
+
+    def __init__(self, action, resource_types=(), url_pattern=None):
+        """
+        :param action: 'allow' или 'deny'
+        :param resource_types: Типы ресурсов, пусто - любой тип
+        :param url_pattern: Паттерн URL, None - любой URL
+        """
+        if action not in ('allow', 'deny'):
+            raise ValueError(f"Неизвестное действие правила: {action}")
+        self.action = action
+        self.resource_types = tuple(resource_types)
+        self.url_pattern = url_pattern
+        self._url_regex = re.compile(
+            '^' + '.*'.join(re.escape(part) for part in url_pattern.split('*')) + '$'
+        ) if url_pattern else None
+
+    def matches(self, url, kind):
+        if self.resource_types and kind not in self.resource_types:
+            return False
+        return self._url_regex is None or bool(self._url_regex.match(url))
+
+    def __repr__(self):
+        return f"BlockRule({self.action}, {self.resource_types or '*'}, {self.url_pattern or '*'})"
+
+
+class ResourcePolicy:
+    """
+    Набор правил блокировки ресурсов. Применяется первое подходящее правило,
+    если ни одно не подошло - запрос пропускается.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+
+    def is_blocked(self, url, headers=None):
+        """
+        :param url: URL запроса
+        :param headers: Заголовки запроса
+        :return: (заблокирован ли запрос, тип ресурса)
+        """
+        kind = resource_type(url, headers)
+        for rule in self.rules:
+            if rule.matches(url, kind):
+                return rule.action == 'deny', kind
+        return False, kind
+
+    def blocked_url_patterns(self):
+        """
+        Паттерны для Network.setBlockedURLs.
+
+        CDP блокирует только по URL: правила по типу ресурса переводятся в паттерны
+        расширений, правила с паттерном URL берутся как есть (тип ресурса при этом не
+        учитывается), а allow правила не выражаются и пропускаются.
+        """
+        patterns = []
+        for rule in self.rules:
+            if rule.action != 'deny':
+                continue
+            if rule.url_pattern:
+                patterns.append(rule.url_pattern)
+                continue
+            for kind in rule.resource_types:
+                patterns.extend(f"*.{extension}*" for extension in EXTENSION_TYPES.get(kind, ()))
+        return patterns
+
+    def empty_response(self, kind):
+        """
+        Пустой ответ для заблокированного ресурса
+        :return: (status_code, headers, body)
+        """
+        headers = {'Content-Length': '0', 'Cache-Control': 'no-store'}
+        if kind in CONTENT_TYPES:
+            headers['Content-Type'] = CONTENT_TYPES[kind]
+        return 200, headers, b''
+
+
+# Тестам нужен только DOM приложения и его API: картинки, шрифты, медиа и сторонняя аналитика
+# не влияют на проверки
+DEFAULT_RESOURCE_POLICY = ResourcePolicy([
+    BlockRule('allow', url_pattern='*/api/v1/*'),
+    BlockRule('deny', resource_types=('image', 'font', 'media')),
+    BlockRule('deny', url_pattern='*google-analytics.com/*'),
+    BlockRule('deny', url_pattern='*googletagmanager.com/*'),
+    BlockRule('deny', url_pattern='*mc.yandex.ru/*'),
+    BlockRule('deny', url_pattern='*/_vercel/insights/*'),
+    BlockRule('deny', url_pattern='*/_vercel/speed-insights/*'),
+])
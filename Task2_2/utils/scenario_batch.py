@@ -0,0 +1,80 @@
+import logging
+
+LOGGING = logging.getLogger(__name__)
+
+
+class ScenarioBatcher:
+    """
+    Группы параметризованных случаев, которые идут подряд в одной живой странице.
+
+    Случаи одного теста попадают в одну группу, если у них одинаковый набор
+    фикстур, а из фикстур уровня function используются только BATCHABLE_FIXTURES
+    (браузер и его настройка) - данные, подготовленные для случая, не переживут
+    легкий сброс страницы. Внутри группы случаи идут подряд, после успешного
+    случая страница не перезагружается, следующий начинает с легкого сброса
+    приложения. Каждый случай остается отдельным результатом pytest.
+    """
+
+    BATCHABLE_FIXTURES = frozenset({'request', 'browser', 'driver', 'resource_policy', 'cassette'})
+
+    def __init__(self):
+        self._keys = {}
+        self._next_keys = {}
+
+    @classmethod
+    def batch_key(cls, item):
+        """
+        Ключ группы случая или None, если случай выполняется отдельно
+        :param item: pytest.Item
+        """
+        callspec = getattr(item, 'callspec', None)
+        if callspec is None or 'browser' not in item.fixturenames:
+            return None
+        fixture_defs = item._fixtureinfo.name2fixturedefs
+        for name in item.fixturenames:
+            if name in cls.BATCHABLE_FIXTURES or name in callspec.params:
+                continue
+            definitions = fixture_defs.get(name)
+            if definitions and definitions[-1].scope == 'function':
+                return None
+        return item.nodeid.split('[')[0], tuple(sorted(item.fixturenames))
+
+    def plan(self, items):
+        """
+        Ставит случаи одной группы подряд, сохраняя порядок групп и остальных тестов
+        :param items: Собранные тесты
+        :return: Переупорядоченный список
+        """
+        groups = {}
+        ordered = []
+        for item in items:
+            key = self.batch_key(item)
+            self._keys[item.nodeid] = key
+            if key is None:
+                ordered.append([item])
+            elif key in groups:
+                groups[key].append(item)
+            else:
+                groups[key] = [item]
+                ordered.append(groups[key])
+
+        planned = [item for group in ordered for item in group]
+        for item, next_item in zip(planned, planned[1:]):
+            self._next_keys[item.nodeid] = self._keys[next_item.nodeid]
+        batched = sum(len(group) for group in groups.values())
+        LOGGING.info(f"Групп сценариев: {len(groups)}, случаев в них: {batched}")
+        return planned
+
+    def key(self, item):
+        return self._keys.get(item.nodeid)
+
+    def keeps_page(self, item):
+        """
+        Оставлять ли страницу следующему случаю: он из той же группы, а этот прошел
+        :param item: pytest.Item
+        """
+        key = self._keys.get(item.nodeid)
+        if key is None or self._next_keys.get(item.nodeid) != key:
+            return False
+        report = getattr(item, 'rep_call', None)
+        return report is not None and report.passed
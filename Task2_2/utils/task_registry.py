@@ -0,0 +1,43 @@
+import logging
+import threading
+
+LOGGING = logging.getLogger(__name__)
+
+
+class CreatedTaskRegistry:
+    """
+    Задачи, созданные за сессию: через UI (ответы на создание, перехваченные
+    CreateTaskPage) и фикстурами через API. В конце сессии удаляются одним
+    массовым запросом, чтобы дашборд не рос от запуска к запуску.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = set()
+
+    def add(self, task_id):
+        with self._lock:
+            self._ids.add(task_id)
+
+    def ids(self):
+        with self._lock:
+            return sorted(self._ids)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._ids)
+
+    def cleanup(self, api_client):
+        """
+        Удаление всех зарегистрированных задач
+        :param api_client: TaskApiClient
+        :return: Количество удаленных задач
+        """
+        task_ids = self.ids()
+        if not task_ids:
+            return 0
+        deleted = api_client.delete_tasks(task_ids)
+        LOGGING.info(f"Удалено задач, созданных за сессию: {deleted} из {len(task_ids)}")
+        with self._lock:
+            self._ids.difference_update(task_ids)
+        return deleted